@@ -0,0 +1 @@
+"""Microbenchmarks of kafkaconnect."""
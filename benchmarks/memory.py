@@ -0,0 +1,173 @@
+"""Measure the peak memory of the topic discovery with many topics.
+
+Each representation of the topic names runs in a separate process, which
+lists the topics several times, like the cycles of the InfluxDB Sink
+auto update loop, and reports its peak resident set size (RSS)::
+
+    python -m benchmarks.memory --size 1000000 --output memory.json
+
+The ``set`` representation is the set based discovery used before the
+`~kafkaconnect.topic_store.TopicStore`, kept as a reference.
+"""
+
+__all__ = ["REPRESENTATIONS", "MemoryResult", "peak_rss", "measure", "main"]
+
+import argparse
+import json
+import re
+import resource
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from benchmarks.run import topic_names
+from kafkaconnect.metadata_cache import TopicMetadataCache
+
+Discover = Callable[[int, int], int]
+"""Discover topics for a number of cycles and return the topics found."""
+
+REPRESENTATIONS: Dict[str, Discover] = {}
+"""Topic discovery of each representation of the topic names."""
+
+SELECT_REGEX = r"lsst\.sal\..*"
+EXCLUDE_REGEX = r".*\.command_.*"
+
+
+def representation(name: str) -> Callable[[Discover], Discover]:
+    """Register a representation of the topic names."""
+
+    def decorator(discover: Discover) -> Discover:
+        REPRESENTATIONS[name] = discover
+        return discover
+
+    return decorator
+
+
+@representation("set")
+def discover_with_sets(size: int, cycles: int) -> int:
+    """Filter and compare the topic names with sets."""
+    select = re.compile(SELECT_REGEX)
+    exclude = re.compile(EXCLUDE_REGEX)
+
+    def filter_topics() -> set:
+        names = {t for t in set(topic_names(size)) if select.match(t)}
+        return names - {t for t in names if exclude.match(t)}
+
+    topics = filter_topics()
+    new_topics: List[str] = []
+    for _ in range(cycles):
+        current_topics = filter_topics()
+        new_topics = list(set(current_topics) - set(topics))
+        topics = current_topics
+    return len(topics) + len(new_topics)
+
+
+@representation("TopicStore")
+def discover_with_store(size: int, cycles: int) -> int:
+    """Filter and compare the topic names with the metadata cache."""
+    cache = TopicMetadataCache(lambda: topic_names(size), ttl=0)
+    cache.register("sink", SELECT_REGEX, EXCLUDE_REGEX)
+    topics = cache.topics("sink")
+    new_topics: List[str] = []
+    for _ in range(cycles):
+        current_topics = cache.topics("sink")
+        new_topics = current_topics.difference(topics)
+        topics = current_topics
+    return len(topics) + len(new_topics)
+
+
+def peak_rss() -> int:
+    """Return the peak resident set size of this process, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class MemoryResult:
+    """Peak memory of a representation."""
+
+    name: str
+    """Name of the representation."""
+
+    size: int
+    """Number of topic names."""
+
+    cycles: int
+    """Number of discovery cycles after the first one."""
+
+    baseline: int
+    """Peak RSS, in bytes, before the discovery."""
+
+    peak: int
+    """Peak RSS, in bytes, after the discovery."""
+
+
+def measure(name: str, size: int, cycles: int = 3) -> MemoryResult:
+    """Measure a representation in a new process."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.memory",
+            "--child",
+            name,
+            "--size",
+            str(size),
+            "--cycles",
+            str(cycles),
+        ],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return MemoryResult(**json.loads(output))
+
+
+def _child(name: str, size: int, cycles: int) -> None:
+    """Run a representation and print its result."""
+    baseline = peak_rss()
+    REPRESENTATIONS[name](size, cycles)
+    result = MemoryResult(name, size, cycles, baseline, peak_rss())
+    print(json.dumps(asdict(result)))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the memory benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Save the results to a JSON file.")
+    parser.add_argument(
+        "--representation",
+        action="append",
+        choices=sorted(REPRESENTATIONS),
+        help="Representation to measure, can be repeated. Default: all.",
+    )
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.size, args.cycles)
+        return 0
+
+    results = []
+    for name in args.representation or REPRESENTATIONS:
+        result = measure(name, args.size, args.cycles)
+        print(
+            f"{result.name:32} {result.size:>8} "
+            f"{result.peak / 2**20:10.1f} MiB peak RSS "
+            f"({(result.peak - result.baseline) / 2**20:.1f} MiB discovery)"
+        )
+        results.append(asdict(result))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""Run the kafkaconnect microbenchmarks.
+
+Each benchmark runs over a range of realistic sizes and reports the time
+per call. Results are saved as JSON and can be compared with a baseline
+file to catch performance regressions before a release::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.2
+
+The comparison exits with status 1 if the median time of any benchmark
+increases by more than the threshold.
+"""
+
+__all__ = ["BENCHMARKS", "Result", "measure", "run", "compare", "main"]
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import timeit
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from kafkaconnect.connect import Connect
+from kafkaconnect.influxdb_sink.config import InfluxConfig
+from kafkaconnect.topic_names_set import TopicNamesSet
+
+Setup = Callable[[int], Callable[[], Any]]
+"""Prepare a benchmark of a given size and return the function to time."""
+
+BENCHMARKS: Dict[str, Sequence[int]] = {}
+"""Sizes of each benchmark."""
+
+_SETUPS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str, sizes: Sequence[int]) -> Callable[[Setup], Setup]:
+    """Register a benchmark."""
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = sizes
+        _SETUPS[name] = setup
+        return setup
+
+    return decorator
+
+
+def topic_names(size: int) -> List[str]:
+    """Return topic names similar to the SAL topics."""
+    kinds = ("logevent", "command", "telemetry")
+    return [
+        f"lsst.sal.CSC{i % 50}.{kinds[i % 3]}_topic{i}" for i in range(size)
+    ]
+
+
+def influx_config() -> InfluxConfig:
+    """Return an InfluxDB Sink configuration with the CLI defaults."""
+    return InfluxConfig(
+        name="influxdb-sink",
+        connect_influx_url="http://localhost:8086",
+        connect_influx_db="mydb",
+        tasks_max=1,
+        connect_influx_username="-",
+        connect_influx_password="",
+        connect_influx_error_policy="THROW",
+        connect_influx_max_retries="10",
+        connect_influx_retry_interval="60000",
+        connect_progress_enabled=False,
+        tags="SALIndex",
+        remove_prefix="lsst.sal.",
+    )
+
+
+@benchmark("TopicNamesSet.filter_topics", (100, 1000, 10000, 100000))
+def bench_filter_topics(size: int) -> Callable[[], Any]:
+    """Select and exclude topics by regex."""
+    topics = TopicNamesSet(
+        topic_names(size),
+        select_regex=r"lsst\.sal\..*",
+        exclude_regex=r".*\.command_.*",
+    )
+    return topics.filter_topics
+
+
+@benchmark("InfluxConfig.update_config", (10, 100, 1000, 10000))
+def bench_update_config(size: int) -> Callable[[], Any]:
+    """Generate the KCQL queries."""
+    config = influx_config()
+    topics = set(topic_names(size))
+    return lambda: config.update_config(topics, "private_sndStamp")
+
+
+@benchmark("ConnectorConfig.asjson", (10, 100, 1000, 10000))
+def bench_asjson(size: int) -> Callable[[], Any]:
+    """Serialize the connector configuration."""
+    config = influx_config()
+    config.update_config(set(topic_names(size)), "private_sndStamp")
+    return config.asjson
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Return a fixed JSON body to every GET request."""
+
+    body = b"{}"
+
+    def do_GET(self) -> None:
+        """Send the response body."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Do not log requests."""
+
+
+class StubConnect:
+    """A local HTTP server standing in for the Connect API."""
+
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, content: Any) -> None:
+        """Set the response body."""
+        _StubHandler.body = json.dumps(content).encode()
+
+
+_stub: Optional[StubConnect] = None
+
+
+@benchmark("Connect._request", (1, 100, 1000))
+def bench_request(size: int) -> Callable[[], Any]:
+    """List the connectors, with ``size`` connectors in the response."""
+    global _stub
+    if _stub is None:
+        _stub = StubConnect()
+    _stub.respond(
+        {
+            f"connector{i}": {"status": {"connector": {"state": "RUNNING"}}}
+            for i in range(size)
+        }
+    )
+    connect = Connect(_stub.url)
+    return lambda: connect.list(expand=("status",))
+
+
+@dataclass
+class Result:
+    """Timing of a benchmark at a given size."""
+
+    name: str
+    size: int
+    number: int
+    """Number of calls per repeat."""
+
+    repeat: int
+    min: float
+    """Fastest time per call, in seconds."""
+
+    median: float
+    """Median time per call, in seconds."""
+
+
+def measure(
+    name: str,
+    size: int,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> Result:
+    """Time a function, with enough calls per repeat to last ``min_time``."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time and number < 10**6:
+        number *= 10
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return Result(
+        name, size, number, repeat, min(times), statistics.median(times)
+    )
+
+
+def run(
+    names: Optional[Sequence[str]] = None,
+    sizes: Optional[Sequence[int]] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> Iterator[Result]:
+    """Run the benchmarks.
+
+    Parameters
+    ----------
+    names : `Sequence`, optional
+        Benchmarks to run, all by default.
+    sizes : `Sequence`, optional
+        Sizes to run, overriding the sizes of each benchmark.
+    """
+    for name in names or BENCHMARKS:
+        for size in sizes or BENCHMARKS[name]:
+            func = _SETUPS[name](size)
+            yield measure(name, size, func, repeat, min_time)
+
+
+def compare(
+    results: Sequence[Dict[str, Any]],
+    baseline: Sequence[Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Return the regressions of the results relative to the baseline.
+
+    A regression is a median time per call more than ``threshold`` (as a
+    fraction) slower than the baseline for the same benchmark and size.
+    """
+    reference = {(r["name"], r["size"]): r["median"] for r in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get((result["name"], result["size"]))
+        if base and result["median"] > base * (1 + threshold):
+            regressions.append(
+                f"{result['name']} [{result['size']}]: "
+                f"{result['median'] / base:.2f}x slower than the baseline."
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Save the results to a JSON file.")
+    parser.add_argument("--compare", help="Baseline JSON file to compare.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown, as a fraction, reported as a regression.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Benchmark to run, can be repeated. Default: all.",
+    )
+    parser.add_argument(
+        "--size", action="append", type=int, help="Override the sizes."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = []
+    for result in run(args.benchmark, args.size, args.repeat, args.min_time):
+        print(
+            f"{result.name:32} {result.size:>8} "
+            f"{result.median * 1e6:12.1f} us/call"
+        )
+        results.append(asdict(result))
+
+    report = {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,19 +2,27 @@
 
 __all__ = ["__version__", "metadata"]
 
-import sys
-
-if sys.version_info < (3, 8):
-    from importlib_metadata import PackageNotFoundError, version
-else:
-    from importlib.metadata import PackageNotFoundError, version
-
+from typing import Any
 
 __version__: str
 """The application version string of (PEP 440 / SemVer compatible)."""
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:
-    # package is not installed
-    __version__ = "0.0.0"
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` on first access.
+
+    Reading the package metadata is slow, so it is deferred until the
+    version is actually needed instead of running on every CLI startup.
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    global __version__
+    try:
+        __version__ = version(__name__)
+    except PackageNotFoundError:
+        # package is not installed
+        __version__ = "0.0.0"
+    return __version__
@@ -0,0 +1,80 @@
+"""Persist the last applied connector configuration.
+
+Long-running commands save a fingerprint of the last configuration they
+applied to a small JSON state file. After a restart, the
+saved state is compared with the desired and live configurations to skip
+the validation and the upload when nothing changed, which would otherwise
+restart the connector tasks.
+"""
+
+__all__ = ["AppliedState", "fingerprint"]
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Mapping, Optional, Type, TypeVar
+
+from kafkaconnect.apply.plan import normalize_config
+
+T = TypeVar("T", bound="AppliedState")
+
+
+def fingerprint(config: Mapping[str, Any]) -> str:
+    """Return a fingerprint of a connector configuration.
+
+    Values are normalized to strings like the Connect API does, so the
+    fingerprint of a configuration file matches the one of the live
+    configuration.
+    """
+    normalized = json.dumps(normalize_config(config), sort_keys=True)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+@dataclass
+class AppliedState:
+    """The last configuration applied to a connector."""
+
+    name: str
+    """Name of the connector."""
+
+    fingerprint: str
+    """Fingerprint of the applied configuration, topics included."""
+
+    @classmethod
+    def load(cls: Type[T], path: Path) -> Optional[T]:
+        """Load the state, `None` if the file is missing or invalid."""
+        try:
+            return cls(**json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Save the state, replacing the file atomically."""
+        directory = path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+    def matches(
+        self, name: str, config: Mapping[str, Any], live: Optional[Any]
+    ) -> bool:
+        """Whether the state, the desired and the live configs all match.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the connector.
+        config : `dict`
+            The desired configuration.
+        live : `dict`, optional
+            The live configuration returned by the Connect API, `None` if
+            the connector does not exist.
+        """
+        if not isinstance(live, dict) or self.name != name:
+            return False
+        return self.fingerprint == fingerprint(config) == fingerprint(live)
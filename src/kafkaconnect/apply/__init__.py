@@ -0,0 +1 @@
+"""Declarative management of connector configurations."""
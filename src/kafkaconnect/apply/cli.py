@@ -0,0 +1,111 @@
+"""CLI to apply a directory of connector configurations."""
+
+__all__ = ["apply", "run_plan"]
+
+from pathlib import Path
+
+import click
+
+from kafkaconnect.apply.executor import execute_actions, validate_actions
+from kafkaconnect.apply.plan import Plan, load_configs, make_plan
+from kafkaconnect.connect import Connect, ConnectError
+from kafkaconnect.snapshot import ConnectSnapshot
+
+
+def run_plan(
+    connect: Connect, plan: Plan, concurrency: int, dry_run: bool = False
+) -> int:
+    """Show the plan, then validate and execute its changes concurrently.
+
+    Raises
+    ------
+    click.ClickException
+        If a configuration is invalid or a change fails.
+    """
+    click.echo(plan.format())
+    if not plan.changes:
+        return 0
+
+    validations = validate_actions(connect, plan.changes, concurrency)
+    failed = [r for r in validations if not r.ok]
+    for result in failed:
+        click.echo(f"Validation error in {result}")
+    if failed:
+        raise click.ClickException(
+            f"Validation failed for {len(failed)} connector(s)."
+        )
+    if dry_run:
+        return 0
+
+    results = execute_actions(connect, plan.changes, concurrency)
+    for result in results:
+        click.echo(str(result))
+    failed = [r for r in results if not r.ok]
+    if failed:
+        raise click.ClickException(
+            f"Failed to apply {len(failed)} of {len(results)} change(s)."
+        )
+    return 0
+
+
+@click.command("apply")
+@click.argument(
+    "directory",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+@click.option(
+    "--prune",
+    is_flag=True,
+    help=(
+        "Delete connectors that are not defined in the configuration files."
+    ),
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Validate the configurations and show the plan without applying.",
+)
+@click.option(
+    "--concurrency",
+    "concurrency",
+    envvar="KAFKA_CONNECT_CONCURRENCY",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum number of concurrent requests to the Connect API. "
+        "Alternatively set via the $KAFKA_CONNECT_CONCURRENCY env var."
+    ),
+)
+@click.pass_context
+def apply(
+    ctx: click.Context,
+    directory: Path,
+    prune: bool,
+    dry_run: bool,
+    concurrency: int,
+) -> int:
+    """Apply the connector configurations in a directory.
+
+    Each ``*.json`` file in DIRECTORY is a connector configuration. The
+    configurations are compared with the connectors in the Connect cluster,
+    and only the connectors that are new or changed are validated and
+    created or updated. Use ``--prune`` to delete the connectors that are
+    not defined in DIRECTORY.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+
+    try:
+        desired = load_configs(directory)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    try:
+        snapshot = ConnectSnapshot.from_connect(
+            connect, expand=("info",), max_workers=concurrency
+        )
+    except ConnectError as e:
+        raise click.ClickException(str(e))
+
+    plan = make_plan(desired, snapshot.configs, prune=prune)
+    return run_plan(connect, plan, concurrency, dry_run=dry_run)
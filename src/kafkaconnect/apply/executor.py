@@ -0,0 +1,104 @@
+"""Validate and execute planned actions concurrently."""
+
+__all__ = [
+    "Result",
+    "validate_action",
+    "execute_action",
+    "validate_actions",
+    "execute_actions",
+]
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from kafkaconnect.apply.plan import Action, ActionKind
+from kafkaconnect.connect import Connect
+
+
+@dataclass
+class Result:
+    """The outcome of validating or executing an action."""
+
+    action: Action
+    """The action."""
+
+    ok: bool
+    """Whether the action succeeded."""
+
+    message: str
+    """Summary of the outcome, or the Connect API error message."""
+
+    def __str__(self) -> str:
+        """Format the result for display."""
+        status = "ok" if self.ok else "failed"
+        return f"{self.action.name}: {status}, {self.message}"
+
+
+def validate_action(connect: Connect, action: Action) -> Result:
+    """Validate the configuration of an action."""
+    assert action.config is not None
+    validation = connect.validate(
+        name=action.config["connector.class"],
+        connect_config=json.dumps(action.config),
+    )
+    try:
+        content = json.loads(validation)
+        error_count = content["error_count"]
+    except Exception:
+        return Result(action, False, validation)
+    if error_count > 0:
+        errors = [
+            f"{c['value']['name']}: {'; '.join(c['value']['errors'])}"
+            for c in content["configs"]
+            if c["value"]["errors"]
+        ]
+        return Result(action, False, " | ".join(errors))
+    return Result(action, True, "valid configuration")
+
+
+def execute_action(connect: Connect, action: Action) -> Result:
+    """Create, update or delete a connector."""
+    if action.kind == ActionKind.DELETE:
+        response = connect.remove(action.name)
+        # An empty response means the connector was deleted
+        return Result(action, response == "", response or "deleted")
+
+    assert action.config is not None
+    response = connect.create_or_update(
+        name=action.name, connect_config=json.dumps(action.config)
+    )
+    try:
+        name = json.loads(response)["name"]
+    except Exception:
+        return Result(action, False, response)
+    return Result(action, name == action.name, f"{action.kind.name.lower()}d")
+
+
+def validate_actions(
+    connect: Connect, actions: Sequence[Action], max_workers: int = 8
+) -> List[Result]:
+    """Validate the configuration of the actions concurrently.
+
+    Deletions are not validated.
+    """
+    actions = [a for a in actions if a.kind != ActionKind.DELETE]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda a: validate_action(connect, a), actions)
+        )
+
+
+def execute_actions(
+    connect: Connect, actions: Sequence[Action], max_workers: int = 8
+) -> List[Result]:
+    """Execute the actions concurrently.
+
+    At most ``max_workers`` requests are sent to the Connect API at a time.
+    """
+    actions = [a for a in actions if a.kind != ActionKind.UNCHANGED]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda a: execute_action(connect, a), actions)
+        )
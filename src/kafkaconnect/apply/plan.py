@@ -0,0 +1,165 @@
+"""Plan the changes needed to apply a set of connector configurations."""
+
+__all__ = [
+    "ActionKind",
+    "Action",
+    "Plan",
+    "load_configs",
+    "normalize_config",
+    "diff_config",
+    "make_plan",
+]
+
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+
+class ActionKind(Enum):
+    """Actions that can be planned for a connector."""
+
+    CREATE = "+"
+    UPDATE = "~"
+    DELETE = "-"
+    UNCHANGED = "="
+
+
+@dataclass
+class Action:
+    """A planned action for a connector."""
+
+    name: str
+    """Name of the connector."""
+
+    kind: ActionKind
+    """The action to take."""
+
+    config: Optional[Dict[str, Any]] = None
+    """The desired connector configuration, `None` for deletions."""
+
+    changed_keys: List[str] = field(default_factory=list)
+    """Configuration keys that differ from the live configuration."""
+
+    def __str__(self) -> str:
+        """Format the action for display."""
+        line = f"{self.kind.value} {self.name} ({self.kind.name.lower()})"
+        if self.changed_keys:
+            line += f": {', '.join(self.changed_keys)}"
+        return line
+
+
+@dataclass
+class Plan:
+    """The set of actions needed to reach the desired state."""
+
+    actions: List[Action] = field(default_factory=list)
+
+    def by_kind(self, kind: ActionKind) -> List[Action]:
+        """Return the actions of a given kind."""
+        return [a for a in self.actions if a.kind == kind]
+
+    @property
+    def changes(self) -> List[Action]:
+        """Return the actions that change the Connect cluster."""
+        return [a for a in self.actions if a.kind != ActionKind.UNCHANGED]
+
+    def format(self) -> str:
+        """Format the plan for display."""
+        lines = [str(a) for a in self.actions]
+        lines.append(
+            f"Plan: {len(self.by_kind(ActionKind.CREATE))} to create, "
+            f"{len(self.by_kind(ActionKind.UPDATE))} to update, "
+            f"{len(self.by_kind(ActionKind.DELETE))} to delete, "
+            f"{len(self.by_kind(ActionKind.UNCHANGED))} unchanged."
+        )
+        return "\n".join(lines)
+
+
+def load_configs(directory: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the connector configurations from a directory.
+
+    Every ``*.json`` file in the directory tree is a connector
+    configuration. The connector name is taken from the ``name`` property
+    or, if missing, from the file name.
+
+    Raises
+    ------
+    ValueError
+        If a configuration has no ``connector.class`` or if two files
+        define the same connector.
+    """
+    configs: Dict[str, Dict[str, Any]] = {}
+    files: Dict[str, Path] = {}
+    for path in sorted(directory.rglob("*.json")):
+        with open(path) as f:
+            config = json.load(f)
+        if "connector.class" not in config:
+            raise ValueError(f"{path} has no 'connector.class' property.")
+        name = config.setdefault("name", path.stem)
+        if name in configs:
+            raise ValueError(
+                f"Connector {name} is defined in {files[name]} and {path}."
+            )
+        configs[name] = config
+        files[name] = path
+    return configs
+
+
+def normalize_config(config: Mapping[str, Any]) -> Dict[str, str]:
+    """Convert configuration values to strings.
+
+    The Connect API returns every configuration value as a string, while
+    configuration files can use JSON numbers and booleans.
+    """
+    normalized = {}
+    for key, value in config.items():
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif value is None:
+            value = ""
+        normalized[key] = str(value)
+    return normalized
+
+
+def diff_config(
+    desired: Mapping[str, Any], live: Mapping[str, Any]
+) -> List[str]:
+    """Return the sorted configuration keys that differ."""
+    desired = normalize_config(desired)
+    live = normalize_config(live)
+    keys = desired.keys() | live.keys()
+    return sorted(k for k in keys if desired.get(k) != live.get(k))
+
+
+def make_plan(
+    desired: Mapping[str, Dict[str, Any]],
+    live: Mapping[str, Optional[Dict[str, Any]]],
+    prune: bool = False,
+) -> Plan:
+    """Compare the desired and the live connector configurations.
+
+    Parameters
+    ----------
+    desired : `dict`
+        Mapping of connector names to the desired configuration.
+    live : `dict`
+        Mapping of connector names to the live configuration.
+    prune : `bool`
+        Whether to delete live connectors missing from ``desired``.
+    """
+    plan = Plan()
+    for name in sorted(desired):
+        config = desired[name]
+        live_config = live.get(name)
+        if live_config is None:
+            plan.actions.append(Action(name, ActionKind.CREATE, config))
+            continue
+        changed_keys = diff_config(config, live_config)
+        kind = ActionKind.UPDATE if changed_keys else ActionKind.UNCHANGED
+        plan.actions.append(Action(name, kind, config, changed_keys))
+    if prune:
+        for name in sorted(set(live) - set(desired)):
+            plan.actions.append(Action(name, ActionKind.DELETE))
+    return plan
@@ -0,0 +1 @@
+"""Backup and restore of the connector configurations."""
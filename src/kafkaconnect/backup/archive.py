@@ -0,0 +1,114 @@
+"""Archive file with the state of the connectors."""
+
+__all__ = ["ARCHIVE_VERSION", "ConnectorBackup", "Archive"]
+
+import gzip
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Type, TypeVar, cast
+
+ARCHIVE_VERSION = 1
+"""Version of the archive format."""
+
+T = TypeVar("T", bound="Archive")
+
+
+@dataclass
+class ConnectorBackup:
+    """The state of a connector."""
+
+    config: Dict[str, str]
+    """Connector configuration."""
+
+    status: Optional[Dict[str, Any]] = None
+    """Connector and tasks status, if exported."""
+
+    offsets: Optional[Dict[str, Any]] = None
+    """Connector offsets, if exported."""
+
+
+@dataclass
+class Archive:
+    """The state of all connectors in a Connect cluster.
+
+    Archives are JSON files, compressed with gzip if the file name ends with
+    ``.gz``.
+    """
+
+    connect_url: str
+    """The Kafka Connect URL the connectors were exported from."""
+
+    connectors: Dict[str, ConnectorBackup] = field(default_factory=dict)
+    """Mapping of connector names to their state."""
+
+    created: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+    """Time of the export, in ISO 8601 format."""
+
+    version: int = ARCHIVE_VERSION
+    """Version of the archive format."""
+
+    @staticmethod
+    def _open(path: Path, mode: str) -> IO[str]:
+        if path.suffix == ".gz":
+            return cast(IO[str], gzip.open(path, mode + "t"))
+        return open(path, mode)
+
+    def save(self, path: Path) -> None:
+        """Write the archive to a file."""
+        with self._open(path, "w") as f:
+            json.dump(asdict(self), f, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls: Type[T], path: Path) -> T:
+        """Read the archive from a file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not an archive, if a property is missing or if
+            the archive version is not supported.
+        """
+        try:
+            with cls._open(path, "r") as f:
+                content = json.load(f)
+        except (OSError, EOFError, ValueError) as e:
+            raise ValueError(f"Could not read the archive {path}: {e}")
+        if not isinstance(content, dict):
+            raise ValueError(f"{path} is not an archive.")
+        version = content.get("version")
+        if version != ARCHIVE_VERSION:
+            raise ValueError(
+                f"Unsupported archive version {version}, "
+                f"expected {ARCHIVE_VERSION}."
+            )
+        missing = [
+            key for key in ("connect_url", "connectors") if key not in content
+        ]
+        if missing:
+            raise ValueError(
+                f"The archive {path} has no {', '.join(missing)} property."
+            )
+        if not isinstance(content["connectors"], dict):
+            raise ValueError(f"The connectors in {path} are not a mapping.")
+        connectors = {}
+        for name, backup in content["connectors"].items():
+            if not isinstance(backup, dict) or "config" not in backup:
+                raise ValueError(
+                    f"Connector {name} in the archive {path} has no "
+                    "configuration."
+                )
+            try:
+                connectors[name] = ConnectorBackup(**backup)
+            except TypeError as e:
+                raise ValueError(
+                    f"Invalid connector {name} in the archive {path}: {e}"
+                )
+        content["connectors"] = connectors
+        try:
+            return cls(**content)
+        except TypeError as e:
+            raise ValueError(f"Invalid archive {path}: {e}")
@@ -0,0 +1,144 @@
+"""CLI to export and import the connector configurations."""
+
+__all__ = ["export_connectors", "import_connectors"]
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import click
+
+from kafkaconnect.apply.cli import run_plan
+from kafkaconnect.apply.plan import make_plan
+from kafkaconnect.backup.archive import Archive, ConnectorBackup
+from kafkaconnect.connect import Connect, ConnectError
+from kafkaconnect.snapshot import ConnectSnapshot
+
+concurrency_option = click.option(
+    "--concurrency",
+    "concurrency",
+    envvar="KAFKA_CONNECT_CONCURRENCY",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum number of concurrent requests to the Connect API. "
+        "Alternatively set via the $KAFKA_CONNECT_CONCURRENCY env var."
+    ),
+)
+
+
+@click.command("export")
+@click.argument("archive", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--with-status",
+    "with_status",
+    is_flag=True,
+    help="Include the connector and tasks status in the archive.",
+)
+@click.option(
+    "--with-offsets",
+    "with_offsets",
+    is_flag=True,
+    help=(
+        "Include the connector offsets in the archive. Requires Kafka "
+        "Connect 3.5 or later."
+    ),
+)
+@concurrency_option
+@click.pass_context
+def export_connectors(
+    ctx: click.Context,
+    archive: Path,
+    with_status: bool,
+    with_offsets: bool,
+    concurrency: int,
+) -> int:
+    """Export the state of all connectors to an ARCHIVE file.
+
+    The archive is a JSON file, compressed with gzip if ARCHIVE ends with
+    ``.gz``.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+
+    expand = ("info", "status") if with_status else ("info",)
+    try:
+        snapshot = ConnectSnapshot.from_connect(connect, expand, concurrency)
+    except ConnectError as e:
+        raise click.ClickException(str(e))
+
+    offsets: Dict[str, Optional[Dict[str, Any]]] = {}
+    if with_offsets:
+
+        def fetch_offsets(name: str) -> Optional[Dict[str, Any]]:
+            content = connect.offsets(name)
+            try:
+                return json.loads(content)
+            except ValueError:
+                click.echo(f"Could not export {name} offsets: {content}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            names = snapshot.names
+            offsets = dict(zip(names, executor.map(fetch_offsets, names)))
+
+    backup = Archive(connect_url=config.connect_url)
+    for name, state in snapshot.connectors.items():
+        assert state.config is not None
+        backup.connectors[name] = ConnectorBackup(
+            config=state.config,
+            status=state.status,
+            offsets=offsets.get(name),
+        )
+    backup.save(archive)
+    click.echo(f"Exported {len(backup.connectors)} connector(s) to {archive}.")
+    return 0
+
+
+@click.command("import")
+@click.argument(
+    "archive", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--prune",
+    is_flag=True,
+    help="Delete connectors that are not in the archive.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Validate the configurations and show the plan without importing.",
+)
+@concurrency_option
+@click.pass_context
+def import_connectors(
+    ctx: click.Context,
+    archive: Path,
+    prune: bool,
+    dry_run: bool,
+    concurrency: int,
+) -> int:
+    """Import the connector configurations from an ARCHIVE file.
+
+    Connectors whose configuration already matches the archive are
+    skipped, the others are validated and created or updated concurrently.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+
+    try:
+        backup = Archive.load(archive)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    try:
+        snapshot = ConnectSnapshot.from_connect(
+            connect, expand=("info",), max_workers=concurrency
+        )
+    except ConnectError as e:
+        raise click.ClickException(str(e))
+
+    desired = {name: c.config for name, c in backup.connectors.items()}
+    plan = make_plan(desired, snapshot.configs, prune=prune)
+    return run_plan(connect, plan, concurrency, dry_run=dry_run)
@@ -0,0 +1,54 @@
+"""Send a request for many connectors concurrently."""
+
+__all__ = ["bulk_request", "response_error"]
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence
+
+
+def response_error(content: str) -> Optional[str]:
+    """Return the error message of a `Connect` response, if any.
+
+    `Connect` returns a plain error message for some failed requests, and
+    the JSON error body, with an ``error_code``, for the others.
+    """
+    if not content:
+        return None
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return content
+    if isinstance(body, dict) and "error_code" in body:
+        return str(body.get("message", content))
+    return None
+
+
+def bulk_request(
+    request: Callable[[str], str], names: Sequence[str], max_workers: int = 8
+) -> Dict[str, str]:
+    """Call a `Connect` method for each connector concurrently.
+
+    Parameters
+    ----------
+    request : `Callable`
+        The `Connect` method, called with the connector name.
+    names : `Sequence`
+        Names of the connectors.
+    max_workers : `int`
+        Maximum number of concurrent requests.
+
+    Returns
+    -------
+    errors : `dict`
+        The error message of each failed request, see `response_error`.
+    """
+    if not names:
+        return {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as ex:
+        for name, content in zip(names, ex.map(request, names)):
+            error = response_error(content)
+            if error:
+                errors[name] = error
+    return errors
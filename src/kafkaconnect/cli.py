@@ -16,23 +16,118 @@ __all__ = (
     "create",
 )
 
+import importlib
 import json
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import click
 
 from kafkaconnect.config import Config
-from kafkaconnect.connect import Connect
-from kafkaconnect.influxdb_sink.cli import create_influxdb_sink
-from kafkaconnect.jdbc_sink.cli import create_jdbc_sink
-from kafkaconnect.mirrormaker2.cli import create_mirrormaker2
-from kafkaconnect.s3_sink.cli import create_s3_sink
+from kafkaconnect.connect import Connect, ConnectError, OutputFormat
+from kafkaconnect.options import offline_option
+from kafkaconnect.selector import Selector, selector_options
 
 # Add -h as a help shortcut option
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+class LazyGroup(click.Group):
+    """A click group that imports its subcommands on demand.
+
+    Subcommands are registered by import path, for example
+    ``"kafkaconnect.s3_sink.cli.create_s3_sink"``, and the module is only
+    imported when the subcommand is invoked or when its help is requested.
+    This keeps heavy dependencies such as ``confluent_kafka`` out of the
+    startup path of commands that do not need them.
+
+    Parameters
+    ----------
+    lazy_subcommands : `dict`
+        Mapping of subcommand names to the import path of the command.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Return the eager and lazy subcommand names, sorted."""
+        base = super().list_commands(ctx)
+        return sorted(base + [*self.lazy_subcommands])
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Return the subcommand, importing it first if needed."""
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        """Import the module that defines the subcommand."""
+        module_name, command_name = self.lazy_subcommands[cmd_name].rsplit(
+            ".", 1
+        )
+        module = importlib.import_module(module_name)
+        command = getattr(module, command_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {cmd_name} failed, {command_name} is not "
+                f"a click command."
+            )
+        return command
+
+
+class MainGroup(LazyGroup):
+    """The main command group, with the global ``--profile`` option.
+
+    Profiling starts when the group is invoked, before the subcommand is
+    resolved, so that the lazy import of the subcommand module is included
+    in the profile.
+    """
+
+    def invoke(self, ctx: click.Context) -> Any:
+        """Invoke the group, profiling it if requested."""
+        path = ctx.params.get("profile")
+        if not path:
+            return super().invoke(ctx)
+        from kafkaconnect.profiling import Profiler
+
+        profiler = Profiler(
+            path, ctx.params["profile_top"], ctx.params["profile_every"]
+        )
+        profiler.start()
+        try:
+            return super().invoke(ctx)
+        finally:
+            click.echo(profiler.stop(), err=True)
+
+
+@click.group(
+    cls=MainGroup,
+    context_settings=CONTEXT_SETTINGS,
+    lazy_subcommands={
+        "apply": "kafkaconnect.apply.cli.apply",
+        "daemon": "kafkaconnect.daemon.cli.daemon",
+        "export": "kafkaconnect.backup.cli.export_connectors",
+        "import": "kafkaconnect.backup.cli.import_connectors",
+        "lag": "kafkaconnect.lag.cli.lag",
+        "mm2-lag": "kafkaconnect.mirrormaker2.cli.mm2_lag",
+        "offsets": "kafkaconnect.offsets.cli.offsets",
+        "rolling-restart": (
+            "kafkaconnect.rolling_restart.cli.rolling_restart"
+        ),
+        "timing-summary": "kafkaconnect.timing.cli.timing_summary",
+        "watch": "kafkaconnect.watch.cli.watch",
+        "watchdog": "kafkaconnect.watchdog.cli.watchdog",
+    },
+)
 @click.option(
     "-b",
     "--broker",
@@ -71,6 +166,52 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
     show_default=True,
     help=("Password for SASL authentication."),
 )
+@click.option(
+    "-o",
+    "--output",
+    "output_format",
+    envvar="KAFKA_CONNECT_OUTPUT",
+    type=click.Choice([f.value for f in OutputFormat]),
+    default=OutputFormat.PRETTY.value,
+    show_default=True,
+    help=(
+        "Output format of the Connect API responses: indented JSON, "
+        "single-line JSON, newline-delimited JSON with one record per "
+        "connector or list item, or the raw response. Alternatively set via "
+        "$KAFKA_CONNECT_OUTPUT env var."
+    ),
+)
+@click.option(
+    "--profile",
+    "profile",
+    envvar="KAFKA_CONNECT_PROFILE",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help=(
+        "Profile the command with cProfile, write the statistics to this "
+        "file and print the hot functions. Alternatively set via "
+        "$KAFKA_CONNECT_PROFILE env var."
+    ),
+)
+@click.option(
+    "--profile-top",
+    "profile_top",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of functions in the profile summary.",
+)
+@click.option(
+    "--profile-every",
+    "profile_every",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "For long-running commands, profile one cycle out of every N "
+        "cycles instead of the whole command."
+    ),
+)
 @click.version_option(message="%(version)s")
 @click.pass_context
 def main(
@@ -79,6 +220,10 @@ def main(
     connect_url: str,
     sasl_plain_username: str,
     sasl_plain_password: str,
+    output_format: str,
+    profile: Optional[str],
+    profile_top: int,
+    profile_every: int,
 ) -> None:
     """Command-line interface for kafkaconnect.
 
@@ -90,18 +235,31 @@ def main(
         connect_url=connect_url,
         sasl_plain_username=sasl_plain_username,
         sasl_plain_password=sasl_plain_password,
+        output_format=OutputFormat(output_format),
     )
     ctx.ensure_object(dict)
     ctx.obj["config"] = config
 
 
 @main.command("list")
+@click.option(
+    "-e",
+    "--expand",
+    "expand",
+    type=click.Choice(["info", "status"]),
+    multiple=True,
+    help=(
+        "Include the connector information or status. Can be repeated. "
+        "With ``--output ndjson`` each connector is written on its own line."
+    ),
+)
 @click.pass_context
-def list(ctx: click.Context) -> None:
+def list(ctx: click.Context, expand: Tuple[str, ...]) -> None:
     """Get a list of active connectors."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
-    click.echo(connect.list())
+    connect = Connect(config.connect_url, config.output_format)
+    for line in connect.list_lines(expand=expand):
+        click.echo(line)
 
 
 @main.command("info")
@@ -110,7 +268,7 @@ def list(ctx: click.Context) -> None:
 def info(ctx: click.Context, name: str) -> None:
     """Get information about the connector."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.info(name))
 
 
@@ -120,7 +278,7 @@ def info(ctx: click.Context, name: str) -> None:
 def status(ctx: click.Context, name: str) -> None:
     """Get the connector status."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.status(name))
 
 
@@ -130,7 +288,7 @@ def status(ctx: click.Context, name: str) -> None:
 def config(ctx: click.Context, name: str) -> None:
     """Get the connector configuration."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.config(name))
 
 
@@ -140,7 +298,7 @@ def config(ctx: click.Context, name: str) -> None:
 def tasks(ctx: click.Context, name: str) -> None:
     """Get a list of tasks currently running for the connector."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.tasks(name))
 
 
@@ -150,7 +308,7 @@ def tasks(ctx: click.Context, name: str) -> None:
 def topics(ctx: click.Context, name: str) -> None:
     """Get the list of topic names used by the connector."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.topics(name))
 
 
@@ -159,38 +317,220 @@ def topics(ctx: click.Context, name: str) -> None:
 def plugins(ctx: click.Context) -> None:
     """Get a list of connector plugins available in the Connect cluster."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.plugins())
 
 
 @main.command("restart")
 @click.argument("name")
+@click.option(
+    "--include-tasks",
+    "include_tasks",
+    is_flag=True,
+    help=(
+        "Restart the connector tasks too. Requires Kafka Connect 3.0 or later."
+    ),
+)
+@click.option(
+    "--only-failed",
+    "only_failed",
+    is_flag=True,
+    help=(
+        "Restart only the connector and tasks that have failed. Requires "
+        "Kafka Connect 3.0 or later."
+    ),
+)
 @click.pass_context
-def restart(ctx: click.Context, name: str) -> None:
-    """Restart a connector and its tasks."""
+def restart(
+    ctx: click.Context, name: str, include_tasks: bool, only_failed: bool
+) -> None:
+    """Restart a connector and optionally its tasks."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
-    click.echo(connect.restart(name))
+    connect = Connect(config.connect_url, config.output_format)
+    click.echo(connect.restart(name, include_tasks, only_failed))
+
+
+def _bulk(
+    request: Callable[[str], str], names: List[str], done: str
+) -> List[str]:
+    """Send a request for each connector concurrently and report it.
+
+    Returns the names of the connectors for which the request succeeded.
+    """
+    from kafkaconnect.bulk import bulk_request
+
+    errors = bulk_request(request, names)
+    for name in names:
+        click.echo(f"{name}: {errors.get(name, done)}")
+    return [name for name in names if name not in errors]
+
+
+def _wait(
+    connect: Connect, names: List[str], state: str, wait_timeout: int
+) -> None:
+    """Wait until the connectors and their tasks reach a state."""
+    from kafkaconnect.wait import wait_for_state
+
+    click.echo(f"Waiting for the connectors to be {state}...")
+    states = wait_for_state(connect, names, state, timeout=wait_timeout / 1000)
+    for name in names:
+        click.echo(f"{name}: {states[name]}")
+    if any(s != state for s in states.values()):
+        raise click.ClickException(
+            f"Timed out waiting for the connectors to be {state}."
+        )
 
 
 @main.command("pause")
-@click.argument("name")
+@click.argument("names", nargs=-1, required=False)
+@selector_options
+@click.option(
+    "--wait",
+    "wait",
+    is_flag=True,
+    help=(
+        "Wait until the connectors and their tasks are PAUSED. See also the "
+        "``--wait-timeout`` option."
+    ),
+)
+@click.option(
+    "--wait-timeout",
+    "wait_timeout",
+    default=120000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="The time in milliseconds to wait for the connectors to be PAUSED.",
+)
+@click.option(
+    "--paused-file",
+    "paused_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Write the names of the paused connectors to this file, to resume "
+        "the same connectors with ``resume --paused-file``."
+    ),
+)
 @click.pass_context
-def pause(ctx: click.Context, name: str) -> None:
-    """Pause the connector and its tasks."""
+def pause(
+    ctx: click.Context,
+    names: Tuple[str, ...],
+    match: Optional[str],
+    labels: Dict[str, str],
+    wait: bool,
+    wait_timeout: int,
+    paused_file: Optional[Path],
+) -> None:
+    """Pause connectors and their tasks.
+
+    Select the connectors with NAMES, ``--match`` or ``--label``, the
+    connectors are paused concurrently. Connectors that are already paused
+    are skipped and not written to the ``--paused-file``, so that resuming
+    does not resume connectors paused for another reason. The output is a
+    summary line per connector, the ``--output`` option does not apply.
+    """
     config = ctx.obj["config"]
+    # The connector statuses are parsed, so the responses are not formatted
+    # with the --output format
     connect = Connect(config.connect_url)
-    click.echo(connect.pause(name))
+    selector = Selector(names=names, match=match, labels=labels)
+    if selector.empty:
+        raise click.UsageError("Select connectors with NAMES, -r or -l.")
+    try:
+        statuses = selector.statuses(connect)
+    except ConnectError as e:
+        raise click.ClickException(str(e))
+    selected = []
+    for name, status in statuses.items():
+        if status and status["connector"]["state"] == "PAUSED":
+            click.echo(f"{name}: already paused")
+        else:
+            selected.append(name)
+    paused = _bulk(connect.pause, selected, "paused")
+    if paused_file:
+        paused_file.write_text(json.dumps(paused, indent=4) + "\n")
+    if wait and paused:
+        _wait(connect, paused, "PAUSED", wait_timeout)
+    if len(paused) < len(selected):
+        raise click.ClickException(
+            f"Failed to pause {len(selected) - len(paused)} connector(s)."
+        )
 
 
 @main.command("resume")
-@click.argument("name")
+@click.argument("names", nargs=-1, required=False)
+@selector_options
+@click.option(
+    "--wait",
+    "wait",
+    is_flag=True,
+    help=(
+        "Wait until the connectors and their tasks are RUNNING. See also the "
+        "``--wait-timeout`` option."
+    ),
+)
+@click.option(
+    "--wait-timeout",
+    "wait_timeout",
+    default=120000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="The time in milliseconds to wait for the connectors to be RUNNING.",
+)
+@click.option(
+    "--paused-file",
+    "paused_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Resume the connectors written to this file by ``pause``.",
+)
 @click.pass_context
-def resume(ctx: click.Context, name: str) -> None:
-    """Resume a paused connector."""
+def resume(
+    ctx: click.Context,
+    names: Tuple[str, ...],
+    match: Optional[str],
+    labels: Dict[str, str],
+    wait: bool,
+    wait_timeout: int,
+    paused_file: Optional[Path],
+) -> None:
+    """Resume paused connectors.
+
+    Select the connectors with NAMES, ``--match``, ``--label`` or
+    ``--paused-file``, the connectors are resumed concurrently. The other
+    options narrow down the connectors of the ``--paused-file``. The output
+    is a summary line per connector, the ``--output`` option does not
+    apply.
+    """
     config = ctx.obj["config"]
+    # The connector list is parsed, so the responses are not formatted with
+    # the --output format
     connect = Connect(config.connect_url)
-    click.echo(connect.resume(name))
+    if paused_file:
+        try:
+            paused = json.loads(paused_file.read_text())
+        except ValueError:
+            raise click.ClickException(f"Invalid paused file {paused_file}.")
+        names = tuple(n for n in paused if not names or n in names)
+        if not names:
+            click.echo("No connectors to resume.")
+            return
+    selector = Selector(names=names, match=match, labels=labels)
+    if selector.empty:
+        raise click.UsageError(
+            "Select connectors with NAMES, -r, -l or --paused-file."
+        )
+    try:
+        selected = selector.select(connect)
+    except ConnectError as e:
+        raise click.ClickException(str(e))
+    resumed = _bulk(connect.resume, selected, "resumed")
+    if wait and resumed:
+        _wait(connect, resumed, "RUNNING", wait_timeout)
+    if len(resumed) < len(selected):
+        raise click.ClickException(
+            f"Failed to resume {len(selected) - len(resumed)} connector(s)."
+        )
 
 
 @main.command("delete")
@@ -202,7 +542,7 @@ def delete(ctx: click.Context, name: str) -> None:
     Halt tasks and remove the connector configuration.
     """
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
     click.echo(connect.remove(name))
 
 
@@ -220,16 +560,18 @@ def delete(ctx: click.Context, name: str) -> None:
     is_flag=True,
     help=("Validate the connector configuration without uploading."),
 )
+@offline_option
 @click.pass_context
 def upload(
     ctx: click.Context,
     configfile: str,
     name: str,
     dry_run: bool,
+    offline: bool,
 ) -> int:
     """Upload the connector configuration from a file."""
     config = ctx.obj["config"]
-    connect = Connect(config.connect_url)
+    connect = Connect(config.connect_url, config.output_format)
 
     with open(configfile) as f:
         connect_config = json.load(f)
@@ -237,6 +579,17 @@ def upload(
     # Ensure connector name is consistent
     connect_config["name"] = name
 
+    from kafkaconnect.plugin_cache import check_locally
+
+    # Validate with the cached plugin definitions first, the server-side
+    # validation is the final check.
+    local_validation = check_locally(
+        config.connect_url, connect_config, offline
+    )
+    if dry_run and offline:
+        click.echo(json.dumps(local_validation, indent=4, sort_keys=True))
+        return 0
+
     # Validate the connector configuration only.
     if dry_run:
         validation = connect.validate(
@@ -259,9 +612,10 @@ def help(ctx: click.Context, topic: Optional[str], **kw: Any) -> None:
     # The help command implementation is taken from
     # https://www.burgundywall.com/post/having-click-help-subcommand
     if topic:
-        if topic in main.commands:
+        command = main.get_command(ctx, topic)
+        if command:
             ctx.info_name = topic
-            click.echo(main.commands[topic].get_help(ctx))
+            click.echo(command.get_help(ctx))
         else:
             raise click.UsageError(f"Unknown help topic {topic}", ctx)
     else:
@@ -269,17 +623,21 @@ def help(ctx: click.Context, topic: Optional[str], **kw: Any) -> None:
         click.echo(ctx.parent.get_help())
 
 
-@main.group()
+# Subcommands from other modules are imported only when they are invoked
+@main.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "influxdb-sink": (
+            "kafkaconnect.influxdb_sink.cli.create_influxdb_sink"
+        ),
+        "s3-sink": "kafkaconnect.s3_sink.cli.create_s3_sink",
+        "mirrormaker2": "kafkaconnect.mirrormaker2.cli.create_mirrormaker2",
+        "jdbc-sink": "kafkaconnect.jdbc_sink.cli.create_jdbc_sink",
+    },
+)
 @click.pass_context
 def create(ctx: click.Context) -> None:
     """Create a new connector.
 
     Each subcommand creates a different connector.
     """
-
-
-# Add subcommands from other modules
-create.add_command(create_influxdb_sink)
-create.add_command(create_s3_sink)
-create.add_command(create_mirrormaker2)
-create.add_command(create_jdbc_sink)
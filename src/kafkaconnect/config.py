@@ -5,7 +5,9 @@ __all__ = ["Config", "ConnectorConfig"]
 import json
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
+
+from kafkaconnect.connect import OutputFormat
 
 
 @dataclass
@@ -34,6 +36,11 @@ class Config:
        Default: None
     """
 
+    output_format: OutputFormat = OutputFormat.PRETTY
+    """Format of the Connect API responses in the command output.
+       Default: pretty
+    """
+
     def __post_init__(self) -> None:
         """Post init validation."""
         if (self.sasl_plain_username is None) != (
@@ -50,7 +57,7 @@ class ConnectorConfig(ABC):
     """Connector configuration interface."""
 
     @abstractmethod
-    def update_config(self, topics: Set[str]) -> None:
+    def update_config(self, topics: AbstractSet[str]) -> None:
         """Update connector configuration.
 
         Abstract method to be implemented by subclasses.
@@ -3,14 +3,11 @@
 See https://docs.confluent.io/current/connect/references/restapi.html.
 """
 
-__all__ = ["Connect"]
+__all__ = ["Connect", "ConnectError", "OutputFormat"]
 
 import json
 from enum import Enum
-from typing import Optional
-
-from requests import delete, get, post, put  # noqa
-from requests.exceptions import ConnectionError, HTTPError
+from typing import Any, Iterator, Optional, Sequence
 
 
 class HTTPMethod(Enum):
@@ -19,9 +16,30 @@ class HTTPMethod(Enum):
     GET = "get"
     PUT = "put"
     POST = "post"
+    PATCH = "patch"
     DELETE = "delete"
 
 
+class OutputFormat(Enum):
+    """Formats of the response content."""
+
+    PRETTY = "pretty"
+    """Indented JSON with sorted keys."""
+
+    COMPACT = "compact"
+    """JSON on a single line, without whitespace."""
+
+    NDJSON = "ndjson"
+    """Newline-delimited JSON, one record per connector or list item."""
+
+    RAW = "raw"
+    """The response body as returned by the Connect API, not parsed."""
+
+
+class ConnectError(Exception):
+    """Raised when a Connect API response cannot be used."""
+
+
 class Connect:
     """Kafka Connect API helper class.
 
@@ -29,18 +47,84 @@ class Connect:
     ----------
     connect_url : `str`
     Kafka Connect URL
+    output_format : `OutputFormat`
+    Format of the response content.
     """
 
     _header = {"Content-Type": "application/json"}
 
-    def __init__(self, connect_url: str) -> None:
+    def __init__(
+        self,
+        connect_url: str,
+        output_format: OutputFormat = OutputFormat.PRETTY,
+    ) -> None:
         self._connect_url = connect_url
+        self._output_format = output_format
+
+    @property
+    def connect_url(self) -> str:
+        """Return the Kafka Connect URL."""
+        return self._connect_url
+
+    def _format(self, content: Any, records: bool = False) -> str:
+        """Serialize the parsed response content.
+
+        See `_format_lines` for the parameters.
+        """
+        return "\n".join(self._format_lines(content, records))
+
+    def _format_lines(
+        self, content: Any, records: bool = False
+    ) -> Iterator[str]:
+        """Serialize the parsed response content, line by line.
+
+        Parameters
+        ----------
+        content : `Any`
+            The parsed response content.
+        records : `bool`
+            Whether the content is a mapping of connector names to records.
+            With the ``ndjson`` format each record is written on its own
+            line, with the connector name added to the record.
+        """
+        if self._output_format == OutputFormat.PRETTY:
+            yield json.dumps(content, indent=4, sort_keys=True)
+            return
+        if self._output_format == OutputFormat.NDJSON:
+            if records and isinstance(content, dict):
+                content = (
+                    {"name": name, **record}
+                    for name, record in content.items()
+                )
+            elif not isinstance(content, list):
+                content = [content]
+            for item in content:
+                yield json.dumps(item, separators=(",", ":"))
+            return
+        yield json.dumps(content, separators=(",", ":"))
 
     def _request(
-        self, method: HTTPMethod, uri: str, data: Optional[str] = None
+        self,
+        method: HTTPMethod,
+        uri: str,
+        data: Optional[str] = None,
+        records: bool = False,
     ) -> str:
         """Make HTTP requests.
 
+        See `_request_lines` for the parameters.
+        """
+        return "\n".join(self._request_lines(method, uri, data, records))
+
+    def _request_lines(
+        self,
+        method: HTTPMethod,
+        uri: str,
+        data: Optional[str] = None,
+        records: bool = False,
+    ) -> Iterator[str]:
+        """Make HTTP requests and return the output lines.
+
         Parameters
         ----------
         method: `HTTPMethod`
@@ -49,19 +133,26 @@ class Connect:
             The resource identifier.
         data : `str`
             The message body for the PUT request.
-
-        Returns
-        -------
-        content: `ContenT` or `None`
-            The response content. Returns `None` if the request was not
-            successful or if the response is empty.
+        records : `bool`
+            Whether the response is a mapping of connector names to records.
+
+        Yields
+        ------
+        line: `str`
+            The formatted response content, one line per record with the
+            ``ndjson`` format, or the error message if the request was not
+            successful. Nothing is yielded for an empty response.
         """
         if method.name in ("GET", "DELETE"):
             if data:
                 raise ValueError(
                     f"data argument must be None with {method.name} method."
                 )
-        func = eval(method.value)
+        # requests is imported here to keep it out of the CLI startup path
+        import requests
+        from requests.exceptions import ConnectionError, HTTPError
+
+        func = getattr(requests, method.value)
         try:
             if data:
                 response = func(uri, data=data, headers=Connect._header)
@@ -71,26 +162,52 @@ class Connect:
         except HTTPError as err:
             if err.response.status_code == 404:
                 message = f"Resource {uri} not found."
-                return message
+                yield message
+                return
             # returns 409 (Conflict) if kafka cluster rebalance is in process.
             if err.response.status_code == 409:
                 message = "Kafka cluster rebalance is in process."
-                return message
+                yield message
+                return
         except ConnectionError:
             message = (
                 f"Failed to establish connection with the "
                 f"Connect API {self._connect_url}."
             )
-            return message
-        content = ""
+            yield message
+            return
         if response.text:
-            content = json.dumps(response.json(), indent=4, sort_keys=True)
-        return content
+            if self._output_format == OutputFormat.RAW:
+                yield response.text
+                return
+            yield from self._format_lines(response.json(), records=records)
+
+    def list(self, expand: Sequence[str] = ()) -> str:
+        """Get a list of active connectors.
+
+        Parameters
+        ----------
+        expand : `Sequence`
+            Additional information to retrieve for each connector, ``info``
+            and/or ``status``. If set, the response is a mapping of
+            connector names to the requested information instead of a list
+            of names.
+        """
+        return "\n".join(self.list_lines(expand))
 
-    def list(self) -> str:
-        """Get a list of active connectors."""
+    def list_lines(self, expand: Sequence[str] = ()) -> Iterator[str]:
+        """Get the active connectors as output lines.
+
+        With the ``ndjson`` format, each connector is a line that can be
+        written as soon as it is formatted, and an empty list has no lines.
+        See `list` for the parameters.
+        """
         uri = f"{self._connect_url}/connectors"
-        return self._request(method=HTTPMethod.GET, uri=uri)
+        if expand:
+            uri += "?" + "&".join(f"expand={e}" for e in expand)
+        return self._request_lines(
+            method=HTTPMethod.GET, uri=uri, records=bool(expand)
+        )
 
     def info(self, name: str) -> str:
         """Get information about the connector."""
@@ -117,6 +234,43 @@ class Connect:
         uri = f"{self._connect_url}/connectors/{name}/topics"
         return self._request(method=HTTPMethod.GET, uri=uri)
 
+    def offsets(self, name: str) -> str:
+        """Get the offsets of the connector.
+
+        Requires Kafka Connect 3.5 or later.
+        """
+        uri = f"{self._connect_url}/connectors/{name}/offsets"
+        return self._request(method=HTTPMethod.GET, uri=uri)
+
+    def alter_offsets(self, name: str, offsets: str) -> str:
+        """Alter the offsets of a stopped connector.
+
+        Requires Kafka Connect 3.6 or later.
+
+        Parameters
+        ----------
+        name : `str`
+            Connector name.
+        offsets : `str`
+            The offsets in the format returned by `offsets`, only the
+            partitions to alter are needed.
+        """
+        uri = f"{self._connect_url}/connectors/{name}/offsets"
+        return self._request(method=HTTPMethod.PATCH, uri=uri, data=offsets)
+
+    def reset_offsets(self, name: str) -> str:
+        """Reset all the offsets of a stopped connector.
+
+        Requires Kafka Connect 3.6 or later.
+        """
+        uri = f"{self._connect_url}/connectors/{name}/offsets"
+        return self._request(method=HTTPMethod.DELETE, uri=uri)
+
+    def worker(self) -> str:
+        """Get the version and commit of the Connect worker."""
+        uri = f"{self._connect_url}/"
+        return self._request(method=HTTPMethod.GET, uri=uri)
+
     def plugins(self) -> str:
         """Get a list of connector plugins available in the Connect cluster."""
         uri = f"{self._connect_url}/connector-plugins"
@@ -146,9 +300,35 @@ class Connect:
             method=HTTPMethod.PUT, uri=uri, data=connect_config
         )
 
-    def restart(self, name: str) -> str:
-        """Restart the connector."""
+    def restart(
+        self, name: str, include_tasks: bool = False, only_failed: bool = False
+    ) -> str:
+        """Restart the connector.
+
+        Parameters
+        ----------
+        name : `str`
+            Connector name.
+        include_tasks : `bool`
+            Whether to restart the connector tasks too. Requires Kafka
+            Connect 3.0 or later.
+        only_failed : `bool`
+            Whether to restart only the failed connector and tasks. Requires
+            Kafka Connect 3.0 or later.
+        """
         uri = f"{self._connect_url}/connectors/{name}/restart"
+        params = []
+        if include_tasks:
+            params.append("includeTasks=true")
+        if only_failed:
+            params.append("onlyFailed=true")
+        if params:
+            uri += "?" + "&".join(params)
+        return self._request(method=HTTPMethod.POST, uri=uri)
+
+    def restart_task(self, name: str, task_id: int) -> str:
+        """Restart a connector task."""
+        uri = f"{self._connect_url}/connectors/{name}/tasks/{task_id}/restart"
         return self._request(method=HTTPMethod.POST, uri=uri)
 
     def pause(self, name: str) -> str:
@@ -161,6 +341,16 @@ class Connect:
         uri = f"{self._connect_url}/connectors/{name}/resume"
         return self._request(method=HTTPMethod.PUT, uri=uri)
 
+    def stop(self, name: str) -> str:
+        """Stop the connector and shut down its tasks.
+
+        Unlike `pause`, the tasks are deallocated, which is required to
+        alter or reset the connector offsets. Use `resume` to restart the
+        connector. Requires Kafka Connect 3.5 or later.
+        """
+        uri = f"{self._connect_url}/connectors/{name}/stop"
+        return self._request(method=HTTPMethod.PUT, uri=uri)
+
     def validate(self, name: str, connect_config: str) -> str:
         """Validate the connector configuration.
 
@@ -0,0 +1 @@
+"""Long-running management of many connectors."""
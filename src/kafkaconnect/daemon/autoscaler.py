@@ -0,0 +1,170 @@
+"""Scale the number of tasks of sink connectors from their consumer lag."""
+
+__all__ = ["ScalingPolicy", "ScalingDecision", "Autoscaler"]
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+
+@dataclass
+class ScalingPolicy:
+    """Bounds and thresholds of the ``tasks.max`` autoscaler.
+
+    The gap between ``scale_down_lag`` and ``scale_up_lag`` is the
+    hysteresis band where the number of tasks is kept.
+    """
+
+    min_tasks: int = 1
+    """Minimum number of tasks."""
+
+    max_tasks: int = 1
+    """Maximum number of tasks."""
+
+    scale_up_lag: int = 10000
+    """Consumer lag, in messages, above which the tasks are doubled."""
+
+    scale_down_lag: int = 1000
+    """Consumer lag, in messages, below which one task is removed."""
+
+    scale_up_cooldown: int = 300000
+    """Time, in milliseconds, after a change before scaling up again."""
+
+    scale_down_cooldown: int = 900000
+    """Time, in milliseconds, after a change before scaling down."""
+
+    window: int = 3
+    """Number of lag samples used to compute the lag trend."""
+
+    def __post_init__(self) -> None:
+        """Post init validation."""
+        if not 1 <= self.min_tasks <= self.max_tasks:
+            raise ValueError(
+                "The autoscaler bounds must satisfy "
+                "1 <= min_tasks <= max_tasks."
+            )
+        if self.scale_down_lag >= self.scale_up_lag:
+            raise ValueError(
+                "The autoscaler scale_down_lag must be lower than "
+                "scale_up_lag."
+            )
+        if self.window < 2:
+            raise ValueError("The autoscaler window must be at least 2.")
+
+    def bound(self, tasks: int) -> int:
+        """Return the number of tasks within the bounds."""
+        return max(self.min_tasks, min(self.max_tasks, tasks))
+
+
+@dataclass
+class ScalingDecision:
+    """A scaling decision and its inputs."""
+
+    name: str
+    """Name of the connector."""
+
+    current: int
+    """Current number of tasks."""
+
+    desired: int
+    """Desired number of tasks."""
+
+    lag: int
+    """Total consumer lag, in messages."""
+
+    trend: Optional[float]
+    """Lag rate of change, in messages per second, if known."""
+
+    reason: str
+    """Reason of the decision."""
+
+    @property
+    def changed(self) -> bool:
+        """Whether the number of tasks changes."""
+        return self.desired != self.current
+
+    def __str__(self) -> str:
+        """Return the decision and its inputs for logging."""
+        trend = "unknown" if self.trend is None else f"{self.trend:+.1f}/s"
+        return (
+            f"{self.name}: tasks.max {self.current} -> {self.desired} "
+            f"({self.reason}, lag={self.lag}, trend={trend})"
+        )
+
+
+class Autoscaler:
+    """Decide the number of tasks of the connectors from their lag.
+
+    The tasks are doubled when the lag is above ``scale_up_lag`` and not
+    decreasing, and one task is removed when the lag stays below
+    ``scale_down_lag`` for a full window of samples. Each change of
+    ``tasks.max`` rebalances the connector tasks, so changes are spaced
+    by the cooldowns and the lag history is reset after a change.
+
+    Parameters
+    ----------
+    clock : `Callable`
+        Monotonic clock, for testing.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._samples: Dict[str, Deque[Tuple[float, int]]] = {}
+        self._last_change: Dict[str, float] = {}
+
+    def trend(self, name: str) -> Optional[float]:
+        """Return the lag rate of change over the sample window."""
+        samples = self._samples.get(name)
+        if not samples or len(samples) < 2:
+            return None
+        (t0, lag0), (t1, lag1) = samples[0], samples[-1]
+        if t1 <= t0:
+            return None
+        return (lag1 - lag0) / (t1 - t0)
+
+    def decide(
+        self, name: str, policy: ScalingPolicy, current: int, lag: int
+    ) -> ScalingDecision:
+        """Record a lag sample and decide the number of tasks.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the connector.
+        policy : `ScalingPolicy`
+            The scaling policy of the connector.
+        current : `int`
+            Current ``tasks.max`` of the connector.
+        lag : `int`
+            Total consumer lag of the connector, in messages.
+        """
+        now = self._clock()
+        samples = self._samples.setdefault(name, deque(maxlen=policy.window))
+        samples.append((now, lag))
+        trend = self.trend(name)
+        elapsed = now - self._last_change.get(name, float("-inf"))
+
+        def decision(desired: int, reason: str) -> ScalingDecision:
+            if desired != current:
+                self._last_change[name] = now
+                samples.clear()
+            return ScalingDecision(name, current, desired, lag, trend, reason)
+
+        if policy.bound(current) != current:
+            return decision(policy.bound(current), "out of bounds")
+        if lag >= policy.scale_up_lag and current < policy.max_tasks:
+            if trend is not None and trend < 0:
+                return decision(current, "lag decreasing")
+            if elapsed < policy.scale_up_cooldown / 1000:
+                return decision(current, "scale up cooldown")
+            return decision(policy.bound(current * 2), "lag above threshold")
+        if lag <= policy.scale_down_lag and current > policy.min_tasks:
+            if len(samples) < policy.window or any(
+                sample > policy.scale_down_lag for _, sample in samples
+            ):
+                return decision(current, "waiting for a full window")
+            if elapsed < policy.scale_down_cooldown / 1000:
+                return decision(current, "scale down cooldown")
+            return decision(current - 1, "lag below threshold")
+        return decision(current, "steady")
@@ -0,0 +1,126 @@
+"""CLI to manage many connectors in a single process."""
+
+__all__ = ["daemon"]
+
+import asyncio
+import functools
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+
+from kafkaconnect.connect import Connect
+from kafkaconnect.daemon.daemon import Daemon
+from kafkaconnect.daemon.manifest import load_manifest
+from kafkaconnect.health import health_options, start_health
+from kafkaconnect.kafka_admin import admin_client
+from kafkaconnect.lag.consumer import sink_lag
+from kafkaconnect.metadata_cache import shared_cache
+
+
+@click.command("daemon")
+@click.argument(
+    "manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--cycle-interval",
+    "cycle_interval",
+    envvar="KAFKA_CONNECT_CYCLE_INTERVAL",
+    default=15000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=(
+        "The interval, in milliseconds, to fetch the Kafka topics and the "
+        "connectors state shared by all managed connectors. Alternatively "
+        "set via the $KAFKA_CONNECT_CYCLE_INTERVAL env var."
+    ),
+)
+@click.option(
+    "--concurrency",
+    "concurrency",
+    envvar="KAFKA_CONNECT_CONCURRENCY",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum number of concurrent requests to the Connect API. "
+        "Alternatively set via the $KAFKA_CONNECT_CONCURRENCY env var."
+    ),
+)
+@health_options
+@click.pass_context
+def daemon(
+    ctx: click.Context,
+    manifest: Path,
+    cycle_interval: int,
+    concurrency: int,
+    health_port: Optional[int],
+    liveness_threshold: int,
+    discovery_threshold: int,
+    apply_threshold: int,
+) -> int:
+    """Manage the connectors in MANIFEST in a single process.
+
+    Each connector in the manifest is reconciled independently at its own
+    ``check_interval``. The Kafka topics and the connectors configuration
+    and status are fetched once per cycle and shared by all connectors.
+    Connectors with an ``autoscale`` policy have their ``tasks.max`` scaled
+    from their consumer lag, measured once per cycle.
+    """
+    config = ctx.obj["config"]
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+    )
+    try:
+        entries = load_manifest(manifest)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Managing {len(entries)} connector(s).")
+
+    connect = Connect(config.connect_url)
+    # A single admin client is shared by all connectors
+    client = None
+    autoscale = any(e.scaling_policy for e in entries)
+    if autoscale or any(e.discovers_topics for e in entries):
+        client = admin_client(config)
+
+    def measure_lag(topics: Dict[str, List[str]]) -> Dict[str, int]:
+        assert client is not None
+        lags = sink_lag(client, topics)
+        return {name: sum(lag.values()) for name, lag in lags.items()}
+
+    # Each connector has its own health timestamps, the oldest is reported
+    health = start_health(
+        health_port,
+        liveness_threshold,
+        discovery_threshold,
+        apply_threshold,
+        sources=[e.name for e in entries],
+    )
+
+    async def main() -> None:
+        list_topics = None
+        if any(e.discovers_topics for e in entries):
+            # Discovering connectors share the process-wide topic cache, the
+            # maximum age is shorter than the cycle so that each cycle
+            # refreshes it
+            list_topics = functools.partial(
+                shared_cache(config, client=client).names,
+                max_age=cycle_interval / 2000,
+            )
+        await Daemon(
+            entries,
+            connect,
+            list_topics,
+            cycle_interval=cycle_interval / 1000,
+            concurrency=concurrency,
+            health=health,
+            measure_lag=measure_lag if autoscale else None,
+        ).run()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        raise click.ClickException("Interruped.")
+    return 0
@@ -0,0 +1,295 @@
+"""Manage many connectors in a single asyncio event loop."""
+
+__all__ = ["ClusterState", "SharedState", "Daemon"]
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from kafkaconnect.apply.executor import execute_action, validate_action
+from kafkaconnect.apply.plan import (
+    Action,
+    ActionKind,
+    diff_config,
+    normalize_config,
+)
+from kafkaconnect.connect import Connect
+from kafkaconnect.daemon.autoscaler import Autoscaler, ScalingPolicy
+from kafkaconnect.daemon.manifest import ManifestEntry
+from kafkaconnect.health import HealthState
+from kafkaconnect.metadata_cache import topic_filter
+from kafkaconnect.snapshot import ConnectorState, ConnectSnapshot
+
+logger = logging.getLogger("kafkaconnect")
+
+
+@dataclass
+class ClusterState:
+    """Kafka topics and Connect snapshot shared by all connectors."""
+
+    topic_names: Optional[Iterable[str]]
+    """Topic names in Kafka, `None` if no connector discovers topics."""
+
+    snapshot: ConnectSnapshot
+    """Configuration and status of the connectors."""
+
+    timestamp: float
+    """Monotonic time of the fetch."""
+
+    lags: Dict[str, int] = field(default_factory=dict)
+    """Total consumer lag of the autoscaled connectors."""
+
+
+class SharedState:
+    """Fetch the cluster state at most once per cycle.
+
+    All connectors share the same Kafka metadata request and Connect
+    snapshot. The first connector that needs a state older than
+    ``cycle_interval`` triggers the fetch, the others wait for it.
+
+    Parameters
+    ----------
+    connect : `Connect`
+        The Connect API helper.
+    list_topics : `Callable` or `None`
+        Blocking function that returns the topic names in Kafka.
+    cycle_interval : `float`
+        Maximum age of the state, in seconds.
+    measure_lag : `Callable`, optional
+        Blocking function that returns the total consumer lag of connectors
+        given the topics they read.
+    autoscaled : `Sequence`
+        Names of the connectors whose lag is measured.
+    """
+
+    def __init__(
+        self,
+        connect: Connect,
+        list_topics: Optional[Callable[[], Iterable[str]]],
+        cycle_interval: float,
+        measure_lag: Optional[
+            Callable[[Dict[str, List[str]]], Dict[str, int]]
+        ] = None,
+        autoscaled: Sequence[str] = (),
+    ) -> None:
+        self._connect = connect
+        self._list_topics = list_topics
+        self._cycle_interval = cycle_interval
+        self._measure_lag = measure_lag
+        self._autoscaled = autoscaled
+        self._state: Optional[ClusterState] = None
+        self._lock = asyncio.Lock()
+
+    async def _fetch_topic_names(self) -> Optional[Iterable[str]]:
+        if self._list_topics is None:
+            return None
+        return await asyncio.to_thread(self._list_topics)
+
+    async def get(self) -> ClusterState:
+        """Return the cluster state, fetching it if too old."""
+        async with self._lock:
+            now = time.monotonic()
+            if (
+                self._state is None
+                or now - self._state.timestamp >= self._cycle_interval
+            ):
+                # Kafka and Connect requests run concurrently
+                topic_names, snapshot = await asyncio.gather(
+                    self._fetch_topic_names(),
+                    asyncio.to_thread(
+                        ConnectSnapshot.from_connect,
+                        self._connect,
+                        ("info", "status"),
+                    ),
+                )
+                lags = await self._fetch_lags(snapshot)
+                self._state = ClusterState(topic_names, snapshot, now, lags)
+            return self._state
+
+    async def _fetch_lags(self, snapshot: ConnectSnapshot) -> Dict[str, int]:
+        """Measure the lag of the autoscaled connectors.
+
+        The lag is measured for the topics in the live configuration, so it
+        needs the snapshot of the current cycle.
+        """
+        if self._measure_lag is None:
+            return {}
+        topics = {}
+        for name in self._autoscaled:
+            config = snapshot.configs.get(name) or {}
+            if config.get("topics"):
+                topics[name] = config["topics"].split(",")
+        if not topics:
+            return {}
+        try:
+            return await asyncio.to_thread(self._measure_lag, topics)
+        except Exception:
+            logger.exception("Failed to measure the consumer lag.")
+            return {}
+
+    def update_config(self, name: str, config: Dict[str, str]) -> None:
+        """Record a configuration applied during the current cycle."""
+        if self._state is not None:
+            connectors = self._state.snapshot.connectors
+            state = connectors.setdefault(name, ConnectorState(name=name))
+            state.config = config
+
+
+class Daemon:
+    """Reconcile the managed connectors independently.
+
+    Each connector runs its own reconciliation loop with its own check
+    interval, using the cluster state shared by all connectors.
+
+    Parameters
+    ----------
+    entries : `Sequence`
+        The managed connectors.
+    connect : `Connect`
+        The Connect API helper.
+    list_topics : `Callable` or `None`
+        Blocking function that returns the topic names in Kafka.
+    cycle_interval : `float`
+        Maximum age, in seconds, of the shared cluster state.
+    concurrency : `int`
+        Maximum number of concurrent Connect API requests.
+    health : `HealthState`, optional
+        Health state updated after each fetch and reconciliation.
+    measure_lag : `Callable`, optional
+        Blocking function that returns the total consumer lag of connectors
+        given the topics they read, required to autoscale connectors.
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[ManifestEntry],
+        connect: Connect,
+        list_topics: Optional[Callable[[], Iterable[str]]],
+        cycle_interval: float,
+        concurrency: int = 8,
+        health: Optional[HealthState] = None,
+        measure_lag: Optional[
+            Callable[[Dict[str, List[str]]], Dict[str, int]]
+        ] = None,
+    ) -> None:
+        self.entries = entries
+        self.health = health
+        self._connect = connect
+        needs_topics = any(e.discovers_topics for e in entries)
+        self.shared_state = SharedState(
+            connect,
+            list_topics if needs_topics else None,
+            cycle_interval,
+            measure_lag,
+            [e.name for e in entries if e.scaling_policy],
+        )
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.autoscaler = Autoscaler()
+        # Lag samples are taken once per cycle
+        self._scaled_at: Dict[str, float] = {}
+
+    def _scale(
+        self,
+        name: str,
+        policy: ScalingPolicy,
+        config: Dict[str, Any],
+        state: ClusterState,
+    ) -> int:
+        """Return the number of tasks decided by the autoscaler.
+
+        ``config`` is the live configuration, or the desired configuration
+        if the connector does not exist yet.
+        """
+        current = int(config.get("tasks.max", 1))
+        lag = state.lags.get(name)
+        if lag is None or self._scaled_at.get(name) == state.timestamp:
+            return policy.bound(current)
+        self._scaled_at[name] = state.timestamp
+        decision = self.autoscaler.decide(name, policy, current, lag)
+        if decision.reason == "steady":
+            logger.debug(f"Autoscaler {decision}")
+        else:
+            logger.info(f"Autoscaler {decision}")
+        return decision.desired
+
+    async def reconcile(self, entry: ManifestEntry) -> Optional[bool]:
+        """Reconcile a connector with the cluster state.
+
+        Returns
+        -------
+        applied : `bool` or `None`
+            `True` if the configuration was applied, `False` if it failed
+            and `None` if no change was needed.
+        """
+        state = await self.shared_state.get()
+        topics = None
+        if entry.discovers_topics:
+            assert state.topic_names is not None
+            # Connectors with the same regexes share the filter result
+            topics = topic_filter(
+                entry.topic_regex or ".*", entry.excluded_topic_regex
+            ).apply(state.topic_names)
+            if not topics:
+                logger.warning(f"{entry.name}: no topics found.")
+                return None
+
+        connector = state.snapshot.connectors.get(entry.name)
+        if connector and connector.status:
+            connector_state = connector.status["connector"]["state"]
+            if connector_state == "FAILED":
+                logger.warning(f"{entry.name}: connector is FAILED.")
+
+        desired = entry.render(topics)
+        live = connector.config if connector else None
+        policy = entry.scaling_policy
+        if policy:
+            desired["tasks.max"] = self._scale(
+                entry.name, policy, live or desired, state
+            )
+        if live is None:
+            action = Action(entry.name, ActionKind.CREATE, desired)
+        else:
+            changed_keys = diff_config(desired, live)
+            if not changed_keys:
+                return None
+            action = Action(
+                entry.name, ActionKind.UPDATE, desired, changed_keys
+            )
+
+        logger.info(f"Applying {action}")
+        async with self._semaphore:
+            result = await asyncio.to_thread(
+                validate_action, self._connect, action
+            )
+            if result.ok:
+                result = await asyncio.to_thread(
+                    execute_action, self._connect, action
+                )
+        if not result.ok:
+            logger.error(f"Failed to apply {result}")
+            return False
+        self.shared_state.update_config(entry.name, normalize_config(desired))
+        logger.info(str(result))
+        return True
+
+    async def _run_entry(self, entry: ManifestEntry) -> None:
+        """Reconcile a connector forever."""
+        while True:
+            try:
+                applied = await self.reconcile(entry)
+            except Exception:
+                logger.exception(f"{entry.name}: reconciliation failed.")
+            else:
+                if self.health:
+                    self.health.discovered(entry.name)
+                    if applied is not False:
+                        self.health.applied(entry.name)
+            if self.health:
+                self.health.cycle(entry.name)
+            await asyncio.sleep(entry.check_interval / 1000)
+
+    async def run(self) -> None:
+        """Run the reconciliation loops of all connectors."""
+        await asyncio.gather(*(self._run_entry(e) for e in self.entries))
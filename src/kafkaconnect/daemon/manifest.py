@@ -0,0 +1,189 @@
+"""Manifest of the connectors managed by the daemon.
+
+The manifest is a JSON file with the list of managed connectors, for
+example:
+
+.. code-block:: json
+
+   {
+     "connectors": [
+       {
+         "name": "influxdb-sink",
+         "type": "influxdb-sink",
+         "topic_regex": "lsst.sal.*",
+         "check_interval": 15000,
+         "config": {"connect_influx_url": "http://influxdb:8086"},
+         "autoscale": {"min_tasks": 1, "max_tasks": 8}
+       },
+       {
+         "name": "postgres-sink",
+         "configfile": "connectors/jdbc_sink/jdbc-sink-connector.json"
+       }
+     ]
+   }
+
+For ``influxdb-sink`` connectors, ``config`` has the same settings as the
+``create influxdb-sink`` command options. For other connectors, ``config``
+or ``configfile`` is the connector configuration. If ``topic_regex`` is set
+the ``topics`` property is computed from the topics in Kafka. If
+``autoscale`` is set, ``tasks.max`` is scaled from the consumer lag of the
+connector, see `ScalingPolicy` for the settings.
+"""
+
+__all__ = ["ManifestEntry", "load_manifest"]
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, List, Optional, Union
+
+from kafkaconnect.daemon.autoscaler import ScalingPolicy
+from kafkaconnect.influxdb_sink.config import InfluxConfig
+
+INFLUXDB_SINK = "influxdb-sink"
+"""Type of the InfluxDB Sink connector entries."""
+
+INFLUXDB_SINK_DEFAULTS: Dict[str, Any] = {
+    "connect_influx_url": "http://localhost:8086",
+    "connect_influx_db": "mydb",
+    "tasks_max": 1,
+    "connect_influx_username": "-",
+    "connect_influx_password": "",
+    "connect_influx_error_policy": "THROW",
+    "connect_influx_max_retries": "10",
+    "connect_influx_retry_interval": "60000",
+    "connect_progress_enabled": False,
+    "tags": "",
+    "remove_prefix": "",
+}
+"""Same defaults as the ``create influxdb-sink`` command."""
+
+
+@dataclass
+class ManifestEntry:
+    """A connector managed by the daemon."""
+
+    name: str
+    """Name of the connector."""
+
+    type: str = "config"
+    """Connector type, ``influxdb-sink`` or ``config``."""
+
+    config: Dict[str, Any] = field(default_factory=dict)
+    """Connector configuration or ``influxdb-sink`` settings."""
+
+    check_interval: int = 15000
+    """Interval, in milliseconds, between reconciliations."""
+
+    topic_regex: Optional[str] = None
+    """Regex for selecting topics, topics are not discovered if `None`."""
+
+    excluded_topic_regex: str = ""
+    """Regex for excluding topics."""
+
+    timestamp: str = "sys_time()"
+    """Timestamp to use as the InfluxDB time, ``influxdb-sink`` only."""
+
+    autoscale: Optional[Union[ScalingPolicy, Dict[str, Any]]] = None
+    """Policy to scale ``tasks.max`` from the consumer lag, if set."""
+
+    def __post_init__(self) -> None:
+        """Post init validation."""
+        if isinstance(self.autoscale, dict):
+            try:
+                self.autoscale = ScalingPolicy(**self.autoscale)
+            except TypeError as e:
+                raise ValueError(
+                    f"Invalid autoscale settings for {self.name}: {e}"
+                )
+        if self.type == INFLUXDB_SINK:
+            if self.topic_regex is None:
+                self.topic_regex = ".*"
+            unknown = set(self.config) - set(INFLUXDB_SINK_DEFAULTS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown {INFLUXDB_SINK} settings for {self.name}: "
+                    f"{', '.join(sorted(unknown))}."
+                )
+        elif self.type == "config":
+            if "connector.class" not in self.config:
+                raise ValueError(
+                    f"Connector {self.name} has no 'connector.class' "
+                    f"property."
+                )
+        else:
+            raise ValueError(
+                f"Unknown connector type {self.type} for {self.name}."
+            )
+
+    @property
+    def scaling_policy(self) -> Optional[ScalingPolicy]:
+        """Return the autoscaling policy, if any."""
+        if isinstance(self.autoscale, ScalingPolicy):
+            return self.autoscale
+        return None
+
+    @property
+    def discovers_topics(self) -> bool:
+        """Whether the connector topics are discovered from Kafka."""
+        return self.topic_regex is not None
+
+    def render(
+        self, topics: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Any]:
+        """Return the connector configuration.
+
+        Parameters
+        ----------
+        topics : `AbstractSet`
+            Topics the connector reads from, if discovered.
+        """
+        if self.type == INFLUXDB_SINK:
+            settings = {**INFLUXDB_SINK_DEFAULTS, **self.config}
+            influx_config = InfluxConfig(name=self.name, **settings)
+            influx_config.update_config(topics or set(), self.timestamp)
+            return json.loads(influx_config.asjson())
+
+        config = {**self.config, "name": self.name}
+        if topics is not None:
+            config["topics"] = ",".join(sorted(topics))
+        return config
+
+
+def load_manifest(path: Path) -> List[ManifestEntry]:
+    """Load the manifest of managed connectors.
+
+    Relative ``configfile`` paths are resolved from the manifest directory.
+
+    Raises
+    ------
+    ValueError
+        If the manifest is invalid.
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+
+    entries = []
+    for item in manifest.get("connectors", []):
+        item = dict(item)
+        configfile = item.pop("configfile", None)
+        if configfile:
+            with open(path.parent / configfile) as f:
+                item["config"] = {**json.load(f), **item.get("config", {})}
+        if "name" not in item:
+            item["name"] = item.get("config", {}).get("name")
+        if not item["name"]:
+            raise ValueError(f"Manifest entry {item} has no name.")
+        try:
+            entries.append(ManifestEntry(**item))
+        except TypeError as e:
+            raise ValueError(f"Invalid manifest entry {item['name']}: {e}")
+
+    names = [e.name for e in entries]
+    duplicates = {n for n in names if names.count(n) > 1}
+    if duplicates:
+        raise ValueError(
+            f"Duplicated connectors in the manifest: "
+            f"{', '.join(sorted(duplicates))}."
+        )
+    return entries
@@ -0,0 +1,255 @@
+"""Liveness and readiness endpoints for the long-running modes.
+
+The polling loops record the time of their last cycle, last successful
+topic discovery and last successful apply in a `HealthState`. Recording
+is a single assignment, so it adds no overhead to the loops. Loops that
+manage several connectors record the times per connector, and the checks
+use the oldest time, so that a single failing connector is reported. A
+`HealthServer` running in a background thread exposes the state to
+Kubernetes probes:
+
+``/livez``
+    Fails if no cycle completed within the liveness threshold, for example
+    if a request to Kafka or to the Connect API hangs.
+
+``/readyz``
+    Fails if the last successful discovery or the last successful apply is
+    older than their thresholds, for example if the connector update keeps
+    failing.
+"""
+
+__all__ = ["HealthState", "HealthServer", "health_options", "start_health"]
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+import click
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class HealthState:
+    """Time of the last events of a polling loop.
+
+    Parameters
+    ----------
+    liveness_threshold : `float`
+        Maximum time, in seconds, since the last cycle.
+    discovery_threshold : `float`
+        Maximum time, in seconds, since the last successful discovery.
+    apply_threshold : `float`
+        Maximum time, in seconds, since the last successful apply.
+    sources : `Sequence`
+        Names of the connectors whose events are recorded separately. By
+        default, the loop records its events without a name.
+    clock : `Callable`
+        Monotonic clock, for testing.
+    """
+
+    def __init__(
+        self,
+        liveness_threshold: float,
+        discovery_threshold: float,
+        apply_threshold: float,
+        sources: Sequence[str] = ("",),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.liveness_threshold = liveness_threshold
+        self.discovery_threshold = discovery_threshold
+        self.apply_threshold = apply_threshold
+        self._clock = clock
+        # Start the clocks when the loop starts
+        start = clock()
+        self._last: Dict[str, Dict[str, float]] = {
+            event: {source: start for source in sources}
+            for event in ("cycle", "discovery", "apply")
+        }
+
+    def cycle(self, source: str = "") -> None:
+        """Record the end of a cycle, successful or not."""
+        self._last["cycle"][source] = self._clock()
+
+    def discovered(self, source: str = "") -> None:
+        """Record a successful topic discovery."""
+        self._last["discovery"][source] = self._clock()
+
+    def applied(self, source: str = "") -> None:
+        """Record that the connectors are up to date."""
+        self._last["apply"][source] = self._clock()
+
+    def _ages(self) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Return the age of the oldest time of each event, and its source."""
+        now = self._clock()
+        ages = {}
+        sources = {}
+        for event, times in self._last.items():
+            source = min(times, key=times.__getitem__)
+            ages[event] = now - times[source]
+            sources[event] = source
+        return ages, sources
+
+    def _details(self, ok: bool) -> Dict[str, Any]:
+        ages, sources = self._ages()
+        details: Dict[str, Any] = {"ok": ok, "seconds_since": ages}
+        if any(sources.values()):
+            details["oldest"] = sources
+        return details
+
+    def liveness(self) -> Tuple[bool, Dict[str, Any]]:
+        """Return whether the loop is alive, and the details."""
+        ages, _ = self._ages()
+        ok = ages["cycle"] <= self.liveness_threshold
+        return ok, self._details(ok)
+
+    def readiness(self) -> Tuple[bool, Dict[str, Any]]:
+        """Return whether the loop is ready, and the details."""
+        ages, _ = self._ages()
+        ok = (
+            ages["discovery"] <= self.discovery_threshold
+            and ages["apply"] <= self.apply_threshold
+        )
+        return ok, self._details(ok)
+
+
+class HealthServer:
+    """HTTP server for the health endpoints, run in a daemon thread.
+
+    Parameters
+    ----------
+    state : `HealthState`
+        The health state of the polling loop.
+    port : `int`
+        Port to listen on, ``0`` to pick a free port.
+    host : `str`
+        Address to listen on.
+    """
+
+    def __init__(
+        self, state: HealthState, port: int, host: str = "0.0.0.0"
+    ) -> None:
+        checks = {"/livez": state.liveness, "/readyz": state.readiness}
+
+        class Handler(BaseHTTPRequestHandler):
+            """Serve the health checks."""
+
+            def do_GET(self) -> None:
+                """Return 200 if the check passes, 503 otherwise."""
+                check = checks.get(self.path)
+                if check is None:
+                    self.send_error(404)
+                    return
+                ok, details = check()
+                body = json.dumps(details).encode()
+                self.send_response(200 if ok else 503)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                """Do not log the requests, probes would flood the logs."""
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """Return the port the server listens on."""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """Serve the health endpoints in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def health_options(command: F) -> F:
+    """Add the health server options to a click command."""
+    options = [
+        click.option(
+            "--health-port",
+            "health_port",
+            envvar="KAFKA_CONNECT_HEALTH_PORT",
+            default=None,
+            type=int,
+            help=(
+                "Serve the /livez and /readyz health endpoints on this port. "
+                "Alternatively set via the $KAFKA_CONNECT_HEALTH_PORT env var."
+            ),
+        ),
+        click.option(
+            "--liveness-threshold",
+            "liveness_threshold",
+            envvar="KAFKA_CONNECT_LIVENESS_THRESHOLD",
+            default=300000,
+            show_default=True,
+            type=click.IntRange(min=0),
+            help=(
+                "Maximum time, in milliseconds, since the last check cycle "
+                "before /livez fails. Alternatively set via the "
+                "$KAFKA_CONNECT_LIVENESS_THRESHOLD env var."
+            ),
+        ),
+        click.option(
+            "--discovery-threshold",
+            "discovery_threshold",
+            envvar="KAFKA_CONNECT_DISCOVERY_THRESHOLD",
+            default=300000,
+            show_default=True,
+            type=click.IntRange(min=0),
+            help=(
+                "Maximum time, in milliseconds, since the last successful "
+                "topic discovery before /readyz fails. Alternatively set via "
+                "the $KAFKA_CONNECT_DISCOVERY_THRESHOLD env var."
+            ),
+        ),
+        click.option(
+            "--apply-threshold",
+            "apply_threshold",
+            envvar="KAFKA_CONNECT_APPLY_THRESHOLD",
+            default=300000,
+            show_default=True,
+            type=click.IntRange(min=0),
+            help=(
+                "Maximum time, in milliseconds, since the connector "
+                "configuration was last successfully applied or found up to "
+                "date before /readyz fails. Alternatively set via the "
+                "$KAFKA_CONNECT_APPLY_THRESHOLD env var."
+            ),
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def start_health(
+    health_port: Optional[int],
+    liveness_threshold: int,
+    discovery_threshold: int,
+    apply_threshold: int,
+    sources: Sequence[str] = ("",),
+) -> HealthState:
+    """Create the health state and start the server if a port is set.
+
+    Thresholds are in milliseconds, like the command options.
+    """
+    state = HealthState(
+        liveness_threshold=liveness_threshold / 1000,
+        discovery_threshold=discovery_threshold / 1000,
+        apply_threshold=apply_threshold / 1000,
+        sources=sources,
+    )
+    if health_port is not None:
+        HealthServer(state, health_port).start()
+    return state
@@ -7,13 +7,19 @@ __all__ = ["create_influxdb_sink"]
 
 import json
 import time
-from typing import Set
+from pathlib import Path
+from typing import Any, Optional
 
 import click
 
+from kafkaconnect import profiling
+from kafkaconnect.applied_state import AppliedState, fingerprint
 from kafkaconnect.connect import Connect
+from kafkaconnect.health import health_options, start_health
 from kafkaconnect.influxdb_sink.config import InfluxConfig
-from kafkaconnect.topic_names_set import TopicNamesSet
+from kafkaconnect.metadata_cache import shared_cache
+from kafkaconnect.timing.timer import CycleTimer, open_timings
+from kafkaconnect.topic_store import TopicStore
 
 
 @click.command("influxdb-sink")
@@ -139,6 +145,31 @@ from kafkaconnect.topic_names_set import TopicNamesSet
         "$KAFKA_CONNECT_CHECK_INTERVAL env var."
     ),
 )
+@click.option(
+    "--timings",
+    "timings",
+    envvar="KAFKA_CONNECT_TIMINGS",
+    default=None,
+    help=(
+        "Append the duration of each phase of the --auto-update cycles to "
+        "this file as JSON lines, or to stderr with ``-``. Use the "
+        "``timing-summary`` command to report percentiles. Alternatively set "
+        "via the $KAFKA_CONNECT_TIMINGS env var."
+    ),
+)
+@click.option(
+    "--state-file",
+    "state_file",
+    envvar="KAFKA_CONNECT_STATE_FILE",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Save a fingerprint of the last applied connector configuration "
+        "to this file. On startup, validation and upload are "
+        "skipped if the saved, desired and live configurations match. "
+        "Alternatively set via the $KAFKA_CONNECT_STATE_FILE env var."
+    ),
+)
 @click.option(
     "-e",
     "--excluded_topic_regex",
@@ -227,6 +258,7 @@ from kafkaconnect.topic_names_set import TopicNamesSet
     show_default=True,
     help="Prefix to remove from topic name to use as measurement name.",
 )
+@health_options
 @click.pass_context
 def create_influxdb_sink(
     ctx: click.Context,
@@ -242,6 +274,8 @@ def create_influxdb_sink(
     auto_update: bool,
     validate: bool,
     check_interval: str,
+    timings: Optional[str],
+    state_file: Optional[Path],
     excluded_topic_regex: str,
     connect_influx_error_policy: str,
     connect_influx_max_retries: str,
@@ -250,6 +284,10 @@ def create_influxdb_sink(
     timestamp: str,
     tags: str,
     remove_prefix: str,
+    health_port: Optional[int],
+    liveness_threshold: int,
+    discovery_threshold: int,
+    apply_threshold: int,
 ) -> int:
     """Create an instance of the InfluxDB Sink connector.
 
@@ -258,7 +296,9 @@ def create_influxdb_sink(
     ``--excluded_topics`` options to help in selecting the topics
     that you want to write to InfluxDB. To check for new topics and update
     the connector configuration use the
-    ``--auto-update`` and ``--check-interval`` options.
+    ``--auto-update`` and ``--check-interval`` options. Use the
+    ``--health-port`` option to serve liveness and readiness endpoints
+    while auto-updating.
     """
     # Get configuration from the main command
     if ctx.parent:
@@ -279,14 +319,26 @@ def create_influxdb_sink(
         remove_prefix=remove_prefix,
     )
     # The variadic argument is a tuple
-    topics: Set[str] = set(topiclist)
+    topics = TopicStore(topiclist)
+    # Topics are discovered from the process-wide topic metadata cache, the
+    # maximum age is shorter than the check interval so that each cycle
+    # refreshes it
+    cache = shared_cache(config)
+    max_age = int(check_interval) / 2000
+    cache.register(name, topic_regex, excluded_topic_regex)
+    connect = Connect(connect_url=config.connect_url)
     if not topics:
         click.echo("Discoverying Kafka topics...")
-        t = TopicNamesSet.from_kafka(config, topic_regex, excluded_topic_regex)
-        topics = t.topic_names_set
+        # The metadata request overlaps with reading the live configuration
+        cache.prefetch(max_age)
+    saved = AppliedState.load(state_file) if state_file else None
+    live = None
+    if saved and not (validate or dry_run):
+        live = _live_config(connect, name)
+    if not topics:
+        topics = cache.topics(name, max_age)
         n = 0 if not topics else len(topics)
         click.echo(f"Found {n} topics.")
-    connect = Connect(connect_url=config.connect_url)
     if topics:
         influx_config.update_config(topics, timestamp)
         # --validate option returns the validation results
@@ -302,44 +354,115 @@ def create_influxdb_sink(
         if dry_run:
             click.echo(influx_config.asjson())
             return 0
-        # Validate configuration before creating the connector
-        validation = connect.validate(
-            name=influx_config.connector_class,
-            connect_config=influx_config.asjson(),
-        )
-        try:
-            error_count = json.loads(validation)["error_count"]
-            click.echo(f"Validation returned {error_count} error(s).")
-            if error_count > 0:
-                click.echo(
-                    "Use the ``--validate`` option to return the validation "
-                    "results."
-                )
+        connect_config = influx_config.asjson()
+        if saved and saved.matches(name, json.loads(connect_config), live):
+            click.echo(
+                f"The {name} connector configuration is unchanged, skipping "
+                "validation and upload."
+            )
+        else:
+            # Validate configuration before creating the connector
+            validation = connect.validate(
+                name=influx_config.connector_class,
+                connect_config=connect_config,
+            )
+            try:
+                error_count = json.loads(validation)["error_count"]
+                click.echo(f"Validation returned {error_count} error(s).")
+                if error_count > 0:
+                    click.echo(
+                        "Use the ``--validate`` option to return the "
+                        "validation results."
+                    )
+                    return 1
+            except Exception:
+                click.echo(validation)
                 return 1
-        except Exception:
-            click.echo(validation)
-            return 1
-        click.echo(f"Uploading {name} connector configuration...")
-        connect.create_or_update(
-            name=name, connect_config=influx_config.asjson()
-        )
+            click.echo(f"Uploading {name} connector configuration...")
+            result = connect.create_or_update(
+                name=name, connect_config=connect_config
+            )
+            _save_state(state_file, name, connect_config, result)
     if auto_update:
+        health = start_health(
+            health_port,
+            liveness_threshold,
+            discovery_threshold,
+            apply_threshold,
+        )
+        timer = CycleTimer(open_timings(timings))
         while True:
             time.sleep(int(check_interval) / 1000)
             try:
-                # Current list of topics from Kafka
-                t = TopicNamesSet.from_kafka(
-                    config, topic_regex, excluded_topic_regex
-                )
-                current_topics = t.topic_names_set
-                new_topics = list(set(current_topics) - set(topics))
-                if new_topics:
-                    click.echo("Found new topics, updating the connector...")
-                    influx_config.update_config(current_topics, timestamp)
-                    connect.create_or_update(
-                        name=name, connect_config=influx_config.asjson()
+                with profiling.cycle():
+                    timer.start()
+                    # Current list of topics from Kafka
+                    with timer.phase("list_topics"):
+                        cache.names(max_age)
+                    with timer.phase("filter"):
+                        current_topics = cache.topics(name, max_age)
+                    health.discovered()
+                    with timer.phase("diff"):
+                        new_topics = current_topics.difference(topics)
+                    if new_topics:
+                        click.echo(
+                            "Found new topics, updating the connector..."
+                        )
+                        with timer.phase("kcql"):
+                            influx_config.update_config(
+                                current_topics, timestamp
+                            )
+                        with timer.phase("serialize"):
+                            connect_config = influx_config.asjson()
+                        with timer.phase("put"):
+                            result = connect.create_or_update(
+                                name=name, connect_config=connect_config
+                            )
+                        try:
+                            json.loads(result)["name"]
+                        except Exception:
+                            # The connector is updated again in the next cycle
+                            click.echo(result)
+                        else:
+                            health.applied()
+                            topics = current_topics
+                            _save_state(
+                                state_file, name, connect_config, result
+                            )
+                    else:
+                        health.applied()
+                    timer.end(
+                        topics=len(current_topics), new_topics=len(new_topics)
                     )
-                    topics = current_topics
             except KeyboardInterrupt:
                 raise click.ClickException("Interruped.")
+            health.cycle()
     return 0
+
+
+def _live_config(connect: Connect, name: str) -> Optional[Any]:
+    """Return the live connector configuration, `None` on error."""
+    try:
+        return json.loads(connect.config(name))
+    except ValueError:
+        return None
+
+
+def _save_state(
+    path: Optional[Path],
+    name: str,
+    connect_config: str,
+    result: str,
+) -> None:
+    """Save the applied state if the connector was created or updated."""
+    if path is None:
+        return
+    try:
+        json.loads(result)["name"]
+    except Exception:
+        return
+    state = AppliedState(
+        name=name,
+        fingerprint=fingerprint(json.loads(connect_config)),
+    )
+    state.save(path)
@@ -6,7 +6,7 @@ See https://docs.lenses.io/connectors/sink/influx.html.
 __all__ = ["InfluxConfig"]
 
 from dataclasses import dataclass
-from typing import Set
+from typing import AbstractSet
 
 from kafkaconnect.config import ConnectorConfig
 
@@ -68,7 +68,9 @@ class InfluxConfig(ConnectorConfig):
     )
     """Stream reactor InfluxDB Sink connector class."""
 
-    def update_config(self, topics: Set[str], timestamp: str = "") -> None:
+    def update_config(
+        self, topics: AbstractSet[str], timestamp: str = ""
+    ) -> None:
         """Update connector config.
 
         Parameters
@@ -7,10 +7,19 @@ __all__ = ["create_jdbc_sink"]
 
 import json
 import time
+from dataclasses import asdict
+from typing import Optional
 
 import click
 
+from kafkaconnect.apply.plan import make_plan
 from kafkaconnect.connect import Connect
+from kafkaconnect.jdbc_sink.tuning import sample_sink, tune_batch
+from kafkaconnect.kafka_admin import admin_client
+from kafkaconnect.metadata_cache import shared_cache
+from kafkaconnect.options import offline_option
+from kafkaconnect.plugin_cache import check_locally
+from kafkaconnect.throughput import connector_topics
 
 
 @click.command("jdbc-sink")
@@ -33,6 +42,44 @@ from kafkaconnect.connect import Connect
     is_flag=True,
     help=("Validates the connector configuration without creating."),
 )
+@offline_option
+@click.option(
+    "--tune",
+    "tune",
+    type=click.Choice(["recommend", "apply"]),
+    default=None,
+    help=(
+        "Sample the input rate and the consumer lag of the connector topics "
+        "and recommend, or apply, the tasks.max, batch.size and "
+        "consumer.override.max.poll.records settings. Applied settings only "
+        "update the connector if the configuration changes. See also the "
+        "``--tune-window``, ``--catch-up`` and ``--batch-interval`` options."
+    ),
+)
+@click.option(
+    "--tune-window",
+    "tune_window",
+    default=60000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The time in milliseconds to sample the input rate and the lag.",
+)
+@click.option(
+    "--catch-up",
+    "catch_up",
+    default=600000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The target time in milliseconds to drain the consumer lag.",
+)
+@click.option(
+    "--batch-interval",
+    "batch_interval",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The target time in milliseconds between the batches of a task.",
+)
 @click.option(
     "--show-status",
     "show_status",
@@ -55,12 +102,18 @@ def create_jdbc_sink(
     configfile: str,
     name: str,
     dry_run: bool,
+    offline: bool,
+    tune: Optional[str],
+    tune_window: int,
+    catch_up: int,
+    batch_interval: int,
     show_status: bool,
     show_status_interval: int,
 ) -> int:
     """Create an instance of the JDBC Sink connector.
 
-    Use the --show-status option to output status.
+    Use the --show-status option to output status. Use the --tune option to
+    size the batches from the input rate and the lag of the topics.
     """
     # Get configuration from the parent command
     if ctx.parent:
@@ -75,6 +128,48 @@ def create_jdbc_sink(
     if name:
         config["name"] = name
 
+    if tune:
+        try:
+            live = json.loads(connect.config(config["name"]))
+        except ValueError:
+            live = None
+        client = admin_client(parent_config)
+        cache = shared_cache(parent_config, client=client)
+        topics = connector_topics(config, cache)
+        if not topics:
+            raise click.ClickException(
+                "The configuration has no topics or topics.regex setting."
+            )
+        click.echo(
+            f"Sampling the input rate and the lag of {len(topics)} topic(s) "
+            f"for {tune_window / 1000:.0f} s..."
+        )
+        sample = sample_sink(
+            client, config["name"], topics, tune_window / 1000
+        )
+        tasks = int((live or config).get("tasks.max", 1))
+        tuning = tune_batch(
+            sample, tasks, catch_up / 1000, batch_interval / 1000
+        )
+        click.echo(json.dumps(asdict(tuning), indent=4, sort_keys=True))
+        if tune == "recommend":
+            return 0
+        config.update(tuning.settings)
+        if live is not None:
+            plan = make_plan({config["name"]: config}, {config["name"]: live})
+            click.echo(plan.format())
+            if not plan.changes:
+                return 0
+
+    # Validate with the cached plugin definitions first, the server-side
+    # validation is the final check.
+    local_validation = check_locally(
+        parent_config.connect_url, config, offline
+    )
+    if dry_run and offline:
+        click.echo(json.dumps(local_validation, indent=4, sort_keys=True))
+        return 0
+
     # Validate the configuration only.
     if dry_run:
         validation = connect.validate(
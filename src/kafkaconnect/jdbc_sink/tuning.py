@@ -0,0 +1,220 @@
+"""Recommend the JDBC Sink batch settings from the input rate and lag.
+
+The input rate of the topics and the rate at which the connector consumes
+them are sampled from the end offsets and the offsets committed by the
+connector consumer group. The recommendation sizes ``tasks.max`` to drain
+the lag within a target time, and ``batch.size`` and
+``consumer.override.max.poll.records`` so that each task writes about one
+batch per batch interval.
+"""
+
+__all__ = ["SinkSample", "BatchTuning", "sample_sink", "tune_batch"]
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List
+
+from kafkaconnect.kafka_admin import (
+    Partition,
+    committed_offsets,
+    end_offsets,
+    start_offsets,
+    topic_partitions,
+)
+from kafkaconnect.lag.consumer import group_id
+
+if TYPE_CHECKING:
+    from confluent_kafka.admin import AdminClient
+
+MIN_BATCH_SIZE = 100
+"""Smallest recommended ``batch.size``."""
+
+MAX_BATCH_SIZE = 10000
+"""Largest recommended ``batch.size``."""
+
+
+@dataclass
+class SinkSample:
+    """Input rate, consumption rate and lag of a sink connector."""
+
+    partitions: int
+    """Number of partitions of the connector topics."""
+
+    rate: float
+    """Input rate of the topics, in messages per second."""
+
+    consumed: float
+    """Rate at which the connector consumes, in messages per second."""
+
+    lag: int
+    """Lag at the end of the sampling window, in messages."""
+
+    lag_rate: float
+    """Rate of change of the lag, in messages per second."""
+
+
+@dataclass
+class BatchTuning:
+    """Recommended JDBC Sink batch settings."""
+
+    settings: Dict[str, str]
+    """The recommended connector configuration settings."""
+
+    sample: Dict[str, Any] = field(default_factory=dict)
+    """The measured rates and lag."""
+
+    reasons: List[str] = field(default_factory=list)
+    """The reasoning behind the recommendation."""
+
+
+def sample_sink(
+    client: "AdminClient",
+    name: str,
+    topics: Iterable[str],
+    window: float,
+    timeout: float = 10,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> SinkSample:
+    """Sample the rates and the lag of a sink connector.
+
+    The end offsets and the committed offsets of all partitions are
+    requested at the start and at the end of the window, with one batched
+    request each, and the start offsets of the partitions without a
+    committed offset, which are consumed from there. Retention may have
+    moved the start offset above zero.
+    """
+    partitions = [
+        (topic, partition)
+        for topic, ids in topic_partitions(client, topics, timeout).items()
+        for partition in ids
+    ]
+    group = group_id(name)
+
+    def offsets() -> Dict[str, Dict[Partition, int]]:
+        ends = end_offsets(client, partitions, timeout)
+        committed = committed_offsets(client, {group: partitions}, timeout)
+        sample = {"end": ends, "committed": committed.get(group, {})}
+        missing = [tp for tp in partitions if tp not in sample["committed"]]
+        sample["start"] = start_offsets(client, missing, timeout)
+        return sample
+
+    start = clock()
+    before = offsets()
+    sleep(window)
+    after = offsets()
+    elapsed = max(clock() - start, 1e-9)
+
+    def position(
+        sample: Dict[str, Dict[Partition, int]], tp: Partition
+    ) -> int:
+        # Partitions without committed offsets are consumed from the start
+        return sample["committed"].get(tp, sample["start"].get(tp, 0))
+
+    def lag(sample: Dict[str, Dict[Partition, int]]) -> int:
+        return sum(
+            sample["end"][tp] - position(sample, tp) for tp in partitions
+        )
+
+    consumed = sum(
+        # A start offset moved by retention is not consumption
+        after["committed"][tp] - position(before, tp)
+        for tp in partitions
+        if tp in after["committed"]
+    )
+    lag_before = lag(before)
+    lag_after = lag(after)
+    return SinkSample(
+        partitions=len(partitions),
+        rate=sum(after["end"][tp] - before["end"][tp] for tp in partitions)
+        / elapsed,
+        consumed=consumed / elapsed,
+        lag=max(0, lag_after),
+        lag_rate=(lag_after - lag_before) / elapsed,
+    )
+
+
+def _batch_size(records: float) -> int:
+    """Round a batch size up to a multiple of 100, within bounds."""
+    size = math.ceil(records / 100) * 100
+    return min(MAX_BATCH_SIZE, max(MIN_BATCH_SIZE, size))
+
+
+def tune_batch(
+    sample: SinkSample,
+    tasks: int,
+    catch_up: float,
+    batch_interval: float,
+) -> BatchTuning:
+    """Recommend the batch settings.
+
+    Parameters
+    ----------
+    sample : `SinkSample`
+        The sampled rates and lag of the connector.
+    tasks : `int`
+        The current ``tasks.max`` of the connector.
+    catch_up : `float`
+        Target time, in seconds, to drain the lag.
+    batch_interval : `float`
+        Target time, in seconds, between the batches written by a task.
+    """
+    need = sample.rate + sample.lag / catch_up
+    reasons = [
+        f"The topics receive {sample.rate:.1f} msg/s and the connector "
+        f"consumed {sample.consumed:.1f} msg/s with {tasks} task(s). The lag "
+        f"is {sample.lag} messages, changing by {sample.lag_rate:+.1f} msg/s.",
+        f"Keeping up and draining the lag in {catch_up:.0f} s requires "
+        f"{need:.1f} msg/s.",
+    ]
+
+    recommended = tasks
+    if sample.consumed >= need or sample.lag == 0:
+        reasons.append(f"tasks.max={tasks}: the connector keeps up.")
+    elif sample.consumed <= 0:
+        reasons.append(
+            f"tasks.max={tasks}: the connector consumed nothing during the "
+            "sampling window, check its status before scaling it."
+        )
+    else:
+        per_task = sample.consumed / tasks
+        recommended = min(
+            max(sample.partitions, 1), math.ceil(need / per_task)
+        )
+        recommended = max(recommended, tasks)
+        reasons.append(
+            f"tasks.max={recommended}: each task consumes about "
+            f"{per_task:.1f} msg/s, at most one task per partition "
+            f"({sample.partitions})."
+        )
+        if recommended * per_task < need:
+            reasons.append(
+                "More partitions are needed to keep up, the larger batches "
+                "below reduce the per-record cost of each task."
+            )
+
+    batch_size = _batch_size(need / recommended * batch_interval)
+    reasons.append(
+        f"batch.size={batch_size}: each task receives "
+        f"{need / recommended:.1f} msg/s, about one batch every "
+        f"{batch_interval:.0f} s."
+    )
+    reasons.append(
+        f"consumer.override.max.poll.records={batch_size}: a batch holds at "
+        "most the records of one poll. Requires the "
+        "connector.client.config.override.policy worker setting."
+    )
+    settings = {
+        "tasks.max": str(recommended),
+        "batch.size": str(batch_size),
+        "consumer.override.max.poll.records": str(batch_size),
+    }
+    sampled = {
+        "rate": round(sample.rate, 3),
+        "consumed": round(sample.consumed, 3),
+        "lag": sample.lag,
+        "lag_rate": round(sample.lag_rate, 3),
+        "partitions": sample.partitions,
+    }
+    return BatchTuning(settings=settings, sample=sampled, reasons=reasons)
@@ -0,0 +1,283 @@
+"""Helpers for the Kafka admin client."""
+
+__all__ = [
+    "kafka_config",
+    "admin_client",
+    "consumer_client",
+    "list_topic_names",
+    "describe_partitions",
+    "topic_partitions",
+    "end_offsets",
+    "start_offsets",
+    "committed_offsets",
+]
+
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from kafkaconnect.config import Config
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from confluent_kafka import Consumer
+    from confluent_kafka.admin import AdminClient
+
+Partition = Tuple[str, int]
+"""A topic name and partition number."""
+
+logger = logging.getLogger("kafkaconnect")
+
+SECURITY_PROTOCOL = "SASL_PLAINTEXT"
+SASL_MECHANISM = "SCRAM-SHA-512"
+
+DESCRIBE_BATCH_SIZE = 500
+"""Maximum number of topics in a ``DescribeTopics`` request."""
+
+
+def kafka_config(
+    config: Config, broker_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """Return the Kafka client configuration.
+
+    SASL authentication is configured if the username and password are set.
+
+    Parameters
+    ----------
+    config : `Config`
+        The application configuration.
+    broker_url : `str`, optional
+        Kafka broker URL to use instead of ``config.broker_url``, for
+        example to connect to a MirrorMaker 2 source or target cluster.
+    """
+    broker_url = broker_url or config.broker_url
+    if config.sasl_plain_username and config.sasl_plain_password:
+        return {
+            "bootstrap.servers": broker_url,
+            "security.protocol": SECURITY_PROTOCOL,
+            "sasl.mechanisms": SASL_MECHANISM,
+            "sasl.username": config.sasl_plain_username,
+            "sasl.password": config.sasl_plain_password,
+        }
+    elif (
+        config.sasl_plain_username is None
+        and config.sasl_plain_password is None
+    ):
+        return {"bootstrap.servers": broker_url}
+    else:
+        raise ValueError(
+            "Both or neither of 'config.sasl_plain_username' "
+            "and 'config.sasl_plain_password' must be set."
+        )
+
+
+def admin_client(
+    config: Config, broker_url: Optional[str] = None
+) -> "AdminClient":
+    """Create a Kafka admin client.
+
+    A single admin client can be reused across requests, which avoids
+    bootstrapping a new connection to the brokers each time.
+    """
+    broker_url = broker_url or config.broker_url
+    # confluent_kafka is a large C extension, import it only when needed
+    from confluent_kafka import KafkaException
+    from confluent_kafka.admin import AdminClient
+
+    try:
+        return AdminClient(kafka_config(config, broker_url))
+    except KafkaException:
+        message = f"Failed to establish connection with broker {broker_url}."
+        logger.error(message)
+        raise
+
+
+def consumer_client(
+    config: Config, broker_url: Optional[str] = None, **overrides: Any
+) -> "Consumer":
+    """Create a Kafka consumer that does not commit offsets.
+
+    The consumer is meant for reading topics with manually assigned
+    partitions, ``overrides`` are added to the consumer configuration.
+    """
+    from confluent_kafka import Consumer
+
+    consumer_config = {
+        **kafka_config(config, broker_url),
+        "group.id": "kafkaconnect",
+        "enable.auto.commit": False,
+        **overrides,
+    }
+    return Consumer(consumer_config)
+
+
+def list_topic_names(client: "AdminClient", timeout: float = 10) -> List[str]:
+    """Return the names of the topics in the Kafka cluster."""
+    return list(client.list_topics(timeout=timeout).topics)
+
+
+def describe_partitions(
+    client: "AdminClient",
+    topics: Iterable[str],
+    timeout: float = 10,
+    batch_size: int = DESCRIBE_BATCH_SIZE,
+) -> Dict[str, "Future"]:
+    """Request the description of topics without waiting for the results.
+
+    The topics are described in batches of ``batch_size`` topics, and all
+    batches are sent before any result is awaited. Only the requested
+    topics are described, unlike a metadata request for the whole cluster.
+
+    Returns
+    -------
+    futures : `dict`
+        Mapping of topic names to futures of their ``TopicDescription``.
+    """
+    from confluent_kafka import TopicCollection
+
+    names = sorted(set(topics))
+    futures: Dict[str, "Future"] = {}
+    for i in range(0, len(names), batch_size):
+        futures.update(
+            client.describe_topics(
+                TopicCollection(names[i : i + batch_size]),
+                request_timeout=timeout,
+            )
+        )
+    return futures
+
+
+def topic_partitions(
+    client: "AdminClient",
+    topics: Optional[Iterable[str]] = None,
+    timeout: float = 10,
+) -> Dict[str, List[int]]:
+    """Return the partitions of the topics.
+
+    The given topics are described in batched requests, see
+    `describe_partitions`, and topics that do not exist are omitted. All
+    topics are returned with a single metadata request if ``topics`` is
+    `None`.
+    """
+    if topics is None:
+        metadata = client.list_topics(timeout=timeout).topics
+        return {
+            name: sorted(topic.partitions) for name, topic in metadata.items()
+        }
+
+    from confluent_kafka import KafkaError, KafkaException
+
+    partitions = {}
+    for name, future in describe_partitions(client, topics, timeout).items():
+        try:
+            description = future.result()
+        except KafkaException as e:
+            if e.args[0].code() == KafkaError.UNKNOWN_TOPIC_OR_PART:
+                continue
+            raise
+        partitions[name] = sorted(p.id for p in description.partitions)
+    return partitions
+
+
+def end_offsets(
+    client: "AdminClient",
+    partitions: Iterable[Partition],
+    timeout: float = 10,
+) -> Dict[Partition, int]:
+    """Return the end (high watermark) offset of the partitions.
+
+    The offsets of all partitions are requested in a single batched
+    ``ListOffsets`` call, which the client sends as one request per
+    partition leader.
+    """
+    from confluent_kafka.admin import OffsetSpec
+
+    return _list_offsets(client, partitions, OffsetSpec.latest(), timeout)
+
+
+def start_offsets(
+    client: "AdminClient",
+    partitions: Iterable[Partition],
+    timeout: float = 10,
+) -> Dict[Partition, int]:
+    """Return the start (low watermark) offset of the partitions.
+
+    The start offset is above zero once retention deleted the first
+    records. The offsets are requested like in `end_offsets`.
+    """
+    from confluent_kafka.admin import OffsetSpec
+
+    return _list_offsets(client, partitions, OffsetSpec.earliest(), timeout)
+
+
+def _list_offsets(
+    client: "AdminClient",
+    partitions: Iterable[Partition],
+    spec: Any,
+    timeout: float,
+) -> Dict[Partition, int]:
+    """Return the offsets of the partitions for an ``OffsetSpec``."""
+    from confluent_kafka import TopicPartition
+
+    request = {
+        TopicPartition(topic, partition): spec
+        for topic, partition in partitions
+    }
+    if not request:
+        return {}
+    futures = client.list_offsets(request, request_timeout=timeout)
+    return {
+        (tp.topic, tp.partition): future.result().offset
+        for tp, future in futures.items()
+    }
+
+
+def committed_offsets(
+    client: "AdminClient",
+    groups: Mapping[str, Iterable[Partition]],
+    timeout: float = 10,
+) -> Dict[str, Dict[Partition, int]]:
+    """Return the committed offsets of consumer groups.
+
+    The admin API accepts a single group per request, so the requests for
+    all groups are sent before waiting for any result. Partitions without a
+    committed offset are omitted.
+
+    Parameters
+    ----------
+    client : `AdminClient`
+        The Kafka admin client.
+    groups : `dict`
+        Mapping of consumer group ids to the partitions to look up.
+    timeout : `float`
+        Request timeout, in seconds.
+    """
+    from confluent_kafka import ConsumerGroupTopicPartitions, TopicPartition
+
+    futures = {}
+    for group, partitions in groups.items():
+        request = ConsumerGroupTopicPartitions(
+            group, [TopicPartition(t, p) for t, p in partitions]
+        )
+        futures.update(
+            client.list_consumer_group_offsets(
+                [request], request_timeout=timeout
+            )
+        )
+    return {
+        group: {
+            (tp.topic, tp.partition): tp.offset
+            for tp in future.result().topic_partitions
+            if tp.offset >= 0
+        }
+        for group, future in futures.items()
+    }
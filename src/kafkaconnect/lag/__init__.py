@@ -0,0 +1 @@
+"""Report how far connectors are behind the topics they read."""
@@ -0,0 +1,74 @@
+"""CLI to show the consumer lag of sink connectors."""
+
+__all__ = ["lag"]
+
+import json
+from typing import Any, Dict, List, Optional
+
+import click
+
+from kafkaconnect.connect import Connect, ConnectError
+from kafkaconnect.kafka_admin import admin_client
+from kafkaconnect.lag.consumer import fetch_topics, group_id, sink_lag
+from kafkaconnect.lag.report import lag_report
+from kafkaconnect.snapshot import ConnectSnapshot
+
+
+@click.command("lag")
+@click.argument("name", required=False)
+@click.option(
+    "-a",
+    "--all",
+    "all_connectors",
+    is_flag=True,
+    help="Show the lag of all sink connectors.",
+)
+@click.pass_context
+def lag(ctx: click.Context, name: Optional[str], all_connectors: bool) -> int:
+    """Show the consumer lag of a sink connector.
+
+    The lag is computed per topic and partition from the end offsets and
+    the offsets committed by the ``connect-<name>`` consumer group, for the
+    active topics of the connector. Use --all to show the lag of all sink
+    connectors.
+    """
+    if bool(name) == all_connectors:
+        raise click.UsageError("Provide either a connector NAME or --all.")
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+
+    names: List[str]
+    if all_connectors:
+        try:
+            snapshot = ConnectSnapshot.from_connect(connect, ("status",))
+        except ConnectError as e:
+            raise click.ClickException(str(e))
+        names = [
+            n
+            for n, status in snapshot.statuses.items()
+            if status and status.get("type") == "sink"
+        ]
+    else:
+        names = [name] if name else []
+
+    topics = fetch_topics(connect, names)
+    missing = [n for n, t in topics.items() if t is None]
+    if name and missing:
+        raise click.ClickException(connect.topics(name))
+    lags = sink_lag(
+        admin_client(config),
+        {n: t for n, t in topics.items() if t is not None},
+    )
+
+    reports: Dict[str, Any] = {
+        n: {"group": group_id(n), **lag_report(lags[n])} for n in sorted(lags)
+    }
+    if name:
+        click.echo(json.dumps(reports[name], indent=4, sort_keys=True))
+    else:
+        output = {
+            "lag": sum(r["lag"] for r in reports.values()),
+            "connectors": reports,
+        }
+        click.echo(json.dumps(output, indent=4, sort_keys=True))
+    return 0
@@ -0,0 +1,106 @@
+"""Measure the consumer lag of sink connectors."""
+
+__all__ = ["group_id", "fetch_topics", "sink_lag"]
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence
+
+from kafkaconnect.connect import Connect
+from kafkaconnect.kafka_admin import (
+    Partition,
+    committed_offsets,
+    end_offsets,
+    start_offsets,
+    topic_partitions,
+)
+
+if TYPE_CHECKING:
+    from confluent_kafka.admin import AdminClient
+
+
+def group_id(name: str) -> str:
+    """Return the consumer group id of a sink connector."""
+    return f"connect-{name}"
+
+
+def fetch_topics(
+    connect: Connect, names: Sequence[str], max_workers: int = 8
+) -> Dict[str, Optional[List[str]]]:
+    """Fetch the active topics of the connectors concurrently.
+
+    The topics are `None` for connectors whose topics could not be fetched.
+    """
+
+    def fetch(name: str) -> Optional[List[str]]:
+        try:
+            return json.loads(connect.topics(name))[name]["topics"]
+        except (ValueError, KeyError):
+            return None
+
+    if not names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as ex:
+        return dict(zip(names, ex.map(fetch, names)))
+
+
+def sink_lag(
+    client: "AdminClient",
+    topics: Mapping[str, Sequence[str]],
+    timeout: float = 10,
+) -> Dict[str, Dict[Partition, int]]:
+    """Return the lag of the sink connectors per partition.
+
+    The partitions and end offsets of all topics are fetched with one
+    metadata request and one batched offsets request, and the committed
+    offsets of all connectors are requested concurrently. Partitions
+    without a committed offset are consumed from their start offset,
+    which retention may have moved above zero, requested with one more
+    batched offsets request.
+
+    Parameters
+    ----------
+    client : `AdminClient`
+        The Kafka admin client.
+    topics : `dict`
+        Mapping of connector names to the topics they consume.
+    timeout : `float`
+        Request timeout, in seconds.
+    """
+    names = {
+        t for connector_topics in topics.values() for t in connector_topics
+    }
+    partitions = topic_partitions(client, names, timeout=timeout)
+    connector_partitions = {
+        name: [
+            (t, p)
+            for t in sorted(connector_topics)
+            for p in partitions.get(t, [])
+        ]
+        for name, connector_topics in topics.items()
+    }
+    ends = end_offsets(
+        client,
+        [(t, p) for t, ps in partitions.items() for p in ps],
+        timeout=timeout,
+    )
+    committed = committed_offsets(
+        client,
+        {group_id(n): tps for n, tps in connector_partitions.items() if tps},
+        timeout=timeout,
+    )
+    missing = {
+        tp
+        for name, tps in connector_partitions.items()
+        for tp in tps
+        if tp not in committed.get(group_id(name), {})
+    }
+    starts = start_offsets(client, sorted(missing), timeout=timeout)
+    lags = {}
+    for name, tps in connector_partitions.items():
+        offsets = committed.get(group_id(name), {})
+        lags[name] = {
+            tp: max(0, ends[tp] - offsets.get(tp, starts.get(tp, 0)))
+            for tp in tps
+        }
+    return lags
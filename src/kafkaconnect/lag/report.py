@@ -0,0 +1,66 @@
+"""Aggregate partition lags into a per-topic report."""
+
+__all__ = ["lag_report"]
+
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from kafkaconnect.kafka_admin import Partition
+
+
+def _rate(
+    lag: int, previous: Optional[int], elapsed: float
+) -> Optional[float]:
+    """Return the lag rate of change, in messages per second."""
+    if previous is None or elapsed <= 0:
+        return None
+    return round((lag - previous) / elapsed, 3)
+
+
+def lag_report(
+    lags: Mapping[Partition, int],
+    previous: Optional[Mapping[Partition, int]] = None,
+    elapsed: float = 0.0,
+) -> Dict[str, Any]:
+    """Return the per-partition and per-topic lag, and the totals.
+
+    Parameters
+    ----------
+    lags : `dict`
+        Mapping of (topic, partition) to the lag, in messages.
+    previous : `dict`, optional
+        The lags of a previous sample. If provided, the rate of change of
+        the lag is reported. A negative rate means the lag is decreasing.
+    elapsed : `float`
+        Time, in seconds, between the previous sample and ``lags``.
+
+    Returns
+    -------
+    report : `dict`
+        The lag report, with ``rate`` set to `None` if it is unknown.
+    """
+    previous = previous or {}
+    topics: Dict[str, Dict[str, Any]] = {}
+    for (topic, partition), lag in sorted(lags.items()):
+        entry = topics.setdefault(topic, {"lag": 0, "partitions": {}})
+        entry["lag"] += lag
+        entry["partitions"][str(partition)] = {
+            "lag": lag,
+            "rate": _rate(lag, previous.get((topic, partition)), elapsed),
+        }
+
+    def total(keys: Iterable[Partition]) -> Optional[int]:
+        values = [previous.get(key) for key in keys]
+        if not values or None in values:
+            return None
+        return sum(value for value in values if value is not None)
+
+    for topic, entry in topics.items():
+        keys = [(topic, int(partition)) for partition in entry["partitions"]]
+        entry["rate"] = _rate(entry["lag"], total(keys), elapsed)
+
+    total_lag = sum(lags.values())
+    return {
+        "lag": total_lag,
+        "rate": _rate(total_lag, total(lags), elapsed),
+        "topics": topics,
+    }
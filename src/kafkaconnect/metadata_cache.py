@@ -0,0 +1,221 @@
+"""A process-wide cache of the topic names in Kafka.
+
+Connectors that discover their topics evaluate their own select and exclude
+regexes against the same cached list of topic names, so that managing N
+connectors costs one metadata request per refresh instead of N. The cache
+is refreshed by a single caller when it is older than its TTL, concurrent
+callers wait for that refresh instead of sending their own request. The
+refresh can also run in the background, overlapping with other work.
+"""
+
+__all__ = [
+    "DEFAULT_TTL",
+    "TopicFilter",
+    "TopicMetadataCache",
+    "shared_cache",
+    "topic_filter",
+]
+
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from kafkaconnect.config import Config
+from kafkaconnect.kafka_admin import (
+    admin_client,
+    kafka_config,
+    list_topic_names,
+)
+from kafkaconnect.topic_names_set import TopicNamesSet
+from kafkaconnect.topic_store import TopicStore
+
+if TYPE_CHECKING:
+    from confluent_kafka.admin import AdminClient
+
+DEFAULT_TTL = 10.0
+"""Default maximum age, in seconds, of the shared topic names."""
+
+
+class TopicFilter:
+    """Select topics with a regex and exclude others with a second regex.
+
+    The result is reused as long as the filter is applied to the same list
+    of topic names, so connectors sharing a filter evaluate it once per
+    refresh of the cache.
+    """
+
+    def __init__(
+        self, select_regex: str = ".*", exclude_regex: Optional[str] = None
+    ) -> None:
+        self.select_regex = select_regex
+        self.exclude_regex = exclude_regex
+        self._names: Optional[Iterable[str]] = None
+        self._topics = TopicStore()
+
+    def apply(self, names: Iterable[str]) -> TopicStore:
+        """Return the selected topics.
+
+        The returned store shares its strings with ``names`` if it is a
+        `TopicStore`.
+        """
+        if names is not self._names:
+            self._topics = TopicNamesSet(
+                names, self.select_regex, self.exclude_regex
+            ).topic_names_set
+            self._names = names
+        return self._topics
+
+
+@functools.lru_cache(maxsize=None)
+def topic_filter(
+    select_regex: str = ".*", exclude_regex: Optional[str] = None
+) -> TopicFilter:
+    """Return the process-wide filter for a pair of regexes."""
+    return TopicFilter(select_regex, exclude_regex)
+
+
+class TopicMetadataCache:
+    """Cache the topic names in Kafka for a limited time.
+
+    Parameters
+    ----------
+    list_topics : `Callable`
+        Blocking function that returns the topic names in Kafka.
+    ttl : `float`
+        Default maximum age, in seconds, of the cached topic names. Callers
+        that need fresher names pass their own ``max_age``.
+    clock : `Callable`
+        Monotonic clock, for testing.
+    """
+
+    def __init__(
+        self,
+        list_topics: Callable[[], Iterable[str]],
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._list_topics = list_topics
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._names: Optional[TopicStore] = None
+        self._previous: Optional[TopicStore] = None
+        self._fetched_at = 0.0
+        self._filters: Dict[str, TopicFilter] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.refreshes = 0
+        """Number of metadata requests sent."""
+
+    def names(self, max_age: Optional[float] = None) -> TopicStore:
+        """Return the sorted topic names, refreshing them if too old.
+
+        The same store is returned until the next refresh. The names that
+        did not change share their strings with the previous refresh.
+
+        Parameters
+        ----------
+        max_age : `float`, optional
+            Maximum age, in seconds, of the names for this call, by default
+            the TTL of the cache. ``0`` always sends a metadata request.
+        """
+        if max_age is None:
+            max_age = self.ttl
+        with self._lock:
+            if (
+                self._names is None
+                or self._clock() - self._fetched_at >= max_age
+            ):
+                self._names = TopicStore(
+                    self._list_topics(), previous=self._previous
+                )
+                self._previous = self._names
+                self._fetched_at = self._clock()
+                self.refreshes += 1
+            return self._names
+
+    def prefetch(
+        self, max_age: Optional[float] = None
+    ) -> "Future[TopicStore]":
+        """Refresh the topic names in the background if they are too old.
+
+        The metadata request is sent from a thread of the cache, so that it
+        overlaps with other work such as Connect API requests. Concurrent
+        calls to `names` still send a single request. See `names` for
+        ``max_age``.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="topic-metadata"
+                )
+            return self._executor.submit(self.names, max_age)
+
+    def invalidate(self) -> None:
+        """Refresh the topic names on the next call."""
+        with self._lock:
+            self._names = None
+
+    def register(
+        self,
+        name: str,
+        select_regex: str = ".*",
+        exclude_regex: Optional[str] = None,
+    ) -> None:
+        """Register the topic filter of a connector."""
+        self._filters[name] = topic_filter(select_regex, exclude_regex)
+
+    def topics(self, name: str, max_age: Optional[float] = None) -> TopicStore:
+        """Return the topics selected by a registered connector filter.
+
+        See `names` for ``max_age``.
+        """
+        return self._filters[name].apply(self.names(max_age))
+
+
+_caches: Dict[Tuple[Tuple[str, Any], ...], TopicMetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_cache(
+    config: Config, client: Optional["AdminClient"] = None
+) -> TopicMetadataCache:
+    """Return the process-wide cache of a Kafka cluster.
+
+    The caches are keyed by the Kafka client configuration, so that
+    configurations with different credentials do not share the admin client
+    or the topic names. The cache TTL is `DEFAULT_TTL`, callers that need
+    fresher names pass a ``max_age`` to `TopicMetadataCache.names`.
+
+    Parameters
+    ----------
+    config : `Config`
+        The application configuration.
+    client : `AdminClient`, optional
+        The admin client used to refresh the cache if it does not exist, by
+        default a client is created on the first refresh.
+    """
+    key = tuple(sorted(kafka_config(config).items()))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            clients = [client] if client else []
+
+            def list_topics() -> List[str]:
+                if not clients:
+                    clients.append(admin_client(config))
+                return list_topic_names(clients[0], timeout=10)
+
+            cache = TopicMetadataCache(list_topics, DEFAULT_TTL)
+            _caches[key] = cache
+        return cache
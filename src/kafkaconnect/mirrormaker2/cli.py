@@ -3,14 +3,25 @@
 https://cwiki.apache.org/confluence/display/KAFKA/KIP-382%3A+MirrorMaker+2.0
 """
 
-__all__ = ["create_mirrormaker2"]
+__all__ = ["create_mirrormaker2", "mm2_lag"]
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
 import click
 
 from kafkaconnect.connect import Connect
+from kafkaconnect.kafka_admin import Partition, admin_client, consumer_client
+from kafkaconnect.lag.report import lag_report
+from kafkaconnect.mirrormaker2.lag import (
+    MirrorTopology,
+    OffsetSyncReader,
+    offset_syncs_topic,
+    sample_lag,
+)
+from kafkaconnect.wait import fetch_statuses, wait_for_state
 
 
 @click.command("mirrormaker2")
@@ -70,6 +81,22 @@ from kafkaconnect.connect import Connect
     show_default=True,
     help=("The time interval in milliseconds to output the connector status."),
 )
+@click.option(
+    "--wait-running",
+    "wait_running",
+    is_flag=True,
+    help=(
+        "Wait until the three connectors and their tasks are RUNNING. See "
+        "also the ``--wait-timeout`` option."
+    ),
+)
+@click.option(
+    "--wait-timeout",
+    "wait_timeout",
+    default=120000,
+    show_default=True,
+    help="The time in milliseconds to wait for the connectors to be RUNNING.",
+)
 @click.pass_context
 def create_mirrormaker2(
     ctx: click.Context,
@@ -80,11 +107,14 @@ def create_mirrormaker2(
     dry_run: bool,
     show_status: bool,
     show_status_interval: int,
+    wait_running: bool,
+    wait_timeout: int,
 ) -> int:
     """Create an instance of the MirrorMaker 2 connectors.
 
     Create the heartbeat, checkpoint and mirror-source
-    connectors. Use the --show-status option to output status.
+    connectors concurrently. Use the --wait-running option to wait until
+    they are running and the --show-status option to output status.
     """
     # Get configuration from the main command
     if ctx.parent:
@@ -107,55 +137,203 @@ def create_mirrormaker2(
         checkpoint_config["name"] = f"{name}-checkpoint"
         mirror_source_config["name"] = f"{name}-mirror-source"
 
-    # Validate the configuration only.
-    if dry_run:
-        heartbeat_validation = connect.validate(
-            name=heartbeat_config["connector.class"],
-            connect_config=json.dumps(heartbeat_config),
-        )
-        click.echo(heartbeat_validation)
-        checkpoint_validation = connect.validate(
-            name=checkpoint_config["connector.class"],
-            connect_config=json.dumps(checkpoint_config),
-        )
-        click.echo(checkpoint_validation)
-        mirror_source_validation = connect.validate(
-            name=mirror_source_config["connector.class"],
-            connect_config=json.dumps(mirror_source_config),
-        )
-        click.echo(mirror_source_validation)
-        return 0
-
-    heartbeat_name = heartbeat_config["name"]
-    click.echo(f"Creating the {heartbeat_name} connector...")
-    click.echo(
-        connect.validate_and_create(
-            heartbeat_name, json.dumps(heartbeat_config)
-        )
-    )
-    checkpoint_name = checkpoint_config["name"]
-    click.echo(f"Creating the {checkpoint_name} connector...")
-    click.echo(
-        connect.validate_and_create(
-            checkpoint_name, json.dumps(checkpoint_config)
+    configs = [heartbeat_config, checkpoint_config, mirror_source_config]
+    names = [c["name"] for c in configs]
+
+    # The three connectors are independent, validate and create them
+    # concurrently.
+    with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+        # Validate the configuration only.
+        if dry_run:
+            validations = executor.map(
+                lambda c: connect.validate(
+                    name=c["connector.class"], connect_config=json.dumps(c)
+                ),
+                configs,
+            )
+            for validation in validations:
+                click.echo(validation)
+            return 0
+
+        click.echo(f"Creating the {', '.join(names)} connectors...")
+        results = executor.map(
+            lambda c: connect.validate_and_create(c["name"], json.dumps(c)),
+            configs,
         )
-    )
-    mirror_source_name = mirror_source_config["name"]
-    click.echo(f"Creating the {mirror_source_name} connector...")
-    click.echo(
-        connect.validate_and_create(
-            mirror_source_name, json.dumps(mirror_source_config)
+        for result in results:
+            click.echo(result)
+
+    if wait_running:
+        click.echo("Waiting for the connectors to be RUNNING...")
+        states = wait_for_state(
+            connect, names, "RUNNING", timeout=wait_timeout / 1000
         )
-    )
+        for name in names:
+            click.echo(f"{name}: {states[name]}")
+        if any(state != "RUNNING" for state in states.values()):
+            raise click.ClickException(
+                "Timed out waiting for the connectors to be RUNNING."
+            )
 
     if show_status:
         while True:
             time.sleep(int(show_status_interval) / 1000)
             try:
-                click.echo(connect.status(name=heartbeat_name))
-                click.echo(connect.status(name=checkpoint_name))
-                click.echo(connect.status(name=mirror_source_name))
+                statuses = fetch_statuses(connect, names)
+                for name in names:
+                    status = statuses[name]
+                    click.echo(
+                        json.dumps(status, indent=4, sort_keys=True)
+                        if status
+                        else connect.status(name=name)
+                    )
             except KeyboardInterrupt:
                 raise click.ClickException("Interruped.")
 
     return 0
+
+
+@click.command("mm2-lag")
+@click.argument("name", required=False)
+@click.option(
+    "--source-broker",
+    "source_broker",
+    default=None,
+    help=(
+        "Source cluster broker URL. Defaults to the "
+        "``source.cluster.bootstrap.servers`` connector configuration."
+    ),
+)
+@click.option(
+    "--target-broker",
+    "target_broker",
+    default=None,
+    help=(
+        "Target cluster broker URL. Defaults to the "
+        "``target.cluster.bootstrap.servers`` connector configuration, "
+        "or the --broker option."
+    ),
+)
+@click.option(
+    "--source-alias",
+    "source_alias",
+    default=None,
+    help="Source cluster alias. Defaults to the connector configuration.",
+)
+@click.option(
+    "--target-alias",
+    "target_alias",
+    default=None,
+    help="Target cluster alias. Defaults to the connector configuration.",
+)
+@click.option(
+    "--topic-regex",
+    "topic_regex",
+    default=None,
+    help=(
+        "Regex for selecting the source topics. Defaults to the ``topics`` "
+        "connector configuration."
+    ),
+)
+@click.option(
+    "--samples",
+    "samples",
+    default=2,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of lag samples, the rate of change needs at least two.",
+)
+@click.option(
+    "--interval",
+    "interval",
+    default=5000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="The time interval in milliseconds between lag samples.",
+)
+@click.pass_context
+def mm2_lag(
+    ctx: click.Context,
+    name: Optional[str],
+    source_broker: Optional[str],
+    target_broker: Optional[str],
+    source_alias: Optional[str],
+    target_alias: Optional[str],
+    topic_regex: Optional[str],
+    samples: int,
+    interval: int,
+) -> int:
+    """Show the replication lag of a MirrorMaker 2 instance.
+
+    The lag of each source partition is computed from the source and
+    target end offsets and the MirrorMaker 2 offset syncs. NAME is the
+    mirror-source connector, its configuration provides the cluster aliases,
+    brokers and topics, which can be overridden with the options. The SASL
+    credentials of the main command are used for both clusters.
+    """
+    config = ctx.obj["config"]
+    if name:
+        connect = Connect(config.connect_url)
+        result = connect.config(name)
+        try:
+            connector_config = json.loads(result)
+        except ValueError:
+            raise click.ClickException(result)
+        topology = MirrorTopology.from_connector_config(connector_config)
+    elif source_alias and target_alias:
+        topology = MirrorTopology(source_alias, target_alias)
+    else:
+        raise click.UsageError(
+            "Provide the mirror-source connector NAME or the --source-alias "
+            "and --target-alias options."
+        )
+    topology.source_alias = source_alias or topology.source_alias
+    topology.target_alias = target_alias or topology.target_alias
+    topology.topics = topic_regex or topology.topics
+    topology.source_broker = source_broker or topology.source_broker
+    topology.target_broker = (
+        target_broker or topology.target_broker or config.broker_url
+    )
+    if not topology.source_broker:
+        raise click.UsageError("The source cluster broker URL is not set.")
+
+    source = admin_client(config, topology.source_broker)
+    target = admin_client(config, topology.target_broker)
+    topic = offset_syncs_topic(topology.target_alias)
+    reader = OffsetSyncReader(
+        consumer_client(
+            config,
+            (
+                topology.target_broker
+                if topology.offset_syncs_on_target
+                else topology.source_broker
+            ),
+        ),
+        topic,
+    )
+
+    lags: Dict[Partition, int] = {}
+    previous: Optional[Dict[Partition, int]] = None
+    sampled_at = previous_at = 0.0
+    try:
+        for sample in range(samples):
+            if sample:
+                time.sleep(interval / 1000)
+                previous, previous_at = lags, sampled_at
+            sampled_at = time.monotonic()
+            lags = sample_lag(topology, source, target, reader)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        raise click.ClickException("Interruped.")
+    finally:
+        reader.close()
+
+    report = {
+        "source": topology.source_alias,
+        "target": topology.target_alias,
+        "offset_syncs_topic": topic,
+        **lag_report(lags, previous, sampled_at - previous_at),
+    }
+    click.echo(json.dumps(report, indent=4, sort_keys=True))
+    return 0
@@ -0,0 +1,270 @@
+"""Measure the MirrorMaker 2 replication lag.
+
+The replication lag of a source partition is estimated from the source and
+target end offsets and the latest offset sync that MirrorMaker 2 writes to
+the ``mm2-offset-syncs.<target alias>.internal`` topic. An offset sync maps
+an upstream (source) offset to the downstream (target) offset, so the
+upstream position of the target end offset is::
+
+    upstream + (target end offset - downstream)
+"""
+
+__all__ = [
+    "OffsetSync",
+    "MirrorTopology",
+    "decode_offset_sync",
+    "offset_syncs_topic",
+    "OffsetSyncReader",
+    "replication_lag",
+    "sample_lag",
+]
+
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Mapping, NamedTuple, Tuple
+
+from kafkaconnect.kafka_admin import Partition, end_offsets, topic_partitions
+from kafkaconnect.topic_names_set import TopicNamesSet
+
+if TYPE_CHECKING:
+    from confluent_kafka import Consumer
+    from confluent_kafka.admin import AdminClient
+
+logger = logging.getLogger("kafkaconnect")
+
+IDENTITY_POLICY = "IdentityReplicationPolicy"
+
+# MirrorMaker 2 default topic filters
+DEFAULT_TOPICS = ".*"
+DEFAULT_TOPICS_EXCLUDE = r".*[\-\.]internal|.*\.replica|__.*"
+
+
+class OffsetSync(NamedTuple):
+    """An upstream offset and the matching downstream offset."""
+
+    upstream: int
+    downstream: int
+
+
+def decode_offset_sync(
+    key: bytes, value: bytes
+) -> Tuple[Partition, OffsetSync]:
+    """Decode an offset sync record.
+
+    The key is the source topic as an int16-prefixed string followed by the
+    int32 partition, and the value is the int64 upstream and downstream
+    offsets, all big-endian.
+    """
+    (length,) = struct.unpack_from(">h", key)
+    topic = key[2 : 2 + length].decode("utf-8")
+    (partition,) = struct.unpack_from(">i", key, 2 + length)
+    upstream, downstream = struct.unpack_from(">qq", value)
+    return (topic, partition), OffsetSync(upstream, downstream)
+
+
+def offset_syncs_topic(target_alias: str) -> str:
+    """Return the name of the offset syncs topic."""
+    return f"mm2-offset-syncs.{target_alias}.internal"
+
+
+@dataclass
+class MirrorTopology:
+    """The replication flow of a mirror-source connector."""
+
+    source_alias: str
+    target_alias: str
+    source_broker: str = ""
+    target_broker: str = ""
+    topics: str = DEFAULT_TOPICS
+    topics_exclude: str = DEFAULT_TOPICS_EXCLUDE
+    separator: str = "."
+    identity: bool = False
+    offset_syncs_on_target: bool = False
+
+    @classmethod
+    def from_connector_config(
+        cls, config: Mapping[str, str]
+    ) -> "MirrorTopology":
+        """Create the topology from the mirror-source connector config.
+
+        The ``topics`` and ``topics.exclude`` comma-separated regex lists
+        are combined into a single regex each.
+        """
+
+        def regex(key: str, default: str) -> str:
+            value = config.get(key)
+            if not value:
+                return default
+            return "|".join(r.strip() for r in value.split(",") if r.strip())
+
+        return cls(
+            source_alias=config.get("source.cluster.alias", "source"),
+            target_alias=config.get("target.cluster.alias", "target"),
+            source_broker=config.get("source.cluster.bootstrap.servers", ""),
+            target_broker=config.get("target.cluster.bootstrap.servers", ""),
+            topics=regex("topics", DEFAULT_TOPICS),
+            topics_exclude=regex(
+                "topics.exclude",
+                regex("topics.blacklist", DEFAULT_TOPICS_EXCLUDE),
+            ),
+            separator=config.get("replication.policy.separator", "."),
+            identity=config.get("replication.policy.class", "").endswith(
+                IDENTITY_POLICY
+            ),
+            offset_syncs_on_target=(
+                config.get("offset-syncs.topic.location") == "target"
+            ),
+        )
+
+    def remote_topic(self, topic: str) -> str:
+        """Return the name of the replicated topic in the target cluster."""
+        if self.identity:
+            return topic
+        return f"{self.source_alias}{self.separator}{topic}"
+
+
+class OffsetSyncReader:
+    """Read the latest offset sync of each source partition.
+
+    The offset syncs topic is read from the beginning on the first call to
+    `read`, and from the last position on the next calls.
+
+    Parameters
+    ----------
+    consumer : `confluent_kafka.Consumer`
+        A consumer for the cluster where the offset syncs topic is.
+    topic : `str`
+        Name of the offset syncs topic.
+    """
+
+    def __init__(self, consumer: "Consumer", topic: str) -> None:
+        self._consumer = consumer
+        self.topic = topic
+        self.syncs: Dict[Partition, OffsetSync] = {}
+        self._positions: Dict[int, int] = {}
+
+    def _assign(self, timeout: float) -> None:
+        from confluent_kafka import OFFSET_BEGINNING, TopicPartition
+
+        metadata = self._consumer.list_topics(self.topic, timeout=timeout)
+        topic = metadata.topics.get(self.topic)
+        if topic is None or topic.error is not None:
+            raise ValueError(f"Offset syncs topic {self.topic} not found.")
+        self._consumer.assign(
+            [
+                TopicPartition(self.topic, p, OFFSET_BEGINNING)
+                for p in sorted(topic.partitions)
+            ]
+        )
+        self._positions = {p: 0 for p in topic.partitions}
+
+    def read(self, timeout: float = 30.0) -> Dict[Partition, OffsetSync]:
+        """Read the offset syncs up to the current end of the topic.
+
+        Returns
+        -------
+        syncs : `dict`
+            Mapping of source (topic, partition) to the latest offset sync.
+        """
+        from confluent_kafka import TopicPartition
+
+        if not self._positions:
+            self._assign(timeout)
+        ends = {
+            p: self._consumer.get_watermark_offsets(
+                TopicPartition(self.topic, p), timeout=timeout
+            )[1]
+            for p in self._positions
+        }
+        deadline = time.monotonic() + timeout
+        while any(self._positions[p] < ends[p] for p in ends):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Timed out reading the offset syncs topic {self.topic}."
+                )
+                break
+            message = self._consumer.poll(min(remaining, 1.0))
+            if message is None:
+                # Skip over transaction markers and compacted records
+                for tp in self._consumer.position(
+                    [TopicPartition(self.topic, p) for p in self._positions]
+                ):
+                    if tp.offset >= 0:
+                        self._positions[tp.partition] = tp.offset
+                continue
+            partition, offset = message.partition(), message.offset()
+            if message.error() or partition is None or offset is None:
+                continue
+            self._positions[partition] = offset + 1
+            key, value = message.key(), message.value()
+            if isinstance(key, bytes) and isinstance(value, bytes):
+                source, sync = decode_offset_sync(key, value)
+                self.syncs[source] = sync
+        return self.syncs
+
+    def close(self) -> None:
+        """Close the consumer."""
+        self._consumer.close()
+
+
+def replication_lag(
+    topology: MirrorTopology,
+    source_ends: Mapping[Partition, int],
+    target_ends: Mapping[Partition, int],
+    syncs: Mapping[Partition, OffsetSync],
+) -> Dict[Partition, int]:
+    """Compute the replication lag of the source partitions.
+
+    Partitions without an offset sync assume the source and target offsets
+    match, and partitions not yet replicated have a lag equal to their end
+    offset.
+    """
+    lags = {}
+    for (topic, partition), source_end in source_ends.items():
+        target_end = target_ends.get((topology.remote_topic(topic), partition))
+        if target_end is None:
+            lags[(topic, partition)] = source_end
+            continue
+        sync = syncs.get((topic, partition))
+        if sync is None:
+            replicated = target_end
+        else:
+            replicated = sync.upstream + (target_end - sync.downstream)
+        lags[(topic, partition)] = max(0, source_end - replicated)
+    return lags
+
+
+def sample_lag(
+    topology: MirrorTopology,
+    source: "AdminClient",
+    target: "AdminClient",
+    reader: OffsetSyncReader,
+    timeout: float = 10,
+) -> Dict[Partition, int]:
+    """Sample the replication lag of the mirrored source partitions.
+
+    Each cluster is queried with one metadata request and one batched
+    offsets request.
+    """
+    partitions = topic_partitions(source, timeout=timeout)
+    topics = TopicNamesSet(
+        list(partitions),
+        select_regex=topology.topics,
+        exclude_regex=topology.topics_exclude,
+    ).topic_names_set
+    remote = {topology.remote_topic(t): t for t in topics}
+    remote_partitions = topic_partitions(target, remote, timeout=timeout)
+
+    source_tps: List[Partition] = [
+        (t, p) for t in sorted(topics) for p in partitions[t]
+    ]
+    target_tps: List[Partition] = [
+        (t, p) for t, ps in remote_partitions.items() for p in ps
+    ]
+    syncs = reader.read(timeout=timeout)
+    source_ends = end_offsets(source, source_tps, timeout=timeout)
+    target_ends = end_offsets(target, target_tps, timeout=timeout)
+    return replication_lag(topology, source_ends, target_ends, syncs)
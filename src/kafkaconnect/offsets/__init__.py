@@ -0,0 +1 @@
+"""Inspect and reset the connector offsets."""
@@ -0,0 +1,156 @@
+"""CLI to inspect, alter and reset the connector offsets."""
+
+__all__ = ["offsets"]
+
+import json
+from typing import Any, Callable, Dict, TextIO
+
+import click
+
+from kafkaconnect.connect import Connect
+from kafkaconnect.kafka_admin import admin_client
+from kafkaconnect.lag.consumer import fetch_topics
+from kafkaconnect.offsets.offsets import (
+    OffsetsError,
+    latest_sink_offsets,
+    sink_offsets,
+    with_stopped,
+)
+
+_wait_timeout_option = click.option(
+    "--wait-timeout",
+    "wait_timeout",
+    default=120000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=(
+        "The time in milliseconds to wait for the connector to stop and to "
+        "return to its previous state."
+    ),
+)
+
+
+def _change(
+    connect: Connect, name: str, change: Callable[[], str], wait_timeout: int
+) -> None:
+    """Change the offsets of a connector while it is stopped."""
+    click.echo(f"Stopping the {name} connector...")
+    try:
+        content = with_stopped(
+            connect, name, change, timeout=wait_timeout / 1000
+        )
+    except OffsetsError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        raise click.ClickException("Interruped.")
+    click.echo(content)
+
+
+@click.group("offsets")
+def offsets() -> None:
+    """Inspect, alter and reset the offsets of a connector.
+
+    Requires Kafka Connect 3.6 or later. The connector is stopped while its
+    offsets are changed, then returned to its previous state.
+    """
+
+
+@offsets.command("get")
+@click.argument("name")
+@click.pass_context
+def get(ctx: click.Context, name: str) -> None:
+    """Get the offsets of a connector."""
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url, config.output_format)
+    click.echo(connect.offsets(name))
+
+
+@offsets.command("alter")
+@click.argument("name")
+@click.argument("offsetsfile", type=click.File("r"))
+@_wait_timeout_option
+@click.pass_context
+def alter(
+    ctx: click.Context, name: str, offsetsfile: TextIO, wait_timeout: int
+) -> None:
+    """Alter the offsets of a connector.
+
+    OFFSETSFILE has the format returned by ``offsets get``, with only the
+    partitions to alter, or ``-`` to read from stdin.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+    try:
+        body = json.dumps(json.load(offsetsfile))
+    except ValueError as e:
+        raise click.ClickException(f"Invalid offsets file: {e}")
+    _change(
+        connect, name, lambda: connect.alter_offsets(name, body), wait_timeout
+    )
+
+
+@offsets.command("reset")
+@click.argument("name")
+@_wait_timeout_option
+@click.pass_context
+def reset(ctx: click.Context, name: str, wait_timeout: int) -> None:
+    """Reset all the offsets of a connector.
+
+    A sink connector consumes its topics again from the position set by its
+    ``consumer.auto.offset.reset`` configuration, earliest by default.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+    _change(connect, name, lambda: connect.reset_offsets(name), wait_timeout)
+
+
+@offsets.command("reset-to-latest")
+@click.argument("name")
+@click.option(
+    "-r",
+    "--topic-regex",
+    "topic_regex",
+    default=".*",
+    show_default=True,
+    help="Regex for selecting the topics of the connector to skip ahead.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show the new offsets but do not change them.",
+)
+@_wait_timeout_option
+@click.pass_context
+def reset_to_latest(
+    ctx: click.Context,
+    name: str,
+    topic_regex: str,
+    dry_run: bool,
+    wait_timeout: int,
+) -> None:
+    """Skip the backlog of a sink connector.
+
+    The offsets of the active topics of the connector that match
+    ``--topic-regex`` are set to the end offsets of their partitions, so
+    that the connector only consumes new records.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+    topics = fetch_topics(connect, [name])[name]
+    if topics is None:
+        raise click.ClickException(connect.topics(name))
+    latest = latest_sink_offsets(admin_client(config), topics, topic_regex)
+    if not latest:
+        raise click.ClickException(
+            f"No topics of the {name} connector match {topic_regex!r}."
+        )
+    body: Dict[str, Any] = sink_offsets(latest)
+    if dry_run:
+        click.echo(json.dumps(body, indent=4, sort_keys=True))
+        return
+    _change(
+        connect,
+        name,
+        lambda: connect.alter_offsets(name, json.dumps(body)),
+        wait_timeout,
+    )
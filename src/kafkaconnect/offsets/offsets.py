@@ -0,0 +1,161 @@
+"""Alter and reset the connector offsets safely.
+
+Connect only accepts offset changes for connectors in the ``STOPPED`` state.
+`with_stopped` stops the connector, waits until its tasks are shut down,
+changes the offsets and restores the previous state of the connector, even
+if the change failed.
+"""
+
+__all__ = [
+    "OffsetsError",
+    "sink_offsets",
+    "latest_sink_offsets",
+    "with_stopped",
+]
+
+import json
+import re
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping
+
+from kafkaconnect.connect import Connect
+from kafkaconnect.kafka_admin import Partition, end_offsets, topic_partitions
+from kafkaconnect.wait import wait_for_state
+
+if TYPE_CHECKING:
+    from confluent_kafka.admin import AdminClient
+
+
+class OffsetsError(Exception):
+    """Raised when the offsets of a connector cannot be changed."""
+
+
+def sink_offsets(offsets: Mapping[Partition, int]) -> Dict[str, Any]:
+    """Return the request body to alter the offsets of a sink connector."""
+    return {
+        "offsets": [
+            {
+                "partition": {"kafka_topic": topic, "kafka_partition": p},
+                "offset": {"kafka_offset": offset},
+            }
+            for (topic, p), offset in sorted(offsets.items())
+        ]
+    }
+
+
+def latest_sink_offsets(
+    client: "AdminClient",
+    topics: Iterable[str],
+    topic_regex: str = ".*",
+    timeout: float = 10,
+) -> Dict[Partition, int]:
+    """Return the end offsets of the topics that match a regex.
+
+    Parameters
+    ----------
+    client : `AdminClient`
+        The Kafka admin client.
+    topics : `Iterable`
+        The topics of the connector.
+    topic_regex : `str`
+        Regex for selecting the topics to reset.
+    """
+    pattern = re.compile(topic_regex)
+    selected = [topic for topic in topics if pattern.match(topic)]
+    partitions = [
+        (topic, p)
+        for topic, ids in topic_partitions(client, selected, timeout).items()
+        for p in ids
+    ]
+    return end_offsets(client, partitions, timeout)
+
+
+def _check(content: str) -> str:
+    """Raise `OffsetsError` if a Connect API response is an error."""
+    try:
+        body = json.loads(content) if content else {}
+    except ValueError:
+        raise OffsetsError(content)
+    if isinstance(body, dict) and "error_code" in body:
+        raise OffsetsError(body.get("message", content))
+    return content
+
+
+def with_stopped(
+    connect: Connect,
+    name: str,
+    change: Callable[[], str],
+    timeout: float,
+    interval: float = 2.0,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> str:
+    """Stop the connector, change its offsets and restore its state.
+
+    Parameters
+    ----------
+    connect : `Connect`
+        The Connect API helper.
+    name : `str`
+        Name of the connector.
+    change : `Callable`
+        Sends the offsets request, for example a call to
+        `Connect.alter_offsets`, and returns the response.
+    timeout : `float`
+        Maximum time, in seconds, to wait for the connector to stop and to
+        return to its previous state.
+    interval : `float`
+        Time, in seconds, between status polls.
+
+    Returns
+    -------
+    content : `str`
+        The response of the offsets request.
+
+    Raises
+    ------
+    OffsetsError
+        If the connector cannot be stopped, the offsets cannot be changed or
+        the connector does not return to its previous state.
+    """
+    try:
+        previous = json.loads(connect.status(name))["connector"]["state"]
+    except (ValueError, KeyError):
+        previous = "UNKNOWN"
+    if previous not in ("RUNNING", "PAUSED", "STOPPED"):
+        raise OffsetsError(f"The {name} connector is {previous}.")
+
+    def wait(state: str) -> None:
+        states = wait_for_state(
+            connect,
+            [name],
+            state,
+            timeout=timeout,
+            interval=interval,
+            sleep=sleep,
+            clock=clock,
+        )
+        if states[name] != state:
+            raise OffsetsError(
+                f"Timed out waiting for the {name} connector to be {state}, "
+                f"it is {states[name]}."
+            )
+
+    if previous != "STOPPED":
+        _check(connect.stop(name))
+    try:
+        if previous != "STOPPED":
+            wait("STOPPED")
+        content = _check(change())
+    finally:
+        # Restore the previous state even if the offsets were not changed,
+        # the wait below reports a failure to do so
+        if previous == "RUNNING":
+            connect.resume(name)
+        elif previous == "PAUSED":
+            connect.pause(name)
+    try:
+        wait(previous)
+    except OffsetsError as e:
+        raise OffsetsError(f"The offsets were changed. {e}")
+    return content
@@ -0,0 +1,30 @@
+"""Click options shared by several commands.
+
+The options are applied when the command modules are imported, this module
+only depends on click so that the CLI startup stays fast.
+"""
+
+__all__ = ["offline_option"]
+
+from typing import Any, Callable, TypeVar
+
+import click
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def offline_option(command: F) -> F:
+    """Add the --offline option to a click command.
+
+    See `kafkaconnect.plugin_cache.check_locally`.
+    """
+    return click.option(
+        "--offline",
+        "offline",
+        is_flag=True,
+        help=(
+            "Validate the configuration with the cached plugin definitions "
+            "only, without requests to the Connect worker. With --dry-run, "
+            "the server-side validation is skipped."
+        ),
+    )(command)
@@ -0,0 +1,366 @@
+"""Cache of the connector plugin configuration definitions.
+
+The configuration definitions of each connector plugin are cached on disk
+per Connect URL and worker version, so that configurations can be validated
+on the client side without sending them to the worker. The list of plugins
+installed in the worker is checked at most once per `CATALOG_TTL`, and the
+cache is invalidated when it changes.
+
+Client-side validation checks the required keys and the value types. Values
+outside the recommended values are only reported as warnings: they are
+hints that may depend on other settings, and many plugins accept other
+values. Server-side validation remains the final check before a connector
+is created.
+"""
+
+__all__ = [
+    "CATALOG_TTL",
+    "PluginCatalog",
+    "default_cache_dir",
+    "worker_cache_dir",
+    "validate_config",
+    "validate_locally",
+    "check_locally",
+]
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import click
+
+from kafkaconnect.apply.plan import normalize_config
+from kafkaconnect.connect import Connect, ConnectError
+
+INTEGER_RANGES = {
+    "SHORT": (-(2**15), 2**15 - 1),
+    "INT": (-(2**31), 2**31 - 1),
+    "LONG": (-(2**63), 2**63 - 1),
+}
+"""Range of the Connect integer types."""
+
+CATALOG_TTL = 3600.0
+"""Time, in seconds, before the cached plugin list is checked again."""
+
+
+def default_cache_dir() -> Path:
+    """Return the plugin cache directory.
+
+    Set via the $KAFKA_CONNECT_CACHE_DIR env var, defaults to
+    ``$XDG_CACHE_HOME/kafkaconnect``.
+    """
+    if "KAFKA_CONNECT_CACHE_DIR" in os.environ:
+        return Path(os.environ["KAFKA_CONNECT_CACHE_DIR"])
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(cache_home) / "kafkaconnect"
+
+
+def worker_cache_dir(cache_dir: Path, connect_url: str) -> Path:
+    """Return the cache directory of a Connect cluster.
+
+    Each Connect URL has its own directory, so that the catalog of a
+    worker is never used to validate the configurations of another one.
+    """
+    digest = hashlib.sha256(connect_url.rstrip("/").encode()).hexdigest()
+    return cache_dir / digest[:16]
+
+
+def _loads(content: str) -> Any:
+    try:
+        return json.loads(content)
+    except ValueError:
+        raise ConnectError(content)
+
+
+@dataclass
+class PluginCatalog:
+    """Configuration definitions of the plugins of a Connect worker."""
+
+    version: str
+    """Version of the Connect worker."""
+
+    commit: str
+    """Commit of the Connect worker."""
+
+    plugins: List[Dict[str, Any]] = field(default_factory=list)
+    """Plugins installed in the worker, as returned by the Connect API."""
+
+    definitions: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    """Configuration definitions of each connector class."""
+
+    @staticmethod
+    def path(cache_dir: Path, version: str, commit: str) -> Path:
+        """Return the cache file of a worker version."""
+        return cache_dir / f"plugins-{version}-{commit[:12]}.json"
+
+    def save(self, cache_dir: Path) -> None:
+        """Save the catalog, replacing the cache file atomically."""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(cache_dir, self.version, self.commit)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls,
+        cache_dir: Path,
+        connect: Optional[Connect] = None,
+        max_age: float = CATALOG_TTL,
+    ) -> "PluginCatalog":
+        """Load the catalog of the worker.
+
+        Parameters
+        ----------
+        cache_dir : `Path`
+            The cache directory.
+        connect : `Connect`, optional
+            The Connect API helper. If `None`, the most recent cache file is
+            loaded without any request to the worker.
+        max_age : `float`
+            Maximum age, in seconds, of the most recent cache file before
+            the worker version and plugins are requested again.
+
+        Raises
+        ------
+        ConnectError
+            If a request to the Connect API fails.
+        ValueError
+            If there is no cache file in offline mode.
+        """
+        paths = sorted(
+            cache_dir.glob("plugins-*.json"), key=lambda p: p.stat().st_mtime
+        )
+        if connect is None:
+            if not paths:
+                raise ValueError(
+                    f"No cached plugin definitions in {cache_dir}, validate "
+                    f"without --offline first."
+                )
+            return cls(**json.loads(paths[-1].read_text()))
+        if paths and time.time() - paths[-1].stat().st_mtime < max_age:
+            return cls(**json.loads(paths[-1].read_text()))
+
+        worker = _loads(connect.worker())
+        plugins = _loads(connect.plugins())
+        path = cls.path(cache_dir, worker["version"], worker["commit"])
+        if path.exists():
+            catalog = cls(**json.loads(path.read_text()))
+            if catalog.plugins == plugins:
+                # The plugins are checked again after the TTL
+                os.utime(path)
+                return catalog
+        catalog = cls(worker["version"], worker["commit"], plugins)
+        catalog.save(cache_dir)
+        return catalog
+
+    def fetch_definitions(
+        self, connector_class: str, connect: Connect, cache_dir: Path
+    ) -> List[Dict[str, Any]]:
+        """Fetch and cache the configuration definitions of a plugin.
+
+        The definitions and recommended values are taken from the
+        validation of a configuration that only sets ``connector.class``.
+        """
+        config = {"connector.class": connector_class}
+        validation = _loads(
+            connect.validate(connector_class, json.dumps(config))
+        )
+        definitions = []
+        for item in validation["configs"]:
+            definition = dict(item["definition"])
+            definition["recommended_values"] = item["value"].get(
+                "recommended_values", []
+            )
+            definitions.append(definition)
+        self.definitions[connector_class] = definitions
+        self.save(cache_dir)
+        return definitions
+
+
+def _type_error(config_type: str, value: str) -> Optional[str]:
+    """Return the error if the value does not match the type."""
+    if config_type == "BOOLEAN":
+        if value.lower() not in ("true", "false"):
+            return f'Invalid value {value}: expected "true" or "false".'
+    elif config_type in INTEGER_RANGES:
+        low, high = INTEGER_RANGES[config_type]
+        try:
+            number = int(value)
+        except ValueError:
+            return (
+                f"Invalid value {value}: not a number of type {config_type}."
+            )
+        if not low <= number <= high:
+            return f"Invalid value {value}: out of range for {config_type}."
+    elif config_type == "DOUBLE":
+        try:
+            float(value)
+        except ValueError:
+            return f"Invalid value {value}: not a number of type DOUBLE."
+    return None
+
+
+def validate_config(
+    connector_class: str,
+    definitions: List[Dict[str, Any]],
+    config: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """Validate a configuration against the plugin definitions.
+
+    Returns
+    -------
+    validation : `dict`
+        The validation result, in the format of the Connect API
+        ``config/validate`` response, with the values outside the
+        recommended values listed in ``warnings``.
+    """
+    values = normalize_config(config)
+    configs = []
+    error_count = 0
+    warnings = []
+    for definition in definitions:
+        name = definition["name"]
+        value = values.get(name)
+        recommended = definition.get("recommended_values") or []
+        errors = []
+        if value is None:
+            if definition["required"] and definition["default_value"] is None:
+                errors.append(
+                    f'Missing required configuration "{name}" which has no '
+                    f"default value."
+                )
+        else:
+            error = _type_error(definition["type"], value)
+            if error:
+                errors.append(error)
+            if recommended and value:
+                items = (
+                    [v.strip() for v in value.split(",")]
+                    if definition["type"] == "LIST"
+                    else [value]
+                )
+                unknown = [v for v in items if v not in recommended]
+                if unknown:
+                    warnings.append(
+                        f"{name}: {', '.join(unknown)} is not one of the "
+                        f"recommended values {', '.join(recommended)}."
+                    )
+        error_count += len(errors)
+        configs.append(
+            {
+                "definition": definition,
+                "value": {
+                    "name": name,
+                    "value": value,
+                    "recommended_values": recommended,
+                    "errors": errors,
+                    "visible": True,
+                },
+            }
+        )
+    return {
+        "name": connector_class,
+        "error_count": error_count,
+        "warnings": warnings,
+        "groups": sorted({d.get("group") or "Common" for d in definitions}),
+        "configs": configs,
+    }
+
+
+def validate_locally(
+    connect: Connect,
+    config: Mapping[str, Any],
+    offline: bool = False,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Validate a configuration with the cached plugin definitions.
+
+    Parameters
+    ----------
+    connect : `Connect`
+        The Connect API helper, used to refresh the cache.
+    config : `dict`
+        The connector configuration.
+    offline : `bool`
+        Use the cache only, without requests to the worker.
+    cache_dir : `Path`, optional
+        The cache directory, see `default_cache_dir`. The catalog is
+        cached in the subdirectory of the Connect URL, see
+        `worker_cache_dir`.
+
+    Raises
+    ------
+    ConnectError
+        If a request to the Connect API fails.
+    ValueError
+        If the definitions are not cached in offline mode.
+    OSError
+        If the cache directory cannot be read or written.
+    """
+    cache_dir = worker_cache_dir(
+        cache_dir or default_cache_dir(), connect.connect_url
+    )
+    connector_class = config["connector.class"]
+    catalog = PluginCatalog.load(cache_dir, None if offline else connect)
+    definitions = catalog.definitions.get(connector_class)
+    if definitions is None:
+        if offline:
+            raise ValueError(
+                f"No cached definitions for {connector_class}, validate "
+                f"without --offline first."
+            )
+        definitions = catalog.fetch_definitions(
+            connector_class, connect, cache_dir
+        )
+    return validate_config(connector_class, definitions, config)
+
+
+def check_locally(
+    connect_url: str, config: Mapping[str, Any], offline: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Validate a configuration on the client side for a CLI command.
+
+    The responses of the Connect API are parsed, so the requests use their
+    own `Connect` helper instead of the one formatting the command output.
+    Warnings are printed to stderr.
+
+    Returns
+    -------
+    validation : `dict` or `None`
+        The validation result, `None` if the cache directory cannot be
+        used. The server-side validation is then the only check.
+
+    Raises
+    ------
+    click.ClickException
+        If the definitions could not be loaded, or if the configuration has
+        errors. The validation result is printed first.
+    """
+    try:
+        validation = validate_locally(Connect(connect_url), config, offline)
+    except (ConnectError, ValueError) as e:
+        raise click.ClickException(str(e))
+    except OSError as e:
+        if offline:
+            raise click.ClickException(f"Could not read the plugin cache: {e}")
+        click.echo(
+            f"Warning: could not use the plugin cache, skipping the local "
+            f"validation: {e}",
+            err=True,
+        )
+        return None
+    for warning in validation["warnings"]:
+        click.echo(f"Warning: {warning}", err=True)
+    if validation["error_count"]:
+        click.echo(json.dumps(validation, indent=4, sort_keys=True))
+        raise click.ClickException(
+            f"The configuration has {validation['error_count']} error(s)."
+        )
+    return validation
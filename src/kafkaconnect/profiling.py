@@ -0,0 +1,126 @@
+"""Profile a command with cProfile.
+
+The global ``--profile`` option profiles the whole command, including the
+lazy imports of the subcommand modules, writes the statistics to a file
+that can be loaded with `pstats` or visualization tools such as snakeviz,
+and prints a summary of the hot functions.
+
+Long-running commands wrap each iteration of their loop with `cycle`. With
+``--profile-every N`` only one cycle out of every N is profiled, which
+keeps the profiling overhead low while sampling cycles over a long run.
+The statistics are written after each sampled cycle, so that they survive a
+command that never returns normally, such as a daemon stopped with SIGTERM.
+"""
+
+__all__ = ["Profiler", "cycle", "format_summary"]
+
+import cProfile
+import pstats
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+_active: Optional["Profiler"] = None
+"""The profiler of the running command."""
+
+
+class Profiler:
+    """Profile a command or a sample of its cycles.
+
+    Parameters
+    ----------
+    path : `str`
+        File to write the profile statistics to.
+    top : `int`
+        Number of functions in the summary.
+    every : `int`
+        Profile one cycle out of every ``every`` cycles. If 1, the whole
+        command is profiled.
+    """
+
+    def __init__(self, path: str, top: int = 20, every: int = 1) -> None:
+        self.path = path
+        self.top = top
+        self.every = every
+        self.cycles = 0
+        self.sampled = 0
+        self._profile = cProfile.Profile()
+
+    @property
+    def sampling(self) -> bool:
+        """Whether only a sample of the cycles is profiled."""
+        return self.every > 1
+
+    def start(self) -> None:
+        """Start profiling the command, and make this profiler active."""
+        global _active
+        _active = self
+        if not self.sampling:
+            self._profile.enable()
+
+    def stop(self) -> str:
+        """Stop profiling, write the statistics and return the summary."""
+        global _active
+        _active = None
+        if not self.sampling:
+            self._profile.disable()
+        if self.sampling and not self.sampled:
+            return "No cycle was profiled."
+        self._profile.dump_stats(self.path)
+        summary = format_summary(pstats.Stats(self._profile), self.top)
+        if self.sampling:
+            summary = (
+                f"Profiled {self.sampled} of {self.cycles} cycles.\n{summary}"
+            )
+        return f"{summary}\nProfile written to {self.path}."
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """Profile one cycle out of every ``every`` cycles.
+
+        The statistics of all the sampled cycles are written after each
+        sampled cycle.
+        """
+        sampled = self.sampling and self.cycles % self.every == 0
+        self.cycles += 1
+        if not sampled:
+            yield
+            return
+        self.sampled += 1
+        self._profile.enable()
+        try:
+            yield
+        finally:
+            self._profile.disable()
+            self._profile.dump_stats(self.path)
+
+
+@contextmanager
+def cycle() -> Iterator[None]:
+    """Mark a cycle of a long-running loop for the active profiler."""
+    if _active is None:
+        yield
+    else:
+        with _active.cycle():
+            yield
+
+
+def format_summary(stats: pstats.Stats, top: int) -> str:
+    """Return the functions with the highest internal time.
+
+    Each line has the number of calls, the time spent in the function
+    itself and the cumulative time including the called functions.
+    """
+    # pstats keeps the raw statistics in an undocumented attribute
+    entries = getattr(stats, "stats")
+    total = getattr(stats, "total_tt")
+    rows = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)
+    lines: List[str] = [
+        f"Total time: {total:.3f} s, top {top} functions by internal time:",
+        f"{'ncalls':>10} {'tottime':>9} {'cumtime':>9}  function",
+    ]
+    for (filename, lineno, function), (_, calls, tt, ct, _) in rows[:top]:
+        location = (
+            function if filename == "~" else f"{filename}:{lineno}({function})"
+        )
+        lines.append(f"{calls:>10} {tt:>9.3f} {ct:>9.3f}  {location}")
+    return "\n".join(lines)
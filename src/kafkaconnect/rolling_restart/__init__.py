@@ -0,0 +1 @@
+"""Restart connectors in waves after a worker upgrade."""
@@ -0,0 +1,148 @@
+"""CLI to restart connectors in waves."""
+
+__all__ = ["rolling_restart"]
+
+import re
+import time
+from typing import Optional, Tuple
+
+import click
+
+from kafkaconnect.connect import Connect, ConnectError
+from kafkaconnect.rolling_restart.rolling import RollingRestart
+from kafkaconnect.snapshot import ConnectSnapshot
+from kafkaconnect.wait import fetch_statuses
+
+RESTARTABLE_STATES = ("RUNNING", "FAILED")
+"""Connector states that return to RUNNING after a restart."""
+
+
+@click.command("rolling-restart")
+@click.argument("names", nargs=-1, required=False)
+@click.option(
+    "-r",
+    "--match",
+    "match",
+    default=None,
+    help="Regex for selecting the connectors to restart.",
+)
+@click.option(
+    "--wave-size",
+    "wave_size",
+    default=5,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of connectors restarted at the same time.",
+)
+@click.option(
+    "--include-tasks",
+    "include_tasks",
+    is_flag=True,
+    help=(
+        "Restart the connector tasks too. Requires Kafka Connect 3.0 or later."
+    ),
+)
+@click.option(
+    "--wait-timeout",
+    "wait_timeout",
+    default=120000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=(
+        "The time in milliseconds to wait for the connectors of a wave to be "
+        "RUNNING before giving up."
+    ),
+)
+@click.option(
+    "--interval",
+    "interval",
+    default=2000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="The interval, in milliseconds, to poll the connectors status.",
+)
+@click.pass_context
+def rolling_restart(
+    ctx: click.Context,
+    names: Tuple[str, ...],
+    match: Optional[str],
+    wave_size: int,
+    include_tasks: bool,
+    wait_timeout: int,
+    interval: int,
+) -> int:
+    """Restart connectors in waves, waiting for each wave to be RUNNING.
+
+    Use NAMES or ``--match`` to select the connectors, by default all
+    connectors are restarted. The connectors of a wave are restarted
+    concurrently and the next wave starts once the connectors and their
+    tasks are RUNNING. The rolling restart stops at the first wave that is
+    not RUNNING within ``--wait-timeout``. Connectors that are not RUNNING
+    or FAILED, such as PAUSED or STOPPED connectors, are skipped.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+    pattern = re.compile(match) if match else None
+    if names:
+        names = tuple(n for n in names if not pattern or pattern.match(n))
+        statuses = fetch_statuses(connect, names)
+    else:
+        try:
+            snapshot = ConnectSnapshot.from_connect(connect, ("status",))
+        except ConnectError as e:
+            raise click.ClickException(str(e))
+        statuses = {
+            name: status
+            for name, status in sorted(snapshot.statuses.items())
+            if not pattern or pattern.match(name)
+        }
+    selected = []
+    for name, status in statuses.items():
+        # Connectors without a status are restarted, the restart reports
+        # the error
+        state = status["connector"]["state"] if status else None
+        if state and state not in RESTARTABLE_STATES:
+            click.echo(f"{name}: {state}, skipped")
+        else:
+            selected.append(name)
+    if not selected:
+        raise click.ClickException("No connectors selected.")
+
+    rolling = RollingRestart(
+        connect,
+        wave_size=wave_size,
+        timeout=wait_timeout / 1000,
+        include_tasks=include_tasks,
+        interval=interval / 1000,
+    )
+    total = -(-len(selected) // wave_size)
+    click.echo(
+        f"Restarting {len(selected)} connector(s) in {total} wave(s) of up "
+        f"to {wave_size}..."
+    )
+    start = time.monotonic()
+    restarted = 0
+    try:
+        for wave in rolling.restart(selected):
+            prefix = f"Wave {wave.number}/{total}"
+            if wave.healthy:
+                restarted += len(wave.names)
+                click.echo(
+                    f"{prefix}: {', '.join(wave.names)} RUNNING in "
+                    f"{wave.elapsed:.1f} s ({restarted}/{len(selected)})."
+                )
+                continue
+            for name in wave.names:
+                state = wave.errors.get(name) or wave.states.get(name)
+                click.echo(f"{prefix}: {name}: {state}")
+            raise click.ClickException(
+                f"{prefix} is not RUNNING, stopping the rolling restart after "
+                f"{time.monotonic() - start:.1f} s."
+            )
+    except KeyboardInterrupt:
+        raise click.ClickException("Interruped.")
+    click.echo(
+        f"Restarted {restarted} connector(s) in "
+        f"{time.monotonic() - start:.1f} s."
+    )
+    return 0
@@ -0,0 +1,119 @@
+"""Restart connectors in waves gated on their health."""
+
+__all__ = ["Wave", "RollingRestart", "waves"]
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Sequence
+
+from kafkaconnect.bulk import bulk_request
+from kafkaconnect.connect import Connect
+from kafkaconnect.wait import wait_for_state
+
+
+def waves(names: Sequence[str], size: int) -> List[List[str]]:
+    """Split the connector names in waves of at most ``size`` names."""
+    if size < 1:
+        raise ValueError("The wave size must be at least 1.")
+    return [list(names[i : i + size]) for i in range(0, len(names), size)]
+
+
+@dataclass
+class Wave:
+    """The result of restarting a wave of connectors."""
+
+    number: int
+    """Number of the wave, starting at 1."""
+
+    names: List[str]
+    """Names of the connectors restarted in the wave."""
+
+    states: Dict[str, str] = field(default_factory=dict)
+    """Last observed state of each connector after the restart."""
+
+    errors: Dict[str, str] = field(default_factory=dict)
+    """Connect API error messages of the restart requests."""
+
+    elapsed: float = 0.0
+    """Time, in seconds, to restart the wave and reach RUNNING."""
+
+    @property
+    def healthy(self) -> bool:
+        """Whether all connectors of the wave were restarted and RUNNING."""
+        return not self.errors and all(
+            self.states.get(name) == "RUNNING" for name in self.names
+        )
+
+
+class RollingRestart:
+    """Restart connectors in waves.
+
+    The connectors of a wave are restarted concurrently, then the next wave
+    starts only after the connector and tasks of the wave are RUNNING. This
+    bounds the number of connectors rebalancing at any time.
+
+    Parameters
+    ----------
+    connect : `Connect`
+        The Connect API helper.
+    wave_size : `int`
+        Number of connectors restarted at the same time.
+    timeout : `float`
+        Maximum time, in seconds, to wait for a wave to be RUNNING.
+    include_tasks : `bool`
+        Whether to restart the connector tasks too.
+    interval : `float`
+        Time, in seconds, between status polls.
+    """
+
+    def __init__(
+        self,
+        connect: Connect,
+        wave_size: int,
+        timeout: float,
+        include_tasks: bool = False,
+        interval: float = 2.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._connect = connect
+        self.wave_size = wave_size
+        self.timeout = timeout
+        self.include_tasks = include_tasks
+        self.interval = interval
+        self._sleep = sleep
+        self._clock = clock
+
+    def restart(self, names: Sequence[str]) -> Iterator[Wave]:
+        """Restart the connectors, yielding the result of each wave.
+
+        The restart stops after the first wave that is not healthy, so that
+        a faulty upgrade does not take down every connector.
+        """
+        for number, names_ in enumerate(waves(names, self.wave_size), 1):
+            wave = self._restart_wave(number, names_)
+            yield wave
+            if not wave.healthy:
+                return
+
+    def _restart_wave(self, number: int, names: List[str]) -> Wave:
+        """Restart a wave of connectors and wait until they are RUNNING."""
+        start = self._clock()
+        wave = Wave(number=number, names=names)
+
+        wave.errors = bulk_request(
+            lambda name: self._connect.restart(name, self.include_tasks),
+            names,
+            max_workers=len(names),
+        )
+        wave.states = wait_for_state(
+            self._connect,
+            names,
+            "RUNNING",
+            timeout=self.timeout,
+            interval=self.interval,
+            sleep=self._sleep,
+            clock=self._clock,
+        )
+        wave.elapsed = self._clock() - start
+        return wave
@@ -7,10 +7,18 @@ __all__ = ["create_s3_sink"]
 
 import json
 import time
+from dataclasses import asdict
+from typing import Optional
 
 import click
 
 from kafkaconnect.connect import Connect
+from kafkaconnect.kafka_admin import admin_client
+from kafkaconnect.metadata_cache import shared_cache
+from kafkaconnect.options import offline_option
+from kafkaconnect.plugin_cache import check_locally
+from kafkaconnect.s3_sink.tuning import tune_flush
+from kafkaconnect.throughput import connector_topics, partition_rates
 
 
 @click.command("s3-sink")
@@ -50,6 +58,54 @@ from kafkaconnect.connect import Connect
     is_flag=True,
     help=("Validates the connector configuration without creating."),
 )
+@offline_option
+@click.option(
+    "--tune",
+    "tune",
+    type=click.Choice(["recommend", "apply"]),
+    default=None,
+    help=(
+        "Sample the input rate of the connector topics and recommend, or "
+        "apply, the flush.size and rotate.schedule.interval.ms settings. See "
+        "also the ``--tune-window``, ``--target-object-size``, "
+        "``--record-size`` and ``--max-latency`` options."
+    ),
+)
+@click.option(
+    "--tune-window",
+    "tune_window",
+    default=60000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The time in milliseconds to sample the topics input rate.",
+)
+@click.option(
+    "--target-object-size",
+    "target_object_size",
+    default=64 * 1024 * 1024,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The target size of the S3 objects in bytes.",
+)
+@click.option(
+    "--record-size",
+    "record_size",
+    default=1024,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The average size of the records in the S3 objects in bytes.",
+)
+@click.option(
+    "--max-latency",
+    "max_latency",
+    default=600000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "The maximum time in milliseconds a record is buffered before it is "
+        "written to S3."
+    ),
+)
 @click.option(
     "--show-status",
     "show_status",
@@ -74,12 +130,19 @@ def create_s3_sink(
     aws_access_key_id: str,
     aws_secret_access_key: str,
     dry_run: bool,
+    offline: bool,
+    tune: Optional[str],
+    tune_window: int,
+    target_object_size: int,
+    record_size: int,
+    max_latency: int,
     show_status: bool,
     show_status_interval: int,
 ) -> int:
     """Create an instance of the S3 Sink connector.
 
-    Use the --show-status option to output status.
+    Use the --show-status option to output status. Use the --tune option to
+    size the S3 objects from the input rate of the topics.
     """
     # Get configuration from the parent command
     if ctx.parent:
@@ -106,6 +169,41 @@ def create_s3_sink(
     config["aws.access.key.id"] = aws_access_key_id
     config["aws.secret.access.key"] = aws_secret_access_key
 
+    if tune:
+        client = admin_client(parent_config)
+        cache = shared_cache(parent_config, client=client)
+        topics = connector_topics(config, cache)
+        if not topics:
+            raise click.ClickException(
+                "The configuration has no topics or topics.regex setting."
+            )
+        click.echo(
+            f"Sampling the input rate of {len(topics)} topic(s) for "
+            f"{tune_window / 1000:.0f} s..."
+        )
+        rates = partition_rates(client, topics, tune_window / 1000)
+        try:
+            tuning = tune_flush(
+                rates, target_object_size, record_size, max_latency / 1000
+            )
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo(json.dumps(asdict(tuning), indent=4, sort_keys=True))
+        if tune == "recommend":
+            return 0
+        config.update(tuning.settings)
+        # The scheduled rotation requires a timezone
+        config.setdefault("timezone", "UTC")
+
+    # Validate with the cached plugin definitions first, the server-side
+    # validation is the final check.
+    local_validation = check_locally(
+        parent_config.connect_url, config, offline
+    )
+    if dry_run and offline:
+        click.echo(json.dumps(local_validation, indent=4, sort_keys=True))
+        return 0
+
     # Validate the configuration only.
     if dry_run:
         validation = connect.validate(
@@ -0,0 +1,117 @@
+"""Recommend the S3 Sink flush settings from the topic input rates.
+
+The S3 Sink connector writes an object per topic partition when
+``flush.size`` records are buffered, or when ``rotate.schedule.interval.ms``
+elapses. A ``flush.size`` sized for busy topics leaves quiet topics with
+data buffered for a long time, while a short rotation interval writes tiny
+objects. The recommendation sets ``flush.size`` to the records of a target
+size object and bounds the latency of all partitions, including the busiest
+one if it is too slow to fill an object, with the scheduled rotation.
+"""
+
+__all__ = ["FlushTuning", "tune_flush"]
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping
+
+from kafkaconnect.kafka_admin import Partition
+from kafkaconnect.throughput import topic_rates
+
+
+@dataclass
+class FlushTuning:
+    """Recommended S3 Sink flush settings."""
+
+    settings: Dict[str, str]
+    """The recommended connector configuration settings."""
+
+    topics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    """Input rate and expected object size and latency of each topic."""
+
+    reasons: List[str] = field(default_factory=list)
+    """The reasoning behind the recommendation."""
+
+
+def tune_flush(
+    rates: Mapping[Partition, float],
+    target_object_size: int,
+    record_size: int,
+    max_latency: float,
+) -> FlushTuning:
+    """Recommend the flush settings.
+
+    Parameters
+    ----------
+    rates : `dict`
+        Input rate of each partition, in messages per second.
+    target_object_size : `int`
+        Target size of the S3 objects, in bytes.
+    record_size : `int`
+        Average size of the records in the objects, in bytes.
+    max_latency : `float`
+        Maximum time, in seconds, a record may be buffered before it is
+        written to S3.
+
+    Raises
+    ------
+    ValueError
+        If no partition received records during the sampling window.
+    """
+    busiest = max(rates.values(), default=0.0)
+    if busiest <= 0:
+        raise ValueError(
+            "No records were received during the sampling window, sample "
+            "the topics while they receive data."
+        )
+    flush_size = max(1, target_object_size // record_size)
+    reasons = [
+        f"flush.size={flush_size}: objects of {target_object_size} bytes "
+        f"with {record_size} byte records."
+    ]
+    reachable = math.ceil(busiest * max_latency)
+    if reachable >= flush_size:
+        reasons.append(
+            f"The busiest partition ({busiest:.1f} msg/s) writes an object "
+            f"every {flush_size / busiest:.0f} s."
+        )
+    else:
+        reasons.append(
+            f"The busiest partition ({busiest:.1f} msg/s) receives "
+            f"{reachable} records within the maximum latency, its objects "
+            "are written by the scheduled rotation."
+        )
+    rotate_ms = int(max_latency * 1000)
+    reasons.append(
+        f"rotate.schedule.interval.ms={rotate_ms}: partitions that do not "
+        f"reach flush.size are written after {max_latency:.0f} s."
+    )
+
+    topics: Dict[str, Dict[str, Any]] = {}
+    partitions: Dict[str, int] = {}
+    for topic, _ in rates:
+        partitions[topic] = partitions.get(topic, 0) + 1
+    quiet = []
+    for topic, rate in sorted(topic_rates(rates).items()):
+        per_partition = rate / partitions[topic]
+        records = min(flush_size, per_partition * max_latency)
+        latency = flush_size / per_partition if per_partition else math.inf
+        topics[topic] = {
+            "rate": round(rate, 3),
+            "partitions": partitions[topic],
+            "object_size": int(records * record_size),
+            "latency": round(min(latency, max_latency), 1),
+        }
+        if records * 10 < flush_size:
+            quiet.append(topic)
+    if quiet:
+        reasons.append(
+            f"{len(quiet)} topic(s) write objects smaller than 10% of the "
+            f"target size: {', '.join(quiet)}. Increase the maximum latency "
+            "for larger objects."
+        )
+    settings = {
+        "flush.size": str(flush_size),
+        "rotate.schedule.interval.ms": str(rotate_ms),
+    }
+    return FlushTuning(settings=settings, topics=topics, reasons=reasons)
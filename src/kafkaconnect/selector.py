@@ -0,0 +1,167 @@
+"""Select connectors by name, regex and configuration labels.
+
+Labels are ``KEY=VALUE`` pairs matched against the connector
+configuration, for example ``--label tasks.max=1`` or a custom key such as
+``--label team=sre`` added to the configuration of the connectors.
+"""
+
+__all__ = ["Selector", "parse_labels", "selector_options"]
+
+import re
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import click
+
+from kafkaconnect.connect import Connect
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def parse_labels(labels: Sequence[str]) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` labels.
+
+    Raises
+    ------
+    ValueError
+        If a label has no ``=``.
+    """
+    parsed = {}
+    for label in labels:
+        key, sep, value = label.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid label {label!r}, expected KEY=VALUE.")
+        parsed[key] = value
+    return parsed
+
+
+@dataclass
+class Selector:
+    """Select connectors.
+
+    A connector is selected if it matches all the given criteria.
+    """
+
+    names: Sequence[str] = ()
+    """Names of the connectors, all connectors if empty."""
+
+    match: Optional[str] = None
+    """Regex the connector names must match."""
+
+    labels: Dict[str, str] = field(default_factory=dict)
+    """Configuration values the connectors must have."""
+
+    @property
+    def empty(self) -> bool:
+        """Whether no criteria were given."""
+        return not self.names and not self.match and not self.labels
+
+    def matches(
+        self, name: str, config: Optional[Mapping[str, Any]] = None
+    ) -> bool:
+        """Whether a connector is selected."""
+        if self.names and name not in self.names:
+            return False
+        if self.match and not re.match(self.match, name):
+            return False
+        if self.labels:
+            config = config or {}
+            return all(
+                str(config.get(key)) == value
+                for key, value in self.labels.items()
+            )
+        return True
+
+    def select(self, connect: Connect) -> List[str]:
+        """Return the names of the selected connectors.
+
+        The connectors are listed only if they are selected by regex or
+        label.
+
+        Raises
+        ------
+        ConnectError
+            If the connectors cannot be listed.
+        """
+        # The snapshot is imported on use, the selector options are part of
+        # the CLI startup
+        from kafkaconnect.snapshot import ConnectSnapshot
+
+        if not self.match and not self.labels:
+            return list(self.names)
+        expand = ("info",) if self.labels else ()
+        snapshot = ConnectSnapshot.from_connect(connect, expand)
+        return [
+            name
+            for name, state in sorted(snapshot.connectors.items())
+            if self.matches(name, state.config)
+        ]
+
+    def statuses(
+        self, connect: Connect
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Return the status of the selected connectors.
+
+        The connectors are listed only if they are selected by regex or
+        label, otherwise the status of the named connectors is fetched
+        concurrently.
+
+        Raises
+        ------
+        ConnectError
+            If the connectors cannot be listed.
+        """
+        from kafkaconnect.snapshot import ConnectSnapshot
+        from kafkaconnect.wait import fetch_statuses
+
+        if not self.match and not self.labels:
+            return fetch_statuses(connect, list(self.names))
+        expand = ("info", "status") if self.labels else ("status",)
+        snapshot = ConnectSnapshot.from_connect(connect, expand)
+        return {
+            name: state.status
+            for name, state in sorted(snapshot.connectors.items())
+            if self.matches(name, state.config)
+        }
+
+
+def _parse_labels(
+    ctx: click.Context, param: click.Parameter, value: Sequence[str]
+) -> Dict[str, str]:
+    """Click callback to parse the ``--label`` options."""
+    try:
+        return parse_labels(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def selector_options(func: F) -> F:
+    """Add the ``--match`` and ``--label`` options to a command."""
+    func = click.option(
+        "-l",
+        "--label",
+        "labels",
+        multiple=True,
+        callback=_parse_labels,
+        help=(
+            "Select the connectors whose configuration has KEY=VALUE. Can be "
+            "repeated."
+        ),
+    )(func)
+    func = click.option(
+        "-r",
+        "--match",
+        "match",
+        default=None,
+        help="Regex for selecting the connectors.",
+    )(func)
+    return func
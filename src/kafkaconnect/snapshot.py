@@ -0,0 +1,161 @@
+"""A snapshot of the connectors in the Connect cluster."""
+
+__all__ = [
+    "ConnectorState",
+    "ConnectSnapshot",
+    "StatusKey",
+    "flatten_statuses",
+]
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from kafkaconnect.connect import Connect, ConnectError
+
+T = TypeVar("T", bound="ConnectSnapshot")
+
+StatusKey = Tuple[str, Optional[int]]
+"""Connector name and task ID, `None` for the connector itself."""
+
+
+def flatten_statuses(
+    statuses: Mapping[str, Optional[Dict[str, Any]]],
+) -> Dict[StatusKey, Dict[str, Any]]:
+    """Return the status of each connector and task.
+
+    Parameters
+    ----------
+    statuses : `dict`
+        Mapping of connector names to the connector status returned by the
+        Connect API, `None` if it is not available. Connectors without a
+        status are left out.
+    """
+    flattened: Dict[StatusKey, Dict[str, Any]] = {}
+    for name, status in statuses.items():
+        if not status:
+            continue
+        flattened[(name, None)] = status["connector"]
+        for task in status.get("tasks", []):
+            flattened[(name, task["id"])] = task
+    return flattened
+
+
+@dataclass
+class ConnectorState:
+    """Configuration and status of a connector."""
+
+    name: str
+    """Name of the connector."""
+
+    config: Optional[Dict[str, str]] = None
+    """Connector configuration, if requested."""
+
+    status: Optional[Dict[str, Any]] = None
+    """Connector and tasks status, if requested."""
+
+
+@dataclass
+class ConnectSnapshot:
+    """The connectors in the Connect cluster at a given time.
+
+    Parameters
+    ----------
+    connectors : `dict`
+        Mapping of connector names to their state.
+    """
+
+    connectors: Dict[str, ConnectorState] = field(default_factory=dict)
+
+    @property
+    def names(self) -> List[str]:
+        """Return the sorted connector names."""
+        return sorted(self.connectors)
+
+    @property
+    def configs(self) -> Dict[str, Optional[Dict[str, str]]]:
+        """Return the configuration of each connector."""
+        return {name: c.config for name, c in self.connectors.items()}
+
+    @property
+    def statuses(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Return the status of each connector."""
+        return {name: c.status for name, c in self.connectors.items()}
+
+    @staticmethod
+    def _loads(content: str) -> Any:
+        """Parse a Connect API response or raise `ConnectError`.
+
+        `Connect` returns an error message instead of JSON if the request
+        failed.
+        """
+        try:
+            return json.loads(content)
+        except ValueError:
+            raise ConnectError(content)
+
+    @classmethod
+    def from_connect(
+        cls: Type[T],
+        connect: Connect,
+        expand: Sequence[str] = ("info",),
+        max_workers: int = 8,
+    ) -> T:
+        """Create the snapshot from the Connect API.
+
+        The connectors and the requested information are retrieved in a
+        single request using the ``expand`` query parameter. Connect versions
+        that do not support it return a list of names, in which case the
+        information is retrieved concurrently for each connector.
+
+        Parameters
+        ----------
+        connect : `Connect`
+            The Connect API helper.
+        expand : `Sequence`
+            Information to retrieve for each connector, ``info`` and/or
+            ``status``.
+        max_workers : `int`
+            Maximum number of concurrent requests in the fallback mode.
+
+        Raises
+        ------
+        ConnectError
+            If a request to the Connect API fails.
+        """
+        content = cls._loads(connect.list(expand=expand))
+
+        connectors: Dict[str, ConnectorState] = {}
+        if isinstance(content, dict):
+            for name, info in content.items():
+                state = ConnectorState(name=name)
+                if "info" in info:
+                    state.config = info["info"]["config"]
+                if "status" in info:
+                    state.status = info["status"]
+                connectors[name] = state
+            return cls(connectors=connectors)
+
+        def fetch(name: str) -> ConnectorState:
+            state = ConnectorState(name=name)
+            if "info" in expand:
+                state.config = cls._loads(connect.config(name))
+            if "status" in expand:
+                state.status = cls._loads(connect.status(name))
+            return state
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for state in executor.map(fetch, content):
+                connectors[state.name] = state
+        return cls(connectors=connectors)
@@ -0,0 +1,86 @@
+"""Measure the input rate of topics from watermark offset deltas."""
+
+__all__ = ["connector_topics", "partition_rates", "topic_rates"]
+
+import re
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping
+
+from kafkaconnect.kafka_admin import Partition, end_offsets, topic_partitions
+from kafkaconnect.metadata_cache import TopicMetadataCache
+
+if TYPE_CHECKING:
+    from confluent_kafka.admin import AdminClient
+
+
+def connector_topics(
+    config: Mapping[str, Any], cache: TopicMetadataCache
+) -> List[str]:
+    """Return the topics a sink connector consumes.
+
+    Parameters
+    ----------
+    config : `dict`
+        The connector configuration, with the ``topics`` list or the
+        ``topics.regex`` setting.
+    cache : `TopicMetadataCache`
+        The cache of the topic names in Kafka, used to list the topics
+        matching ``topics.regex``.
+    """
+    topics = [t.strip() for t in str(config.get("topics", "")).split(",")]
+    if any(topics):
+        return [t for t in topics if t]
+    regex = config.get("topics.regex")
+    if not regex:
+        return []
+    # Connect matches the whole topic name
+    pattern = re.compile(regex)
+    return [t for t in cache.names() if pattern.fullmatch(t)]
+
+
+def partition_rates(
+    client: "AdminClient",
+    topics: Iterable[str],
+    window: float,
+    timeout: float = 10,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> Dict[Partition, float]:
+    """Sample the input rate of each partition, in messages per second.
+
+    The end offsets of all partitions are requested twice, ``window``
+    seconds apart, with one batched request each time.
+
+    Parameters
+    ----------
+    client : `AdminClient`
+        The Kafka admin client.
+    topics : `Iterable`
+        Names of the topics. Topics that do not exist are ignored.
+    window : `float`
+        The sampling window, in seconds.
+    """
+    partitions = [
+        (topic, partition)
+        for topic, ids in topic_partitions(client, topics, timeout).items()
+        for partition in ids
+    ]
+    start = clock()
+    before = end_offsets(client, partitions, timeout)
+    sleep(window)
+    after = end_offsets(client, partitions, timeout)
+    elapsed = clock() - start
+    if elapsed <= 0:
+        return {key: 0.0 for key in after}
+    return {
+        key: max(0, offset - before.get(key, offset)) / elapsed
+        for key, offset in after.items()
+    }
+
+
+def topic_rates(rates: Mapping[Partition, float]) -> Dict[str, float]:
+    """Sum the partition rates per topic."""
+    totals: Dict[str, float] = {}
+    for (topic, _), rate in rates.items():
+        totals[topic] = totals.get(topic, 0.0) + rate
+    return totals
@@ -0,0 +1 @@
+"""Phase-level timing of the auto-update cycles."""
@@ -0,0 +1,26 @@
+"""CLI to summarize the cycle timing records."""
+
+__all__ = ["timing_summary"]
+
+import json
+from typing import TextIO
+
+import click
+
+from kafkaconnect.timing.summary import summarize
+
+
+@click.command("timing-summary")
+@click.argument("timings", type=click.File("r"), default="-")
+def timing_summary(timings: TextIO) -> int:
+    """Report the p50, p95 and p99 duration of each cycle phase.
+
+    TIMINGS is a file of JSON lines written with the ``--timings`` option of
+    ``create influxdb-sink --auto-update``, or ``-`` to read from stdin.
+    Durations are in seconds.
+    """
+    summary = summarize(timings)
+    if not summary["cycles"]:
+        raise click.ClickException("No timing records found.")
+    click.echo(json.dumps(summary, indent=4, sort_keys=True))
+    return 0
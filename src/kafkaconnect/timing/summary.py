@@ -0,0 +1,76 @@
+"""Summarize the cycle timing records."""
+
+__all__ = ["percentile", "summarize"]
+
+import json
+import math
+from numbers import Real
+from typing import Any, Dict, Iterable, List, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the ``q`` percentile of sorted values, by nearest rank."""
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[rank - 1]
+
+
+def summarize(lines: Iterable[str]) -> Dict[str, Any]:
+    """Return the p50, p95 and p99 duration of each phase.
+
+    Parameters
+    ----------
+    lines : `Iterable`
+        JSON lines written by `CycleTimer`. Blank lines are ignored, and
+        lines that are not timing records are skipped.
+
+    Returns
+    -------
+    summary : `dict`
+        The number of cycles and of skipped lines, and the number of
+        samples and percentiles of each phase and of the whole cycle, in
+        seconds. Phases that only run in some cycles, such as the connector
+        update, have fewer samples.
+    """
+    durations: Dict[str, List[float]] = {}
+    cycles = 0
+    skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not _is_record(record):
+            skipped += 1
+            continue
+        cycles += 1
+        durations.setdefault("total", []).append(record["total"])
+        for phase, duration in record["phases"].items():
+            durations.setdefault(phase, []).append(duration)
+
+    phases = {}
+    for phase, values in durations.items():
+        values.sort()
+        phases[phase] = {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1],
+        }
+    return {"cycles": cycles, "skipped": skipped, "phases": phases}
+
+
+def _is_record(record: Any) -> bool:
+    """Return whether a JSON value is a cycle timing record."""
+    return (
+        isinstance(record, dict)
+        and _is_duration(record.get("total"))
+        and isinstance(record.get("phases"), dict)
+        and all(_is_duration(d) for d in record["phases"].values())
+    )
+
+
+def _is_duration(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
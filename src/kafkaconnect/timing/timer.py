@@ -0,0 +1,95 @@
+"""Time the phases of a cycle and write a JSON line per cycle.
+
+Each record has the cycle number, the duration of each phase and of the
+whole cycle in seconds, and extra fields such as the number of topics::
+
+    {"timestamp": "...", "cycle": 3, "total": 0.412,
+     "phases": {"list_topics": 0.105, "filter": 0.002, ...}, "topics": 1200}
+"""
+
+__all__ = ["CycleTimer", "open_timings"]
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
+
+
+class CycleTimer:
+    """Record the duration of the phases of each cycle.
+
+    Parameters
+    ----------
+    output : `TextIO`, optional
+        Stream to write the JSON lines to. Timing is disabled if `None`.
+    clock : `Callable`
+        High resolution clock, for testing.
+    """
+
+    def __init__(
+        self,
+        output: Optional[TextIO],
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._output = output
+        self._clock = clock
+        self.cycles = 0
+        self._start = 0.0
+        self._phases: Dict[str, float] = {}
+
+    def start(self) -> None:
+        """Start a cycle."""
+        self._start = self._clock()
+        self._phases = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the cycle.
+
+        A phase that runs several times in a cycle accumulates its time.
+        """
+        if self._output is None:
+            yield
+            return
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            self._phases[name] = self._phases.get(name, 0.0) + elapsed
+
+    def end(self, **fields: Any) -> Optional[Dict[str, Any]]:
+        """End the cycle and write its record.
+
+        Returns
+        -------
+        record : `dict` or `None`
+            The timing record, `None` if timing is disabled.
+        """
+        self.cycles += 1
+        if self._output is None:
+            return None
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "cycle": self.cycles,
+            "total": round(self._clock() - self._start, 6),
+            "phases": {k: round(v, 6) for k, v in self._phases.items()},
+            **fields,
+        }
+        self._output.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._output.flush()
+        return record
+
+
+def open_timings(path: Optional[str]) -> Optional[TextIO]:
+    """Open the timings output, ``-`` is stderr and `None` disables it.
+
+    Records are appended to an existing file.
+    """
+    if path is None:
+        return None
+    if path == "-":
+        return sys.stderr
+    return open(path, "a")
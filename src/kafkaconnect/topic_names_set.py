@@ -2,31 +2,22 @@
 
 __all__ = ["TopicNamesSet"]
 
-import logging
 import re
-from typing import List, Optional, Set, Type, TypeVar
-
-from confluent_kafka import KafkaException
-from confluent_kafka.admin import AdminClient
+from typing import Iterable, Optional, Type, TypeVar
 
 from kafkaconnect.config import Config
+from kafkaconnect.topic_store import TopicStore
 
 T = TypeVar("T", bound="TopicNamesSet")
 
 
-logger = logging.getLogger("kafkaconnect")
-
-SECURITY_PROTOCOL = "SASL_PLAINTEXT"
-SASL_MECHANISM = "SCRAM-SHA-512"
-
-
 class TopicNamesSet:
     """A set of topics names used to configure the connector.
 
     Parameters
     ----------
-    topic_names_list : `List`
-        A list topic names
+    topic_names_list : `Iterable`
+        A list topic names, or a `TopicStore`.
     select_regex : `str`
         A regex to add topic names to the set.
     exclude_regex : `str`
@@ -43,7 +34,7 @@ class TopicNamesSet:
 
     def __init__(
         self,
-        topic_names_list: List,
+        topic_names_list: Iterable[str],
         select_regex: str = ".*",
         exclude_regex: Optional[str] = None,
     ) -> None:
@@ -52,28 +43,26 @@ class TopicNamesSet:
         self.exclude_regex = exclude_regex
         self.topic_names_set = self.filter_topics()
 
-    def filter_topics(self) -> Set[str]:
+    def filter_topics(self) -> TopicStore:
         """Filter a list of topic names.
 
         Returns
         -------
-        topic_names_set: `Set`
-            A a set of topic names.
+        topic_names_set: `TopicStore`
+            A sorted set of topic names, sharing its strings with
+            ``topic_names_list`` if it is a `TopicStore`.
         """
-        topic_names_set = set(self.topic_names_list)
+        topic_names_set = TopicStore(self.topic_names_list)
 
         if self.select_regex:
             pattern = re.compile(self.select_regex)
-            topic_names_set = {
-                topic for topic in topic_names_set if pattern.match(topic)
-            }
+            topic_names_set = topic_names_set.filter(pattern.match)
 
         if self.exclude_regex:
             pattern = re.compile(self.exclude_regex)
-            excluded_topic_names = {
-                topic for topic in topic_names_set if pattern.match(topic)
-            }
-            topic_names_set = topic_names_set - excluded_topic_names
+            topic_names_set = topic_names_set.filter(
+                lambda topic: not pattern.match(topic)
+            )
 
         return topic_names_set
 
@@ -84,37 +73,15 @@ class TopicNamesSet:
         select_regex: str = ".*",
         exclude_regex: Optional[str] = None,
     ) -> T:
-        """Create the topic name set from a list of topic names in Kafka."""
-        if config.sasl_plain_username and config.sasl_plain_password:
-            kafka_config = {
-                "bootstrap.servers": config.broker_url,
-                "security.protocol": SECURITY_PROTOCOL,
-                "sasl.mechanisms": SASL_MECHANISM,
-                "sasl.username": config.sasl_plain_username,
-                "sasl.password": config.sasl_plain_password,
-            }
-        elif (
-            config.sasl_plain_username is None
-            and config.sasl_plain_password is None
-        ):
-            kafka_config = {"bootstrap.servers": config.broker_url}
-        else:
-            raise ValueError(
-                "Both or neither of 'config.sasl_plain_username' "
-                "and 'config.sasl_plain_password' must be set."
-            )
-        try:
-            broker_client = AdminClient(kafka_config)
-        except KafkaException:
-            message = (
-                f"Failed to establish connection with broker "
-                f"{config.broker_url}."
-            )
-            logger.error(message)
+        """Create the topic name set from a list of topic names in Kafka.
+
+        The topic names come from the process-wide topic metadata cache,
+        which reuses its admin client. A new listing is always requested,
+        and it is shared with the other callers of the cache.
+        """
+        from kafkaconnect.metadata_cache import shared_cache
 
-        topic_names_list: List = broker_client.list_topics(
-            timeout=10
-        ).topics.keys()
+        topic_names_list = shared_cache(config).names(max_age=0)
 
         return cls(
             topic_names_list=topic_names_list,
@@ -0,0 +1,123 @@
+"""A compact, sorted set of topic names.
+
+Clusters with up to millions of topics are listed again on every cycle of
+the topic discovery. A `TopicStore` keeps the names in a single sorted tuple
+instead of a hash set. When a listing is stored with the previous store,
+the names that did not change are interned against it: the store holds the
+previous string objects and the strings of the new listing are released.
+Membership is a binary search and the difference between two stores is a
+linear merge of the sorted names, without intermediate sets.
+"""
+
+__all__ = ["TopicStore"]
+
+from bisect import bisect_left
+from itertools import groupby
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+class TopicStore(AbstractSet[str]):
+    """An immutable, sorted set of topic names.
+
+    Parameters
+    ----------
+    names : `Iterable`
+        Topic names, in any order and possibly with duplicates.
+    previous : `TopicStore`, optional
+        A previous store of the same names. The names found in it are
+        replaced by its string objects, so that successive listings of the
+        same topics share their strings.
+    """
+
+    __slots__ = ("_names",)
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        previous: Optional["TopicStore"] = None,
+    ) -> None:
+        if isinstance(names, TopicStore):
+            self._names: Tuple[str, ...] = names._names
+            return
+        shared = previous._names if previous is not None else ()
+        unique = []
+        i = 0
+        for name, _ in groupby(sorted(names)):
+            # Both sequences are sorted, a single pass finds shared names
+            while i < len(shared) and shared[i] < name:
+                i += 1
+            if i < len(shared) and shared[i] == name:
+                name = shared[i]
+            unique.append(name)
+        self._names = tuple(unique)
+
+    @classmethod
+    def _from_sorted(cls, names: Tuple[str, ...]) -> "TopicStore":
+        """Create a store from names that are already sorted and unique."""
+        store = cls.__new__(cls)
+        store._names = names
+        return store
+
+    def __contains__(self, name: object) -> bool:
+        """Search a name with a binary search."""
+        if not isinstance(name, str):
+            return False
+        i = bisect_left(self._names, name)
+        return i < len(self._names) and self._names[i] == name
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names in sorted order."""
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        """Return the number of names."""
+        return len(self._names)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another store, or with any set of names."""
+        if isinstance(other, TopicStore):
+            return self._names == other._names
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        """Return the sorted names."""
+        return f"TopicStore({list(self._names)!r})"
+
+    def __sub__(self, other: AbstractSet[Any]) -> "TopicStore":
+        """Return the names that are not in another set."""
+        if isinstance(other, TopicStore):
+            return self._from_sorted(tuple(self.difference(other)))
+        return self._from_sorted(
+            tuple(name for name in self._names if name not in other)
+        )
+
+    def difference(self, other: "TopicStore") -> List[str]:
+        """Return the sorted names that are not in another store."""
+        result = []
+        theirs = other._names
+        j = 0
+        for name in self._names:
+            while j < len(theirs) and theirs[j] < name:
+                j += 1
+            if j == len(theirs) or theirs[j] != name:
+                result.append(name)
+        return result
+
+    def filter(self, predicate: Callable[[str], Any]) -> "TopicStore":
+        """Return the names for which a predicate is true.
+
+        The names are shared with this store, they are neither copied nor
+        sorted again.
+        """
+        return self._from_sorted(
+            tuple(name for name in self._names if predicate(name))
+        )
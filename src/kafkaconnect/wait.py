@@ -0,0 +1,93 @@
+"""Fetch the status of connectors and wait for a target state."""
+
+__all__ = ["fetch_statuses", "connector_state", "wait_for_state"]
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from kafkaconnect.connect import Connect
+
+
+def fetch_statuses(
+    connect: Connect, names: Sequence[str], max_workers: int = 8
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Fetch the status of the connectors concurrently.
+
+    The status is `None` for connectors whose status could not be fetched.
+    """
+
+    def fetch(name: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(connect.status(name))
+        except ValueError:
+            return None
+
+    if not names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as ex:
+        return dict(zip(names, ex.map(fetch, names)))
+
+
+def connector_state(status: Optional[Dict[str, Any]]) -> str:
+    """Summarize the connector and tasks states.
+
+    Returns the common state if the connector and all its tasks are in the
+    same state, ``MIXED`` if they are not, and ``UNKNOWN`` if the status is
+    not available.
+    """
+    if not status:
+        return "UNKNOWN"
+    states = {status["connector"]["state"]}
+    states.update(task["state"] for task in status.get("tasks", []))
+    if len(states) == 1:
+        return states.pop()
+    return "MIXED"
+
+
+def wait_for_state(
+    connect: Connect,
+    names: Sequence[str],
+    state: str,
+    timeout: float,
+    interval: float = 2.0,
+    max_workers: int = 8,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> Dict[str, str]:
+    """Wait until the connectors and their tasks reach a state.
+
+    Parameters
+    ----------
+    connect : `Connect`
+        The Connect API helper.
+    names : `Sequence`
+        Names of the connectors.
+    state : `str`
+        The target state, for example ``RUNNING`` or ``PAUSED``.
+    timeout : `float`
+        Maximum time to wait, in seconds.
+    interval : `float`
+        Time between status polls, in seconds.
+    max_workers : `int`
+        Maximum number of concurrent status requests.
+
+    Returns
+    -------
+    states : `dict`
+        The last observed state of each connector, as returned by
+        `connector_state`. All states are equal to ``state`` unless the
+        timeout expired.
+    """
+    deadline = clock() + timeout
+    pending = list(names)
+    states: Dict[str, str] = {}
+    while True:
+        statuses = fetch_statuses(connect, pending, max_workers)
+        for name, status in statuses.items():
+            states[name] = connector_state(status)
+        pending = [n for n in pending if states[n] != state]
+        if not pending or clock() >= deadline:
+            return states
+        sleep(interval)
@@ -0,0 +1 @@
+"""Watch connector and task state transitions."""
@@ -0,0 +1,94 @@
+"""CLI to watch connector and task state transitions."""
+
+__all__ = ["watch"]
+
+import re
+import time
+from typing import Optional, Tuple
+
+import click
+
+from kafkaconnect import profiling
+from kafkaconnect.connect import Connect, ConnectError
+from kafkaconnect.snapshot import ConnectSnapshot
+from kafkaconnect.watch.events import StatusTracker
+
+
+@click.command("watch")
+@click.argument("names", nargs=-1, required=False)
+@click.option(
+    "-r",
+    "--match",
+    "match",
+    default=None,
+    help="Regex for selecting the connectors to watch.",
+)
+@click.option(
+    "--interval",
+    "interval",
+    envvar="KAFKA_CONNECT_WATCH_INTERVAL",
+    default=15000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=(
+        "The interval, in milliseconds, to poll the connectors status. "
+        "Alternatively set via the $KAFKA_CONNECT_WATCH_INTERVAL env var."
+    ),
+)
+@click.option(
+    "--no-initial",
+    "no_initial",
+    is_flag=True,
+    help="Do not report the states observed in the first poll.",
+)
+@click.option(
+    "--count",
+    "count",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Stop after polling the status this number of times.",
+)
+@click.pass_context
+def watch(
+    ctx: click.Context,
+    names: Tuple[str, ...],
+    match: Optional[str],
+    interval: int,
+    no_initial: bool,
+    count: Optional[int],
+) -> int:
+    """Watch the connectors and report the state transitions.
+
+    The status of all connectors is polled with a single request and only
+    the connector and task state transitions are reported, as
+    newline-delimited JSON events. Use NAMES or ``--match`` to select the
+    connectors to watch, by default all connectors are watched.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+    pattern = re.compile(match) if match else None
+    tracker = StatusTracker(initial=not no_initial)
+
+    polls = 0
+    while True:
+        with profiling.cycle():
+            try:
+                snapshot = ConnectSnapshot.from_connect(connect, ("status",))
+            except ConnectError as e:
+                click.echo(str(e), err=True)
+            else:
+                statuses = {
+                    name: status
+                    for name, status in snapshot.statuses.items()
+                    if (not names or name in names)
+                    and (not pattern or pattern.match(name))
+                }
+                for event in tracker.update(statuses):
+                    click.echo(event.asjson())
+        polls += 1
+        if count and polls >= count:
+            return 0
+        try:
+            time.sleep(interval / 1000)
+        except KeyboardInterrupt:
+            raise click.ClickException("Interruped.")
@@ -0,0 +1,118 @@
+"""Track connector and task states and report transitions."""
+
+__all__ = ["StatusEvent", "StatusTracker"]
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from kafkaconnect.snapshot import StatusKey as Key
+from kafkaconnect.snapshot import flatten_statuses
+
+DELETED = "DELETED"
+"""State reported when a connector or task is no longer in the cluster."""
+
+
+@dataclass
+class StatusEvent:
+    """A connector or task state transition."""
+
+    timestamp: str
+    """Time when the transition was observed, in ISO 8601 format."""
+
+    connector: str
+    """Name of the connector."""
+
+    task: Optional[int]
+    """Task ID, `None` for the connector itself."""
+
+    previous: Optional[str]
+    """Previous state, `None` the first time the state is observed."""
+
+    state: str
+    """Current state."""
+
+    worker_id: Optional[str]
+    """Worker running the connector or task."""
+
+    trace: Optional[str] = None
+    """First line of the error trace, for failed connectors and tasks."""
+
+    def asjson(self) -> str:
+        """Serialize the event as a single line of JSON."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+
+class StatusTracker:
+    """Keep the last observed states and report the transitions.
+
+    Only the connectors and tasks present in the last update are kept, so
+    memory is bounded by the size of the cluster regardless of how long
+    the tracker runs.
+
+    Parameters
+    ----------
+    initial : `bool`
+        Whether to report the states observed for the first time.
+    """
+
+    def __init__(self, initial: bool = True) -> None:
+        self._initial = initial
+        self._states: Dict[Key, Tuple[str, Optional[str]]] = {}
+
+    def update(
+        self,
+        statuses: Mapping[str, Optional[Dict[str, Any]]],
+        timestamp: Optional[datetime] = None,
+    ) -> List[StatusEvent]:
+        """Update the states and return the transitions.
+
+        Parameters
+        ----------
+        statuses : `dict`
+            Mapping of connector names to the connector status returned by
+            the Connect API.
+        timestamp : `datetime`
+            Time of the observation, defaults to now.
+        """
+        isotime = (timestamp or datetime.now(timezone.utc)).isoformat()
+        observed = flatten_statuses(statuses)
+        events = []
+        for key, status in observed.items():
+            state = status["state"]
+            worker_id = status.get("worker_id")
+            previous = self._states.get(key)
+            if previous == (state, worker_id):
+                continue
+            if previous is not None or self._initial:
+                trace = status.get("trace")
+                events.append(
+                    StatusEvent(
+                        timestamp=isotime,
+                        connector=key[0],
+                        task=key[1],
+                        previous=previous[0] if previous else None,
+                        state=state,
+                        worker_id=worker_id,
+                        trace=trace.splitlines()[0] if trace else None,
+                    )
+                )
+            self._states[key] = (state, worker_id)
+
+        removed = self._states.keys() - observed.keys()
+        for key in sorted(
+            removed, key=lambda k: (k[0], k[1] is not None, k[1])
+        ):
+            previous_state, worker_id = self._states.pop(key)
+            events.append(
+                StatusEvent(
+                    timestamp=isotime,
+                    connector=key[0],
+                    task=key[1],
+                    previous=previous_state,
+                    state=DELETED,
+                    worker_id=worker_id,
+                )
+            )
+        return events
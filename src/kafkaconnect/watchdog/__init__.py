@@ -0,0 +1 @@
+"""Restart failed connectors and tasks automatically."""
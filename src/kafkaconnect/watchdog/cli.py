@@ -0,0 +1,141 @@
+"""CLI to restart failed connectors and tasks automatically."""
+
+__all__ = ["watchdog"]
+
+import json
+import re
+import time
+from typing import Optional, Tuple
+
+import click
+
+from kafkaconnect import profiling
+from kafkaconnect.connect import Connect, ConnectError
+from kafkaconnect.snapshot import ConnectSnapshot
+from kafkaconnect.watchdog.policy import RestartPolicy
+from kafkaconnect.watchdog.watchdog import Watchdog
+
+
+@click.command("watchdog")
+@click.argument("names", nargs=-1, required=False)
+@click.option(
+    "-r",
+    "--match",
+    "match",
+    default=None,
+    help="Regex for selecting the connectors to watch.",
+)
+@click.option(
+    "--interval",
+    "interval",
+    envvar="KAFKA_CONNECT_WATCHDOG_INTERVAL",
+    default=15000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=(
+        "The interval, in milliseconds, to poll the connectors status. "
+        "Alternatively set via the $KAFKA_CONNECT_WATCHDOG_INTERVAL env var."
+    ),
+)
+@click.option(
+    "--backoff-initial",
+    "backoff_initial",
+    default=30000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Delay, in milliseconds, after the first restart of a task.",
+)
+@click.option(
+    "--backoff-max",
+    "backoff_max",
+    default=900000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=(
+        "Maximum delay, in milliseconds, between restarts of a task. A task "
+        "that keeps running for this long is considered recovered."
+    ),
+)
+@click.option(
+    "--max-attempts",
+    "max_attempts",
+    default=5,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of restarts before giving up on a task that keeps failing.",
+)
+@click.option(
+    "--budget",
+    "budget",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of restarts in the cluster per budget window.",
+)
+@click.option(
+    "--budget-window",
+    "budget_window",
+    default=600000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Length, in milliseconds, of the restart budget window.",
+)
+@click.option(
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    help="Report the restart decisions without restarting.",
+)
+@click.pass_context
+def watchdog(
+    ctx: click.Context,
+    names: Tuple[str, ...],
+    match: Optional[str],
+    interval: int,
+    backoff_initial: int,
+    backoff_max: int,
+    max_attempts: int,
+    budget: int,
+    budget_window: int,
+    dry_run: bool,
+) -> int:
+    """Restart failed connectors and tasks automatically.
+
+    The status of the connectors is polled and failed tasks are restarted
+    individually, with an exponential backoff per task and a cluster-wide
+    restart budget. Tasks that keep failing are given up after
+    ``--max-attempts`` restarts. Use NAMES or ``--match`` to select the
+    connectors, by default all connectors are watched. Restart decisions
+    are reported as newline-delimited JSON events.
+    """
+    config = ctx.obj["config"]
+    connect = Connect(config.connect_url)
+    pattern = re.compile(match) if match else None
+    policy = RestartPolicy(
+        backoff_initial=backoff_initial / 1000,
+        backoff_max=backoff_max / 1000,
+        max_attempts=max_attempts,
+        budget=budget,
+        budget_window=budget_window / 1000,
+    )
+    dog = Watchdog(connect, policy, dry_run=dry_run)
+
+    while True:
+        with profiling.cycle():
+            try:
+                snapshot = ConnectSnapshot.from_connect(connect, ("status",))
+            except ConnectError as e:
+                click.echo(str(e), err=True)
+            else:
+                statuses = {
+                    name: status
+                    for name, status in snapshot.statuses.items()
+                    if (not names or name in names)
+                    and (not pattern or pattern.match(name))
+                }
+                for event in dog.check(statuses):
+                    click.echo(json.dumps(event, separators=(",", ":")))
+        try:
+            time.sleep(interval / 1000)
+        except KeyboardInterrupt:
+            raise click.ClickException("Interruped.")
@@ -0,0 +1,131 @@
+"""Restart policy with per-task backoff and a cluster-wide budget."""
+
+__all__ = ["Decision", "RestartPolicy"]
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, Dict, Hashable, Iterable, Optional
+
+
+class Decision(Enum):
+    """Outcome of a restart request."""
+
+    RESTART = "restart"
+    """Restart the task now."""
+
+    BACKOFF = "backoff"
+    """The task was restarted recently, wait for the backoff delay."""
+
+    BUDGET = "budget"
+    """The cluster-wide restart budget is exhausted."""
+
+    GIVE_UP = "give up"
+    """The task keeps failing, stop restarting it."""
+
+
+@dataclass
+class _TaskRecord:
+    attempts: int = 0
+    next_attempt: float = 0.0
+    running_since: Optional[float] = None
+
+
+class RestartPolicy:
+    """Decide when failed connectors and tasks are restarted.
+
+    Each task is restarted with an exponential backoff, and is given up
+    after ``max_attempts`` restarts that did not keep it running for at
+    least ``stable_after`` seconds. At most ``budget`` restarts are allowed
+    in the whole cluster per ``budget_window`` seconds, so that a broken
+    sink or worker does not cause a restart storm.
+
+    Parameters
+    ----------
+    backoff_initial : `float`
+        Delay, in seconds, after the first restart.
+    backoff_max : `float`
+        Maximum delay, in seconds, between restarts.
+    max_attempts : `int`
+        Number of restarts before giving up on a task.
+    budget : `int`
+        Maximum number of restarts per budget window.
+    budget_window : `float`
+        Length of the budget window, in seconds.
+    stable_after : `float`
+        Time, in seconds, a task must keep running for its restart count to
+        be reset. Defaults to ``backoff_max``.
+    clock : `Callable`
+        Monotonic clock, for testing.
+    """
+
+    def __init__(
+        self,
+        backoff_initial: float,
+        backoff_max: float,
+        max_attempts: int,
+        budget: int,
+        budget_window: float,
+        stable_after: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.budget = budget
+        self.budget_window = budget_window
+        self.stable_after = (
+            backoff_max if stable_after is None else stable_after
+        )
+        self._clock = clock
+        self._records: Dict[Hashable, _TaskRecord] = {}
+        self._restarts: Deque[float] = deque()
+
+    def failed(self, key: Hashable) -> Decision:
+        """Decide whether to restart a failed task now.
+
+        A `Decision.RESTART` decision is recorded as a restart.
+        """
+        now = self._clock()
+        record = self._records.setdefault(key, _TaskRecord())
+        record.running_since = None
+        if record.attempts >= self.max_attempts:
+            return Decision.GIVE_UP
+        if now < record.next_attempt:
+            return Decision.BACKOFF
+
+        while self._restarts and now - self._restarts[0] >= self.budget_window:
+            self._restarts.popleft()
+        if len(self._restarts) >= self.budget:
+            return Decision.BUDGET
+
+        delay = self.backoff_initial * 2**record.attempts
+        record.attempts += 1
+        record.next_attempt = now + min(delay, self.backoff_max)
+        self._restarts.append(now)
+        return Decision.RESTART
+
+    def running(self, key: Hashable) -> None:
+        """Record that a task is running.
+
+        The restart count is reset once the task is stable.
+        """
+        record = self._records.get(key)
+        if record is None:
+            return
+        now = self._clock()
+        if record.running_since is None:
+            record.running_since = now
+        elif now - record.running_since >= self.stable_after:
+            del self._records[key]
+
+    def forget(self, keys: Iterable[Hashable]) -> None:
+        """Forget the tasks that no longer exist."""
+        for key in keys:
+            self._records.pop(key, None)
+
+    @property
+    def tracked(self) -> Iterable[Hashable]:
+        """Return the tasks with a restart history."""
+        return list(self._records)
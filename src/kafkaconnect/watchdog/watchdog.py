@@ -0,0 +1,99 @@
+"""Detect failed connectors and tasks and restart them."""
+
+__all__ = ["Watchdog"]
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional
+
+from kafkaconnect.connect import Connect
+from kafkaconnect.snapshot import StatusKey as Key
+from kafkaconnect.snapshot import flatten_statuses
+from kafkaconnect.watchdog.policy import Decision, RestartPolicy
+
+FAILED = "FAILED"
+
+
+class Watchdog:
+    """Restart the failed connectors and tasks following a policy.
+
+    Failed tasks are restarted individually, so that the healthy tasks of
+    the connector keep running.
+
+    Parameters
+    ----------
+    connect : `Connect`
+        The Connect API helper.
+    policy : `RestartPolicy`
+        The restart policy.
+    dry_run : `bool`
+        Report the decisions without restarting.
+    """
+
+    def __init__(
+        self, connect: Connect, policy: RestartPolicy, dry_run: bool = False
+    ) -> None:
+        self._connect = connect
+        self.policy = policy
+        self.dry_run = dry_run
+        # Only changes of decision are reported for tasks that stay failed
+        self._last_decisions: Dict[Key, Decision] = {}
+
+    def _restart(self, key: Key) -> str:
+        if self.dry_run:
+            return ""
+        name, task_id = key
+        if task_id is None:
+            return self._connect.restart(name)
+        return self._connect.restart_task(name, task_id)
+
+    def check(
+        self, statuses: Mapping[str, Optional[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Check the status of the connectors and restart the failed ones.
+
+        Parameters
+        ----------
+        statuses : `dict`
+            Mapping of connector names to the connector status returned by
+            the Connect API.
+
+        Returns
+        -------
+        events : `list`
+            The restart decisions, for reporting.
+        """
+        observed = flatten_statuses(statuses)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        events = []
+        for key, status in observed.items():
+            if status["state"] != FAILED:
+                self.policy.running(key)
+                self._last_decisions.pop(key, None)
+                continue
+            decision = self.policy.failed(key)
+            if decision == Decision.RESTART:
+                response = self._restart(key)
+            elif self._last_decisions.get(key) == decision:
+                continue
+            else:
+                response = ""
+            self._last_decisions[key] = decision
+            events.append(
+                {
+                    "timestamp": timestamp,
+                    "connector": key[0],
+                    "task": key[1],
+                    "worker_id": status.get("worker_id"),
+                    "decision": decision.value,
+                    "response": response,
+                }
+            )
+
+        # Forget the connectors and tasks that no longer exist
+        self.policy.forget(
+            [k for k in self.policy.tracked if k not in observed]
+        )
+        self._last_decisions = {
+            k: d for k, d in self._last_decisions.items() if k in observed
+        }
+        return events
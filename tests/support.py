@@ -0,0 +1,259 @@
+"""Test support code."""
+
+__all__ = ["FakeConnect", "FakeAdminClient"]
+
+import json
+from concurrent.futures import Future
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class FakeConnect:
+    """An in-memory stand-in for the `kafkaconnect.connect.Connect` helper.
+
+    Responses are JSON strings formatted like the Connect API responses, and
+    the requests are recorded in ``calls``.
+    """
+
+    def __init__(self) -> None:
+        self.configs: Dict[str, Dict[str, str]] = {}
+        self.states: Dict[str, str] = {}
+        self.task_states: Dict[str, List[str]] = {}
+        self.connector_offsets: Dict[str, List[Any]] = {}
+        self.calls: List[Any] = []
+
+    def add(
+        self,
+        name: str,
+        config: Optional[Dict[str, str]] = None,
+        state: str = "RUNNING",
+        tasks: Sequence[str] = ("RUNNING",),
+    ) -> None:
+        """Add a connector."""
+        self.configs[name] = {"name": name, **(config or {})}
+        self.states[name] = state
+        self.task_states[name] = list(tasks)
+
+    def _status(self, name: str) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "connector": {"state": self.states[name], "worker_id": "w1"},
+            "tasks": [
+                {"id": i, "state": s, "worker_id": "w1"}
+                for i, s in enumerate(self.task_states[name])
+            ],
+            "type": "sink",
+        }
+
+    def list(self, expand: Sequence[str] = ()) -> str:
+        """Get the connectors."""
+        self.calls.append(("list", tuple(expand)))
+        if not expand:
+            return json.dumps(sorted(self.configs))
+        content: Dict[str, Any] = {}
+        for name, config in self.configs.items():
+            content[name] = {}
+            if "info" in expand:
+                content[name]["info"] = {"name": name, "config": config}
+            if "status" in expand:
+                content[name]["status"] = self._status(name)
+        return json.dumps(content)
+
+    def config(self, name: str) -> str:
+        """Get the connector configuration."""
+        self.calls.append(("config", name))
+        if name not in self.configs:
+            return f"Resource {name} not found."
+        return json.dumps(self.configs[name])
+
+    def status(self, name: str) -> str:
+        """Get the connector status."""
+        self.calls.append(("status", name))
+        if name not in self.configs:
+            return f"Resource {name} not found."
+        return json.dumps(self._status(name))
+
+    def validate(self, name: str, connect_config: str) -> str:
+        """Validate the connector configuration."""
+        self.calls.append(("validate", name))
+        return json.dumps({"name": name, "error_count": 0, "configs": []})
+
+    def create_or_update(self, name: str, connect_config: str) -> str:
+        """Create or update a connector."""
+        self.calls.append(("create_or_update", name))
+        config = {
+            k: v if isinstance(v, str) else json.dumps(v)
+            for k, v in json.loads(connect_config).items()
+        }
+        self.configs[name] = config
+        self.states.setdefault(name, "RUNNING")
+        self.task_states.setdefault(name, ["RUNNING"])
+        return json.dumps({"name": name, "config": config, "tasks": []})
+
+    def topics(self, name: str) -> str:
+        """Get the connector active topics."""
+        self.calls.append(("topics", name))
+        if name not in self.configs:
+            return f"Resource {name} not found."
+        topics = self.configs[name].get("topics", "")
+        return json.dumps({name: {"topics": topics.split(",")}})
+
+    def restart(
+        self, name: str, include_tasks: bool = False, only_failed: bool = False
+    ) -> str:
+        """Restart the connector."""
+        self.calls.append(("restart", name))
+        self.states[name] = "RUNNING"
+        return ""
+
+    def restart_task(self, name: str, task_id: int) -> str:
+        """Restart a connector task."""
+        self.calls.append(("restart_task", name, task_id))
+        self.task_states[name][task_id] = "RUNNING"
+        return ""
+
+    def pause(self, name: str) -> str:
+        """Pause the connector and its tasks."""
+        self.calls.append(("pause", name))
+        if name not in self.configs:
+            return f"Resource {name} not found."
+        self.states[name] = "PAUSED"
+        self.task_states[name] = ["PAUSED"] * len(self.task_states[name])
+        return ""
+
+    def resume(self, name: str) -> str:
+        """Resume the connector and its tasks."""
+        self.calls.append(("resume", name))
+        if name not in self.configs:
+            return f"Resource {name} not found."
+        self.states[name] = "RUNNING"
+        self.task_states[name] = ["RUNNING"] * len(self.task_states[name])
+        return ""
+
+    def stop(self, name: str) -> str:
+        """Stop the connector and shut down its tasks."""
+        self.calls.append(("stop", name))
+        if name not in self.configs:
+            return f"Resource {name} not found."
+        self.states[name] = "STOPPED"
+        self.task_states[name] = []
+        return ""
+
+    def offsets(self, name: str) -> str:
+        """Get the connector offsets."""
+        self.calls.append(("offsets", name))
+        return json.dumps({"offsets": self.connector_offsets.get(name, [])})
+
+    def alter_offsets(self, name: str, offsets: str) -> str:
+        """Alter the offsets of a stopped connector."""
+        self.calls.append(("alter_offsets", name))
+        if self.states.get(name) != "STOPPED":
+            return json.dumps(
+                {"error_code": 400, "message": "Connector is not stopped."}
+            )
+        self.connector_offsets[name] = json.loads(offsets)["offsets"]
+        return json.dumps({"message": "The offsets have been altered."})
+
+    def reset_offsets(self, name: str) -> str:
+        """Reset the offsets of a stopped connector."""
+        self.calls.append(("reset_offsets", name))
+        if self.states.get(name) != "STOPPED":
+            return json.dumps(
+                {"error_code": 400, "message": "Connector is not stopped."}
+            )
+        self.connector_offsets.pop(name, None)
+        return json.dumps({"message": "The offsets have been reset."})
+
+    def remove(self, name: str) -> str:
+        """Delete a connector."""
+        self.calls.append(("remove", name))
+        del self.configs[name]
+        return ""
+
+
+class FakeAdminClient:
+    """An in-memory stand-in for the ``confluent_kafka`` admin client.
+
+    The end offsets of the partitions are set in ``offsets``, the start
+    offsets in ``start``, by default ``0``, the committed offsets of the
+    consumer groups in ``committed``, and the requests are recorded in
+    ``calls``.
+    """
+
+    def __init__(self, offsets: Optional[Dict[Tuple[str, int], int]] = None):
+        self.offsets = dict(offsets or {})
+        self.start: Dict[Tuple[str, int], int] = {}
+        self.committed: Dict[str, Dict[Tuple[str, int], int]] = {}
+        self.calls: List[Any] = []
+
+    def list_topics(self, timeout: float = -1) -> Any:
+        """Return the cluster metadata."""
+        self.calls.append("list_topics")
+        topics: Dict[str, Any] = {}
+        for topic, partition in self.offsets:
+            metadata = topics.setdefault(
+                topic, SimpleNamespace(partitions={}, error=None)
+            )
+            metadata.partitions[partition] = SimpleNamespace(id=partition)
+        return SimpleNamespace(topics=topics)
+
+    def describe_topics(self, topics: Any, **kwargs: Any) -> Any:
+        """Return the description of the topics as futures."""
+        from confluent_kafka import KafkaError, KafkaException
+
+        self.calls.append("describe_topics")
+        futures = {}
+        for topic in topics.topic_names:
+            future: Future = Future()
+            partitions = [p for t, p in self.offsets if t == topic]
+            if partitions:
+                future.set_result(
+                    SimpleNamespace(
+                        partitions=[SimpleNamespace(id=p) for p in partitions]
+                    )
+                )
+            else:
+                future.set_exception(
+                    KafkaException(
+                        KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART)
+                    )
+                )
+            futures[topic] = future
+        return futures
+
+    def list_offsets(self, request: Dict[Any, Any], **kwargs: Any) -> Any:
+        """Return the end or start offsets of the partitions as futures."""
+        self.calls.append("list_offsets")
+        futures = {}
+        for tp, spec in request.items():
+            key = (tp.topic, tp.partition)
+            if type(spec).__name__ == "EarliestSpec":
+                offset = self.start.get(key, 0)
+            else:
+                offset = self.offsets[key]
+            future: Future = Future()
+            future.set_result(SimpleNamespace(offset=offset))
+            futures[tp] = future
+        return futures
+
+    def list_consumer_group_offsets(
+        self, request: List[Any], **kwargs: Any
+    ) -> Any:
+        """Return the committed offsets of a consumer group as a future."""
+        (group,) = request
+        self.calls.append(("list_consumer_group_offsets", group.group_id))
+        committed = self.committed.get(group.group_id, {})
+        future: Future = Future()
+        future.set_result(
+            SimpleNamespace(
+                topic_partitions=[
+                    SimpleNamespace(
+                        topic=tp.topic,
+                        partition=tp.partition,
+                        offset=committed.get((tp.topic, tp.partition), -1001),
+                    )
+                    for tp in group.topic_partitions
+                ]
+            )
+        )
+        return {group.group_id: future}
@@ -0,0 +1,84 @@
+"""Tests for the applied state file."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect.applied_state import AppliedState, fingerprint
+from kafkaconnect.cli import main
+from tests.support import FakeConnect
+
+
+def test_fingerprint_normalizes_values() -> None:
+    """The fingerprint of a file and of the live config are the same."""
+    assert fingerprint({"tasks.max": 1, "enabled": True}) == fingerprint(
+        {"enabled": "true", "tasks.max": "1"}
+    )
+    assert fingerprint({"tasks.max": 1}) != fingerprint({"tasks.max": 2})
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    """The state is saved atomically and invalid files are ignored."""
+    path = tmp_path / "state" / "influxdb-sink.json"
+    assert AppliedState.load(path) is None
+    state = AppliedState("sink", fingerprint({"a": "1"}))
+    state.save(path)
+    assert AppliedState.load(path) == state
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+    path.write_text("{")
+    assert AppliedState.load(path) is None
+
+
+def test_matches() -> None:
+    """The saved, desired and live configurations must all match."""
+    config = {"name": "sink", "tasks.max": 1}
+    state = AppliedState("sink", fingerprint(config))
+    assert state.matches("sink", config, {"name": "sink", "tasks.max": "1"})
+    assert not state.matches("other", config, config)
+    assert not state.matches("sink", config, None)
+    assert not state.matches("sink", config, {"name": "sink"})
+    assert not state.matches("sink", {"name": "sink"}, {"name": "sink"})
+
+
+def test_influxdb_sink_skips_unchanged_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A restart with the same config skips the validation and upload."""
+    connect: Any = FakeConnect()
+    monkeypatch.setattr(
+        "kafkaconnect.influxdb_sink.cli.Connect", lambda connect_url: connect
+    )
+    path = tmp_path / "state.json"
+    args = ["create", "influxdb-sink", "--state-file", str(path), "t1", "t2"]
+    runner = CliRunner()
+
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0, result.output
+    assert [call[0] for call in connect.calls] == [
+        "validate",
+        "create_or_update",
+    ]
+    state = AppliedState.load(path)
+    assert state is not None
+    assert state.fingerprint == fingerprint(connect.configs["influxdb-sink"])
+
+    connect.calls.clear()
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0, result.output
+    assert "unchanged, skipping validation and upload" in result.output
+    assert connect.calls == [("config", "influxdb-sink")]
+
+    # The live configuration was changed by someone else
+    connect.configs["influxdb-sink"]["tasks.max"] = "4"
+    connect.calls.clear()
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0, result.output
+    assert ("create_or_update", "influxdb-sink") in connect.calls
+
+    # The fingerprint includes the topics
+    connect.calls.clear()
+    result = runner.invoke(main, args + ["t3"])
+    assert result.exit_code == 0, result.output
+    assert ("create_or_update", "influxdb-sink") in connect.calls
@@ -0,0 +1,222 @@
+"""Tests for the apply command."""
+
+import json
+from pathlib import Path
+from typing import Any, Sequence
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect.apply.cli import run_plan
+from kafkaconnect.apply.plan import (
+    ActionKind,
+    diff_config,
+    load_configs,
+    make_plan,
+)
+from kafkaconnect.cli import main
+from kafkaconnect.snapshot import ConnectSnapshot
+from tests.support import FakeConnect
+
+CONNECTORS_DIR = Path(__file__).parent.parent / "connectors"
+
+
+def test_load_configs() -> None:
+    """Test loading the example connector configurations."""
+    configs = load_configs(CONNECTORS_DIR)
+    assert "postgres-sink" in configs
+    assert "mirror-source" in configs
+    assert configs["heartbeat"]["connector.class"].endswith(
+        "MirrorHeartbeatConnector"
+    )
+
+
+def test_load_configs_name_from_file(tmp_path: Path) -> None:
+    """Test that the file name is used if the name property is missing."""
+    (tmp_path / "foo.json").write_text(json.dumps({"connector.class": "C"}))
+    assert load_configs(tmp_path)["foo"]["name"] == "foo"
+
+
+def test_load_configs_duplicates(tmp_path: Path) -> None:
+    """Test that duplicated connector names are rejected."""
+    config = {"name": "foo", "connector.class": "C"}
+    (tmp_path / "a.json").write_text(json.dumps(config))
+    (tmp_path / "b.json").write_text(json.dumps(config))
+    with pytest.raises(ValueError):
+        load_configs(tmp_path)
+
+
+def test_diff_config() -> None:
+    """Test that values are compared as the Connect API returns them."""
+    desired = {"tasks.max": 1, "auto.create": True, "topics": "foo"}
+    live = {"tasks.max": "1", "auto.create": "true", "topics": "foo"}
+    assert diff_config(desired, live) == []
+
+    live["topics"] = "bar"
+    live["extra"] = "1"
+    assert diff_config(desired, live) == ["extra", "topics"]
+
+
+def test_make_plan() -> None:
+    """Test planning create, update, delete and unchanged actions."""
+    desired = {
+        "new": {"name": "new", "tasks.max": 1},
+        "changed": {"name": "changed", "tasks.max": 2},
+        "same": {"name": "same", "tasks.max": 1},
+    }
+    live = {
+        "changed": {"name": "changed", "tasks.max": "1"},
+        "same": {"name": "same", "tasks.max": "1"},
+        "old": {"name": "old", "tasks.max": "1"},
+    }
+    plan = make_plan(desired, live)
+    kinds = {a.name: a.kind for a in plan.actions}
+    assert kinds == {
+        "new": ActionKind.CREATE,
+        "changed": ActionKind.UPDATE,
+        "same": ActionKind.UNCHANGED,
+    }
+    assert plan.by_kind(ActionKind.UPDATE)[0].changed_keys == ["tasks.max"]
+    assert len(plan.changes) == 2
+
+    plan = make_plan(desired, live, prune=True)
+    assert [a.name for a in plan.by_kind(ActionKind.DELETE)] == ["old"]
+    assert "1 to create, 1 to update, 1 to delete" in plan.format()
+
+
+class StubConnect:
+    """A Connect API helper stub that does not support ``expand``."""
+
+    def list(self, expand: Sequence[str] = ()) -> str:
+        """Return the connector names only."""
+        return json.dumps(["a", "b"])
+
+    def config(self, name: str) -> str:
+        """Return the connector configuration."""
+        return json.dumps({"name": name})
+
+    def status(self, name: str) -> str:
+        """Return the connector status."""
+        return json.dumps({"name": name, "connector": {"state": "RUNNING"}})
+
+
+def test_snapshot_fallback() -> None:
+    """Test the snapshot with Connect versions without ``expand``."""
+    connect: Any = StubConnect()
+    snapshot = ConnectSnapshot.from_connect(connect, expand=("info",))
+    assert snapshot.names == ["a", "b"]
+    assert snapshot.configs["b"] == {"name": "b"}
+    assert snapshot.statuses["b"] is None
+
+
+@pytest.fixture
+def connect(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Return a Connect fake used by the apply command."""
+    connect: Any = FakeConnect()
+    connect.add("changed", {"connector.class": "C", "tasks.max": "1"})
+    connect.add("same", {"connector.class": "C", "tasks.max": "1"})
+    connect.add("old", {"connector.class": "C", "tasks.max": "1"})
+    monkeypatch.setattr(
+        "kafkaconnect.apply.cli.Connect", lambda connect_url: connect
+    )
+    return connect
+
+
+@pytest.fixture
+def directory(tmp_path: Path) -> Path:
+    """Return a directory with the desired connector configurations."""
+    for name, tasks in (("new", 1), ("changed", 2), ("same", 1)):
+        config = {"name": name, "connector.class": "C", "tasks.max": tasks}
+        (tmp_path / f"{name}.json").write_text(json.dumps(config))
+    return tmp_path
+
+
+def test_run_plan(connect: Any) -> None:
+    """Test that only the changes are validated and executed."""
+    desired = {
+        "new": {"name": "new", "connector.class": "C", "tasks.max": 1},
+        "changed": {"name": "changed", "connector.class": "C", "tasks.max": 2},
+        "same": {"name": "same", "connector.class": "C", "tasks.max": 1},
+    }
+    plan = make_plan(desired, connect.configs, prune=True)
+    assert run_plan(connect, plan, concurrency=2, dry_run=True) == 0
+    assert not any(c[0] == "create_or_update" for c in connect.calls)
+
+    assert run_plan(connect, plan, concurrency=2) == 0
+    assert sorted(c for c in connect.calls if c[0] != "validate") == [
+        ("create_or_update", "changed"),
+        ("create_or_update", "new"),
+        ("remove", "old"),
+    ]
+    assert sorted(connect.configs) == ["changed", "new", "same"]
+    assert connect.configs["changed"]["tasks.max"] == "2"
+
+
+def test_run_plan_failure(connect: Any) -> None:
+    """Test that failed changes are reported and fail the plan."""
+    create_or_update = connect.create_or_update
+
+    def failing_create_or_update(name: str, connect_config: str) -> str:
+        if name == "new":
+            return json.dumps({"error_code": 500, "message": "Timed out."})
+        return create_or_update(name, connect_config)
+
+    connect.create_or_update = failing_create_or_update
+    desired = {
+        "new": {"name": "new", "connector.class": "C"},
+        "changed": {"name": "changed", "connector.class": "C"},
+    }
+    plan = make_plan(desired, connect.configs)
+    with pytest.raises(click.ClickException) as error:
+        run_plan(connect, plan, concurrency=2)
+    assert "Failed to apply 1 of 2 change(s)." in str(error.value)
+    assert "new" not in connect.configs
+
+
+def test_run_plan_invalid(connect: Any) -> None:
+    """Test that nothing is executed if a configuration is invalid."""
+
+    def validate(name: str, connect_config: str) -> str:
+        config = {"name": "tasks.max", "errors": ["Invalid value."]}
+        return json.dumps({"error_count": 1, "configs": [{"value": config}]})
+
+    connect.validate = validate
+    plan = make_plan({"new": {"name": "new", "connector.class": "C"}}, {})
+    with pytest.raises(click.ClickException) as error:
+        run_plan(connect, plan, concurrency=2)
+    assert "Validation failed for 1 connector(s)." in str(error.value)
+    assert connect.calls == []
+
+
+def test_apply(connect: Any, directory: Path) -> None:
+    """Test the apply command with create, update and delete."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["apply", str(directory), "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "1 to create, 1 to update, 0 to delete" in result.output
+    assert "new" not in connect.configs
+
+    result = runner.invoke(main, ["apply", str(directory), "--prune"])
+    assert result.exit_code == 0, result.output
+    assert "1 to create, 1 to update, 1 to delete" in result.output
+    assert "new: ok, created" in result.output
+    assert "changed: ok, updated" in result.output
+    assert "old: ok, deleted" in result.output
+    assert sorted(connect.configs) == ["changed", "new", "same"]
+
+    result = runner.invoke(main, ["apply", str(directory), "--prune"])
+    assert result.exit_code == 0, result.output
+    assert "0 to create, 0 to update, 0 to delete, 3 unchanged" in (
+        result.output
+    )
+
+
+def test_apply_failure(connect: Any, directory: Path) -> None:
+    """Test that the apply command fails if a change fails."""
+    connect.remove = lambda name: "Resource old not found."
+    runner = CliRunner()
+    result = runner.invoke(main, ["apply", str(directory), "--prune"])
+    assert result.exit_code == 1
+    assert "old: failed, Resource old not found." in result.output
+    assert "Failed to apply 1 of 3 change(s)." in result.output
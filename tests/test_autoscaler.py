@@ -0,0 +1,130 @@
+"""Tests for the tasks.max autoscaler."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from kafkaconnect.daemon.autoscaler import Autoscaler, ScalingPolicy
+from kafkaconnect.daemon.daemon import Daemon
+from kafkaconnect.daemon.manifest import ManifestEntry
+from tests.support import FakeConnect
+
+
+class Clock:
+    """A manual clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_policy() -> ScalingPolicy:
+    """Return a scaling policy for the tests."""
+    return ScalingPolicy(
+        min_tasks=1,
+        max_tasks=6,
+        scale_up_lag=1000,
+        scale_down_lag=100,
+        scale_up_cooldown=60000,
+        scale_down_cooldown=300000,
+        window=3,
+    )
+
+
+def test_policy_validation() -> None:
+    """Test invalid scaling policies."""
+    with pytest.raises(ValueError):
+        ScalingPolicy(min_tasks=4, max_tasks=2)
+    with pytest.raises(ValueError):
+        ScalingPolicy(scale_up_lag=100, scale_down_lag=100)
+
+
+def test_scale_up_with_cooldown() -> None:
+    """Test scaling up, bounded, and spaced by the cooldown."""
+    clock = Clock()
+    scaler = Autoscaler(clock)
+    policy = make_policy()
+
+    decision = scaler.decide("foo", policy, 2, 5000)
+    assert (decision.desired, decision.reason) == (4, "lag above threshold")
+    clock.now = 30
+    decision = scaler.decide("foo", policy, 4, 6000)
+    assert (decision.desired, decision.reason) == (4, "scale up cooldown")
+    clock.now = 60
+    decision = scaler.decide("foo", policy, 4, 7000)
+    # Doubling is bounded by max_tasks
+    assert decision.desired == 6
+    assert "lag=7000" in str(decision)
+
+
+def test_no_scale_up_when_lag_decreases() -> None:
+    """Test that a draining lag does not scale up."""
+    clock = Clock()
+    scaler = Autoscaler(clock)
+    policy = make_policy()
+    scaler.decide("foo", policy, 6, 9000)
+    clock.now = 10
+    scaler.decide("foo", policy, 6, 8000)
+    clock.now = 20
+    decision = scaler.decide("foo", policy, 2, 5000)
+    assert decision.trend == -200
+    assert (decision.desired, decision.reason) == (2, "lag decreasing")
+
+
+def test_scale_down_hysteresis() -> None:
+    """Test scaling down after a full window of low lag samples."""
+    clock = Clock()
+    scaler = Autoscaler(clock)
+    policy = make_policy()
+    # Within the hysteresis band nothing changes
+    assert scaler.decide("foo", policy, 4, 500).reason == "steady"
+    for now in (10, 20):
+        clock.now = now
+        decision = scaler.decide("foo", policy, 4, 50)
+        assert decision.reason == "waiting for a full window"
+    clock.now = 30
+    assert scaler.decide("foo", policy, 4, 50).desired == 3
+    # The next scale down waits for the cooldown
+    for now in (40, 50, 60):
+        clock.now = now
+        decision = scaler.decide("foo", policy, 3, 0)
+    assert decision.reason == "scale down cooldown"
+    clock.now = 330
+    assert scaler.decide("foo", policy, 3, 0).desired == 2
+
+
+def test_daemon_autoscales() -> None:
+    """Test that the daemon applies the scaling decisions."""
+    connect = FakeConnect()
+    connect.add(
+        "jdbc",
+        {
+            "connector.class": "JdbcSinkConnector",
+            "topics": "foo",
+            "tasks.max": "1",
+        },
+    )
+    entry = ManifestEntry(
+        name="jdbc",
+        config={"connector.class": "JdbcSinkConnector", "topics": "foo"},
+        autoscale={"max_tasks": 4, "scale_up_lag": 2000},
+    )
+    requests: List[Dict[str, List[str]]] = []
+
+    def measure_lag(topics: Dict[str, List[str]]) -> Dict[str, int]:
+        requests.append(topics)
+        return {"jdbc": 5000}
+
+    fake: Any = connect
+    daemon = Daemon(
+        [entry], fake, None, cycle_interval=0, measure_lag=measure_lag
+    )
+    assert asyncio.run(daemon.reconcile(entry)) is True
+    assert requests == [{"jdbc": ["foo"]}]
+    assert connect.configs["jdbc"]["tasks.max"] == "2"
+    # The scale up cooldown keeps the number of tasks
+    assert asyncio.run(daemon.reconcile(entry)) is None
@@ -0,0 +1,124 @@
+"""Tests for the export and import commands."""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect.backup.archive import Archive, ConnectorBackup
+from kafkaconnect.cli import main
+from tests.support import FakeConnect
+
+
+@pytest.mark.parametrize("filename", ["backup.json", "backup.json.gz"])
+def test_archive(tmp_path: Path, filename: str) -> None:
+    """Test saving and loading an archive."""
+    archive = Archive(connect_url="http://localhost:8083")
+    archive.connectors["foo"] = ConnectorBackup(
+        config={"name": "foo", "connector.class": "C"},
+        offsets={"offsets": []},
+    )
+    archive.save(tmp_path / filename)
+
+    loaded = Archive.load(tmp_path / filename)
+    assert loaded == archive
+    assert loaded.connectors["foo"].status is None
+
+
+def test_archive_version(tmp_path: Path) -> None:
+    """Test that unsupported archive versions are rejected."""
+    Archive(connect_url="", version=0).save(tmp_path / "backup.json")
+    with pytest.raises(ValueError):
+        Archive.load(tmp_path / "backup.json")
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("{", "Could not read the archive"),
+        ("[]", "is not an archive"),
+        ('{"version": 1, "connect_url": ""}', "has no connectors property"),
+        (
+            '{"version": 1, "connect_url": "", "connectors": {"foo": {}}}',
+            "Connector foo in the archive",
+        ),
+        (
+            '{"version": 1, "connect_url": "", "connectors": '
+            '{"foo": {"config": {}, "state": null}}}',
+            "Invalid connector foo",
+        ),
+    ],
+)
+def test_archive_invalid(tmp_path: Path, content: str, message: str) -> None:
+    """Test that invalid archives raise a `ValueError` with a message."""
+    path = tmp_path / "backup.json"
+    path.write_text(content)
+    with pytest.raises(ValueError) as error:
+        Archive.load(path)
+    assert message in str(error.value)
+    path = tmp_path / "backup.json.gz"
+    path.write_text(content)
+    with pytest.raises(ValueError, match="Could not read the archive"):
+        Archive.load(path)
+
+
+@pytest.fixture
+def connect(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Return a Connect fake used by the export and import commands."""
+    connect: Any = FakeConnect()
+    connect.add("foo", {"connector.class": "C", "tasks.max": "1"})
+    connect.add("bar", {"connector.class": "C", "tasks.max": "2"})
+    connect.connector_offsets["foo"] = [
+        {"partition": {"kafka_topic": "t"}, "offset": {"kafka_offset": 10}}
+    ]
+    monkeypatch.setattr(
+        "kafkaconnect.backup.cli.Connect", lambda connect_url: connect
+    )
+    return connect
+
+
+def test_export_import(connect: Any, tmp_path: Path) -> None:
+    """Test that an exported archive imports back to the same state."""
+    path = tmp_path / "backup.json.gz"
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["export", str(path), "--with-status", "--with-offsets"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Exported 2 connector(s)" in result.output
+    backup = Archive.load(path)
+    assert backup.connectors["foo"].offsets == {
+        "offsets": connect.connector_offsets["foo"]
+    }
+    assert backup.connectors["bar"].status is not None
+
+    configs = {name: dict(config) for name, config in connect.configs.items()}
+    connect.remove("foo")
+    connect.configs["bar"]["tasks.max"] = "4"
+    connect.add("baz", {"connector.class": "C"})
+    result = runner.invoke(main, ["import", str(path), "--prune"])
+    assert result.exit_code == 0, result.output
+    assert "1 to create, 1 to update, 1 to delete" in result.output
+    assert connect.configs == configs
+
+    result = runner.invoke(main, ["import", str(path)])
+    assert result.exit_code == 0, result.output
+    assert "0 to create, 0 to update, 0 to delete, 2 unchanged" in (
+        result.output
+    )
+
+
+def test_import_invalid(connect: Any, tmp_path: Path) -> None:
+    """Test that importing an invalid archive fails with a message."""
+    path = tmp_path / "backup.json.gz"
+    with gzip.open(path, "wt") as f:
+        json.dump({"version": 1, "connectors": {}}, f)
+    runner = CliRunner()
+    result = runner.invoke(main, ["import", str(path)])
+    assert result.exit_code == 1
+    assert "has no connect_url property." in result.output
+    assert "Traceback" not in result.output
+    assert connect.calls == []
@@ -0,0 +1,30 @@
+"""Tests for the benchmark suite."""
+
+from dataclasses import asdict
+
+from benchmarks.memory import REPRESENTATIONS, measure
+from benchmarks.run import compare, run
+
+
+def test_run_and_compare() -> None:
+    """Test running a benchmark and comparing with a baseline."""
+    (result,) = run(
+        ["TopicNamesSet.filter_topics"], [10], repeat=1, min_time=0
+    )
+    assert result.size == 10
+    assert result.median > 0
+
+    baseline = [asdict(result)]
+    slower = dict(baseline[0], median=result.median * 2)
+    assert compare([slower], baseline, threshold=0.2) == [
+        "TopicNamesSet.filter_topics [10]: 2.00x slower than the baseline."
+    ]
+    assert compare(baseline, baseline, threshold=0.2) == []
+
+
+def test_memory() -> None:
+    """Test measuring the peak memory of the topic discovery."""
+    for name in REPRESENTATIONS:
+        result = measure(name, size=1000, cycles=1)
+        assert result.name == name
+        assert result.peak >= result.baseline > 0
@@ -1,8 +1,10 @@
 """Tets for the connect module."""
 
 import pytest
+from click.testing import CliRunner
 
-from kafkaconnect.connect import Connect, HTTPMethod
+from kafkaconnect.cli import main
+from kafkaconnect.connect import Connect, HTTPMethod, OutputFormat
 from kafkaconnect.influxdb_sink.config import InfluxConfig
 
 
@@ -24,6 +26,46 @@ def test_expected_exception_delete() -> None:
         )
 
 
+def test_output_formats() -> None:
+    """Test formatting the response content."""
+    content = {"b": {"status": {"state": "RUNNING"}}, "a": {"status": {}}}
+
+    connect = Connect("http://some-url", OutputFormat.PRETTY)
+    assert connect._format(content).startswith('{\n    "a": {')
+
+    connect = Connect("http://some-url", OutputFormat.COMPACT)
+    assert connect._format(content, records=True) == (
+        '{"b":{"status":{"state":"RUNNING"}},"a":{"status":{}}}'
+    )
+
+    connect = Connect("http://some-url", OutputFormat.NDJSON)
+    assert connect._format(content, records=True).splitlines() == [
+        '{"name":"b","status":{"state":"RUNNING"}}',
+        '{"name":"a","status":{}}',
+    ]
+    assert connect._format(["a", "b"]) == '"a"\n"b"'
+    assert connect._format({"name": "a"}) == '{"name":"a"}'
+    # An empty list has no lines
+    assert connect._format([]) == ""
+    assert list(connect._format_lines({}, records=True)) == []
+
+
+@pytest.mark.vcr
+def test_list_raw() -> None:
+    """Test that the raw output is the response body, not parsed."""
+    connect = Connect("http://localhost:8083", OutputFormat.RAW)
+    assert connect.list() == '[ "influxdb-sink" ]'
+
+
+@pytest.mark.vcr
+def test_list_empty() -> None:
+    """Test that an empty list prints nothing with ndjson."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["--output", "ndjson", "list"])
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
 @pytest.mark.vcr
 def test_list() -> None:
     """Test list method."""
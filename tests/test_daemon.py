@@ -0,0 +1,80 @@
+"""Tests for the daemon mode."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from kafkaconnect.daemon.daemon import Daemon
+from kafkaconnect.daemon.manifest import ManifestEntry, load_manifest
+from tests.support import FakeConnect
+
+
+def test_load_manifest(tmp_path: Path) -> None:
+    """Test loading a manifest with a configuration file."""
+    (tmp_path / "jdbc.json").write_text(
+        json.dumps({"name": "jdbc", "connector.class": "JdbcSinkConnector"})
+    )
+    manifest = {
+        "connectors": [
+            {"name": "influxdb-sink", "type": "influxdb-sink"},
+            {"configfile": "jdbc.json", "topic_regex": "foo.*"},
+        ]
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    entries = load_manifest(tmp_path / "manifest.json")
+
+    assert [e.name for e in entries] == ["influxdb-sink", "jdbc"]
+    assert entries[0].topic_regex == ".*"
+    assert entries[1].render({"foo.b", "foo.a"})["topics"] == "foo.a,foo.b"
+
+
+def test_manifest_validation() -> None:
+    """Test invalid manifest entries."""
+    with pytest.raises(ValueError):
+        ManifestEntry(name="foo", type="unknown")
+    with pytest.raises(ValueError):
+        ManifestEntry(name="foo", config={"topics": "foo"})
+    with pytest.raises(ValueError):
+        ManifestEntry(name="foo", type="influxdb-sink", config={"foo": 1})
+
+
+def test_reconcile_shares_state() -> None:
+    """Test that connectors share one fetch per cycle."""
+    connect = FakeConnect()
+    topic_requests: List[int] = []
+
+    def list_topics() -> List[str]:
+        topic_requests.append(1)
+        return ["foo.t1", "foo.t2", "bar.t1"]
+
+    entries = [
+        ManifestEntry(
+            name="influxdb-sink",
+            type="influxdb-sink",
+            topic_regex="foo.*",
+        ),
+        ManifestEntry(
+            name="jdbc",
+            config={"connector.class": "JdbcSinkConnector"},
+            topic_regex="bar.*",
+        ),
+    ]
+    fake: Any = connect
+    daemon = Daemon(entries, fake, list_topics, cycle_interval=60)
+
+    async def reconcile_all() -> List[Any]:
+        return await asyncio.gather(*(daemon.reconcile(e) for e in entries))
+
+    assert asyncio.run(reconcile_all()) == [True, True]
+    assert len(topic_requests) == 1
+    assert [c for c in connect.calls if c[0] == "list"] == [
+        ("list", ("info", "status"))
+    ]
+    assert connect.configs["influxdb-sink"]["topics"] == "foo.t1,foo.t2"
+    assert connect.configs["jdbc"]["topics"] == "bar.t1"
+
+    # Nothing changed, the configurations are not applied again
+    assert asyncio.run(reconcile_all()) == [None, None]
@@ -0,0 +1,82 @@
+"""Tests for the health endpoints."""
+
+import json
+from typing import List
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from kafkaconnect.health import HealthServer, HealthState
+
+
+class Clock:
+    """A manual clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_health_state() -> None:
+    """Test the liveness and readiness thresholds."""
+    clock = Clock()
+    state = HealthState(60, 30, 10, clock=clock)
+    assert state.liveness()[0]
+    assert state.readiness()[0]
+
+    clock.now = 20
+    state.cycle()
+    state.discovered()
+    assert state.liveness()[0]
+    # The apply is too old
+    ok, details = state.readiness()
+    assert not ok
+    assert details["seconds_since"]["apply"] == 20
+
+    state.applied()
+    assert state.readiness()[0]
+
+    clock.now = 100
+    assert not state.liveness()[0]
+
+
+def test_health_server() -> None:
+    """Test the health endpoints."""
+    clock = Clock()
+    state = HealthState(60, 30, 10, clock=clock)
+    server = HealthServer(state, port=0, host="127.0.0.1")
+    server.start()
+    url = f"http://127.0.0.1:{server.port}"
+    try:
+        with urlopen(f"{url}/livez") as response:
+            assert response.status == 200
+            assert json.load(response)["ok"] is True
+
+        clock.now = 15
+        codes: List[int] = []
+        try:
+            urlopen(f"{url}/readyz")
+        except HTTPError as e:
+            codes.append(e.code)
+        assert codes == [503]
+    finally:
+        server.stop()
+
+
+def test_health_sources() -> None:
+    """A single failing source fails the readiness check."""
+    clock = Clock()
+    state = HealthState(60, 30, 30, sources=["a", "b"], clock=clock)
+    clock.now = 40
+    state.discovered("a")
+    state.applied("a")
+    ok, details = state.readiness()
+    assert not ok
+    assert details["oldest"]["apply"] == "b"
+    assert details["seconds_since"]["apply"] == 40
+
+    state.discovered("b")
+    state.applied("b")
+    assert state.readiness()[0]
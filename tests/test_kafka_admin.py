@@ -0,0 +1,64 @@
+"""Tests for the Kafka admin helpers with the real admin client.
+
+No broker is running, the requests time out, but they exercise the
+``confluent_kafka`` API used by the helpers, which the fake client in
+``tests.support`` does not.
+"""
+
+import pytest
+from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import AdminClient
+
+from kafkaconnect.kafka_admin import (
+    committed_offsets,
+    describe_partitions,
+    end_offsets,
+    start_offsets,
+    topic_partitions,
+)
+
+TIMEOUT = 0.5
+
+
+@pytest.fixture()
+def client() -> AdminClient:
+    """Return an admin client for a broker that does not exist."""
+    return AdminClient(
+        {
+            "bootstrap.servers": "localhost:1",
+            "socket.connection.setup.timeout.ms": 1000,
+            "log_level": 0,
+        }
+    )
+
+
+def timed_out(error: pytest.ExceptionInfo) -> bool:
+    """Return whether a Kafka request failed with a timeout."""
+    return error.value.args[0].code() == KafkaError._TIMED_OUT
+
+
+def test_describe_partitions(client: AdminClient) -> None:
+    """The topics are described in batches of futures."""
+    futures = describe_partitions(
+        client, ["b", "a"], timeout=TIMEOUT, batch_size=1
+    )
+    assert list(futures) == ["a", "b"]
+    with pytest.raises(KafkaException) as error:
+        futures["a"].result(timeout=10)
+    assert timed_out(error)
+    with pytest.raises(KafkaException) as error:
+        topic_partitions(client, ["a"], timeout=TIMEOUT)
+    assert timed_out(error)
+
+
+def test_offsets(client: AdminClient) -> None:
+    """The start, end and committed offsets use batched admin requests."""
+    with pytest.raises(KafkaException) as error:
+        end_offsets(client, [("a", 0)], timeout=TIMEOUT)
+    assert timed_out(error)
+    with pytest.raises(KafkaException) as error:
+        start_offsets(client, [("a", 0)], timeout=TIMEOUT)
+    assert timed_out(error)
+    with pytest.raises(KafkaException) as error:
+        committed_offsets(client, {"group": [("a", 0)]}, timeout=TIMEOUT)
+    assert timed_out(error)
@@ -0,0 +1,41 @@
+"""Tests for the consumer lag of sink connectors."""
+
+from typing import Any
+
+from kafkaconnect.lag.consumer import fetch_topics, sink_lag
+from tests.support import FakeAdminClient, FakeConnect
+
+
+def test_fetch_topics() -> None:
+    """Test fetching the active topics of the connectors."""
+    connect = FakeConnect()
+    connect.add("foo", {"topics": "a,b"})
+    fake: Any = connect
+    assert fetch_topics(fake, ["foo", "bar"]) == {
+        "foo": ["a", "b"],
+        "bar": None,
+    }
+
+
+def test_sink_lag() -> None:
+    """Test the lag of the partitions with and without committed offsets."""
+    client = FakeAdminClient({("a", 0): 100, ("a", 1): 50, ("b", 0): 10})
+    client.committed = {"connect-foo": {("a", 0): 90, ("a", 1): 50}}
+    # Retention deleted the first records of a-0
+    client.start[("a", 0)] = 40
+    fake: Any = client
+    lags = sink_lag(fake, {"foo": ["a"], "bar": ["a", "b"], "baz": ["c"]})
+    assert lags == {
+        "foo": {("a", 0): 10, ("a", 1): 0},
+        "bar": {("a", 0): 60, ("a", 1): 50, ("b", 0): 10},
+        "baz": {},
+    }
+    # One describe and one end and start offsets request for all the
+    # connectors
+    assert client.calls == [
+        "describe_topics",
+        "list_offsets",
+        ("list_consumer_group_offsets", "connect-foo"),
+        ("list_consumer_group_offsets", "connect-bar"),
+        "list_offsets",
+    ]
@@ -0,0 +1,121 @@
+"""Tests for the process-wide topic metadata cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from kafkaconnect.config import Config
+from kafkaconnect.kafka_admin import describe_partitions, topic_partitions
+from kafkaconnect.metadata_cache import (
+    DEFAULT_TTL,
+    TopicMetadataCache,
+    shared_cache,
+    topic_filter,
+)
+from tests.support import FakeAdminClient
+
+
+class Clock:
+    """A manual clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_cache_refreshes_after_ttl() -> None:
+    """Connectors share one metadata request per TTL."""
+    topics = ["b", "a", "c.x"]
+    clock = Clock()
+    cache = TopicMetadataCache(lambda: list(topics), ttl=10, clock=clock)
+    cache.register("sink-1", "a|b")
+    cache.register("sink-2", ".*", "c\\.")
+    cache.register("sink-3", "a|b")
+    assert cache.topics("sink-1") == {"a", "b"}
+    assert cache.topics("sink-2") == {"a", "b"}
+    assert cache.topics("sink-3") is cache.topics("sink-1")
+    assert cache.refreshes == 1
+
+    topics.append("a2")
+    clock.now = 9
+    assert list(cache.names()) == ["a", "b", "c.x"]
+    clock.now = 10
+    assert cache.topics("sink-1") == {"a", "a2", "b"}
+    assert cache.refreshes == 2
+    cache.invalidate()
+    cache.names()
+    assert cache.refreshes == 3
+
+    # A caller that needs fresher names does not change the TTL
+    clock.now = 12
+    cache.names(max_age=1)
+    assert cache.refreshes == 4
+    assert cache.ttl == 10
+    cache.names()
+    assert cache.refreshes == 4
+
+
+def test_single_refresher() -> None:
+    """Concurrent callers wait for a single refresh."""
+    calls: List[int] = []
+
+    def list_topics() -> List[str]:
+        calls.append(1)
+        return ["t"]
+
+    cache = TopicMetadataCache(list_topics, ttl=60)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.names(), range(32)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_prefetch() -> None:
+    """The refresh runs in the background and is shared with names()."""
+    release = threading.Event()
+    calls: List[int] = []
+
+    def list_topics() -> List[str]:
+        release.wait(timeout=10)
+        calls.append(1)
+        return ["t"]
+
+    cache = TopicMetadataCache(list_topics, ttl=60)
+    future = cache.prefetch()
+    # The caller is not blocked by the metadata request
+    assert not future.done()
+    release.set()
+    assert cache.names() is future.result(timeout=10)
+    assert len(calls) == 1
+
+
+def test_describe_partitions() -> None:
+    """Only the requested topics are described, in batches."""
+    client: Any = FakeAdminClient({("a", 0): 0, ("a", 1): 0, ("b", 0): 0})
+    futures = describe_partitions(client, ["b", "a", "gone"], batch_size=2)
+    assert list(futures) == ["a", "b", "gone"]
+    assert client.calls == ["describe_topics", "describe_topics"]
+    assert topic_partitions(client, ["a", "gone"]) == {"a": [0, 1]}
+    assert topic_partitions(client) == {"a": [0, 1], "b": [0]}
+
+
+def test_shared_cache() -> None:
+    """The cache is shared per Kafka cluster with the shortest TTL."""
+    config = Config("cache-test:9092", "http://connect:8083")
+    cache = shared_cache(config)
+    assert shared_cache(config) is cache
+    assert cache.ttl == DEFAULT_TTL
+    other = Config("other-cache-test:9092", "http://connect:8083")
+    assert shared_cache(other) is not cache
+    # Different credentials do not share the admin client and the names
+    user = Config(
+        "cache-test:9092",
+        "http://connect:8083",
+        sasl_plain_username="user",
+        sasl_plain_password="secret",
+    )
+    assert shared_cache(user) is not cache
+    assert topic_filter("a", None) is topic_filter("a", None)
@@ -0,0 +1,132 @@
+"""Tests for the MirrorMaker 2 replication lag."""
+
+import struct
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from kafkaconnect.lag.report import lag_report
+from kafkaconnect.mirrormaker2.lag import (
+    MirrorTopology,
+    OffsetSync,
+    OffsetSyncReader,
+    decode_offset_sync,
+    sample_lag,
+)
+from tests.support import FakeAdminClient
+
+
+def encode_offset_sync(
+    topic: str, partition: int, upstream: int, downstream: int
+) -> Tuple[bytes, bytes]:
+    """Encode an offset sync record like MirrorMaker 2."""
+    name = topic.encode("utf-8")
+    key = struct.pack(">h", len(name)) + name + struct.pack(">i", partition)
+    return key, struct.pack(">qq", upstream, downstream)
+
+
+class FakeConsumer:
+    """A consumer reading a single partition offset syncs topic."""
+
+    def __init__(self, topic: str) -> None:
+        self.topic = topic
+        self.records: List[Tuple[bytes, bytes]] = []
+        self.position_ = 0
+
+    def list_topics(self, topic: str, timeout: float = -1) -> Any:
+        """Return the topic metadata."""
+        metadata = SimpleNamespace(partitions={0: None}, error=None)
+        return SimpleNamespace(topics={self.topic: metadata})
+
+    def assign(self, partitions: List[Any]) -> None:
+        """Assign the partitions."""
+
+    def get_watermark_offsets(self, tp: Any, timeout: float = -1) -> Any:
+        """Return the low and high watermarks."""
+        return 0, len(self.records)
+
+    def poll(self, timeout: float = -1) -> Optional[Any]:
+        """Return the next record."""
+        if self.position_ >= len(self.records):
+            return None
+        key, value = self.records[self.position_]
+        message = SimpleNamespace(
+            error=lambda: None,
+            partition=lambda: 0,
+            offset=lambda offset=self.position_: offset,
+            key=lambda: key,
+            value=lambda: value,
+        )
+        self.position_ += 1
+        return message
+
+    def position(self, partitions: List[Any]) -> List[Any]:
+        """Return the consumer position."""
+        return [SimpleNamespace(partition=0, offset=self.position_)]
+
+
+def test_decode_offset_sync() -> None:
+    """Test decoding an offset sync record."""
+    key, value = encode_offset_sync("foo", 3, 120, 100)
+    assert decode_offset_sync(key, value) == (("foo", 3), OffsetSync(120, 100))
+
+
+def test_topology_from_connector_config() -> None:
+    """Test reading the replication flow from the connector config."""
+    topology = MirrorTopology.from_connector_config(
+        {
+            "source.cluster.alias": "src",
+            "target.cluster.alias": "dst",
+            "topics": "foo.*, bar",
+        }
+    )
+    assert topology.topics == "foo.*|bar"
+    assert topology.remote_topic("foo") == "src.foo"
+    topology.identity = True
+    assert topology.remote_topic("foo") == "foo"
+
+
+def test_sample_lag() -> None:
+    """Test the replication lag with and without offset syncs."""
+    topology = MirrorTopology("src", "dst", topics="foo|bar")
+    source = FakeAdminClient(
+        {("foo", 0): 150, ("foo", 1): 40, ("bar", 0): 10, ("baz", 0): 5}
+    )
+    target = FakeAdminClient({("src.foo", 0): 110, ("src.foo", 1): 40})
+    consumer = FakeConsumer("mm2-offset-syncs.dst.internal")
+    consumer.records = [
+        encode_offset_sync("foo", 0, 20, 0),
+        encode_offset_sync("foo", 0, 120, 100),
+    ]
+    fake: Any = consumer
+    reader = OffsetSyncReader(fake, consumer.topic)
+    source_client: Any = source
+    target_client: Any = target
+
+    lags = sample_lag(topology, source_client, target_client, reader)
+    # The target end offset 110 is upstream offset 130
+    assert lags == {("foo", 0): 20, ("foo", 1): 0, ("bar", 0): 10}
+    # One metadata and one offsets request per cluster
+    assert source.calls == ["list_topics", "list_offsets"]
+    assert target.calls == ["describe_topics", "list_offsets"]
+
+    consumer.records.append(encode_offset_sync("foo", 0, 140, 120))
+    target.offsets[("src.foo", 0)] = 125
+    assert (
+        sample_lag(topology, source_client, target_client, reader)[("foo", 0)]
+        == 5
+    )
+
+
+def test_lag_report() -> None:
+    """Test the lag totals and rates of change."""
+    previous: Dict[Tuple[str, int], int] = {("foo", 0): 20, ("foo", 1): 10}
+    lags = {("foo", 0): 10, ("foo", 1): 10, ("bar", 0): 5}
+    report = lag_report(lags, previous, elapsed=5)
+    assert report["lag"] == 25
+    # The total rate is unknown since bar is a new topic
+    assert report["rate"] is None
+    foo = report["topics"]["foo"]
+    assert foo["lag"] == 20
+    assert foo["rate"] == -2.0
+    assert foo["partitions"]["0"] == {"lag": 10, "rate": -2.0}
+    assert report["topics"]["bar"]["rate"] is None
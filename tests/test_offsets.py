@@ -0,0 +1,105 @@
+"""Tests for the connector offsets commands."""
+
+import json
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect.cli import main
+from kafkaconnect.offsets.offsets import (
+    OffsetsError,
+    latest_sink_offsets,
+    sink_offsets,
+    with_stopped,
+)
+from tests.support import FakeAdminClient, FakeConnect
+
+
+def test_sink_offsets() -> None:
+    """Test the request body to alter the offsets of a sink connector."""
+    client: Any = FakeAdminClient(
+        {("t1", 0): 10, ("t1", 1): 20, ("other", 0): 5}
+    )
+    latest = latest_sink_offsets(client, ["t1", "other", "gone"], "t")
+    assert latest == {("t1", 0): 10, ("t1", 1): 20}
+    assert sink_offsets({("t1", 0): 10})["offsets"] == [
+        {
+            "partition": {"kafka_topic": "t1", "kafka_partition": 0},
+            "offset": {"kafka_offset": 10},
+        }
+    ]
+
+
+def test_with_stopped_restores_state() -> None:
+    """The connector is stopped and returned to its previous state."""
+    connect: Any = FakeConnect()
+    connect.add("running")
+    connect.add("paused", state="PAUSED", tasks=("PAUSED",))
+    for name in ("running", "paused"):
+        with_stopped(
+            connect,
+            name,
+            lambda: connect.reset_offsets(name),
+            timeout=1,
+            sleep=lambda seconds: None,
+        )
+    assert connect.states == {"running": "RUNNING", "paused": "PAUSED"}
+    calls = [call[0] for call in connect.calls if call[1] == "running"]
+    assert calls == [
+        "status",
+        "stop",
+        "status",
+        "reset_offsets",
+        "resume",
+        "status",
+    ]
+
+
+def test_with_stopped_failure() -> None:
+    """The previous state is restored if the offsets cannot be changed."""
+    connect: Any = FakeConnect()
+    connect.add("sink")
+    with pytest.raises(OffsetsError, match="Invalid offsets"):
+        with_stopped(
+            connect,
+            "sink",
+            lambda: json.dumps(
+                {"error_code": 400, "message": "Invalid offsets"}
+            ),
+            timeout=1,
+            sleep=lambda seconds: None,
+        )
+    assert connect.states["sink"] == "RUNNING"
+
+    connect.add("failed", state="FAILED")
+    with pytest.raises(OffsetsError, match="failed connector is FAILED"):
+        with_stopped(connect, "failed", lambda: "", timeout=1)
+    assert ("stop", "failed") not in connect.calls
+
+
+def test_reset_to_latest(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test skipping the backlog of a sink connector."""
+    connect: Any = FakeConnect()
+    connect.add("sink", {"topics": "t1,t2"})
+    client: Any = FakeAdminClient({("t1", 0): 10, ("t2", 0): 20})
+    monkeypatch.setattr(
+        "kafkaconnect.offsets.cli.Connect", lambda connect_url: connect
+    )
+    monkeypatch.setattr(
+        "kafkaconnect.offsets.cli.admin_client", lambda config: client
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["offsets", "reset-to-latest", "sink", "-r", "t2", "--dry-run"]
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == sink_offsets({("t2", 0): 20})
+    assert ("stop", "sink") not in connect.calls
+
+    result = runner.invoke(main, ["offsets", "reset-to-latest", "sink"])
+    assert result.exit_code == 0, result.output
+    assert connect.connector_offsets["sink"] == (
+        sink_offsets({("t1", 0): 10, ("t2", 0): 20})["offsets"]
+    )
+    assert connect.states["sink"] == "RUNNING"
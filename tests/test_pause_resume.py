@@ -0,0 +1,132 @@
+"""Tests for the bulk pause and resume commands."""
+
+import json
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect.bulk import bulk_request
+from kafkaconnect.cli import main
+from kafkaconnect.selector import Selector, parse_labels
+from tests.support import FakeConnect
+
+
+def test_selector() -> None:
+    """Test selecting connectors by name, regex and label."""
+    assert parse_labels(["team=sre", "a=b=c"]) == {"team": "sre", "a": "b=c"}
+    with pytest.raises(ValueError):
+        parse_labels(["team"])
+    selector = Selector(match="influx", labels={"team": "sre"})
+    assert selector.matches("influxdb-sink", {"team": "sre"})
+    assert not selector.matches("influxdb-sink", {"team": "dm"})
+    assert not selector.matches("influxdb-sink")
+    assert not selector.matches("s3-sink", {"team": "sre"})
+    assert Selector().empty
+
+
+@pytest.fixture
+def connect(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Return a Connect fake used by the CLI."""
+    connect: Any = FakeConnect()
+    connect.add("influxdb-a", {"team": "sre"})
+    connect.add("influxdb-b", {"team": "sre"}, state="PAUSED")
+    connect.add("influxdb-c", {"team": "sre"})
+    connect.add("influxdb-d", {"team": "dm"})
+    connect.add("s3-sink", {"team": "sre"})
+    monkeypatch.setattr(
+        "kafkaconnect.cli.Connect", lambda connect_url: connect
+    )
+    return connect
+
+
+def test_pause_and_resume_paused_file(connect: Any, tmp_path: Path) -> None:
+    """Resume restores exactly the connectors that were paused."""
+    path = tmp_path / "paused.json"
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "pause",
+            "-r",
+            "influxdb-",
+            "-l",
+            "team=sre",
+            "--wait",
+            "--paused-file",
+            str(path),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "influxdb-b: already paused" in result.output
+    assert json.loads(path.read_text()) == ["influxdb-a", "influxdb-c"]
+    assert connect.states["influxdb-d"] == "RUNNING"
+    assert connect.states["s3-sink"] == "RUNNING"
+
+    result = runner.invoke(main, ["resume", "--paused-file", str(path)])
+    assert result.exit_code == 0, result.output
+    assert connect.states == {
+        "influxdb-a": "RUNNING",
+        "influxdb-b": "PAUSED",
+        "influxdb-c": "RUNNING",
+        "influxdb-d": "RUNNING",
+        "s3-sink": "RUNNING",
+    }
+
+
+def test_pause_output_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The responses are parsed whatever the --output format."""
+    fake: Any = FakeConnect()
+    fake.add("influxdb-a", {"team": "sre"})
+    fake.add("influxdb-b", {"team": "sre"})
+    formats: List[Any] = []
+
+    def connect(connect_url: str, *args: Any) -> Any:
+        formats.extend(args)
+        return fake
+
+    monkeypatch.setattr("kafkaconnect.cli.Connect", connect)
+    runner = CliRunner()
+    result = runner.invoke(main, ["-o", "ndjson", "pause", "-l", "team=sre"])
+    assert result.exit_code == 0, result.output
+    assert "influxdb-b: paused" in result.output
+    result = runner.invoke(main, ["-o", "raw", "resume", "-r", "influxdb-"])
+    assert result.exit_code == 0, result.output
+    assert "influxdb-b: resumed" in result.output
+    assert formats == []
+
+
+def test_pause_errors(connect: Any) -> None:
+    """Test that a selector is required and failures are reported."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["pause"])
+    assert result.exit_code == 2
+    result = runner.invoke(main, ["pause", "influxdb-a", "missing"])
+    assert result.exit_code == 1
+    assert "influxdb-a: paused" in result.output
+    assert "Failed to pause 1 connector(s)." in result.output
+
+
+def test_pause_server_error(connect: Any, tmp_path: Path) -> None:
+    """A JSON error body is a failure, the connector is not recorded."""
+    pause = connect.pause
+
+    def failing_pause(name: str) -> str:
+        if name == "influxdb-c":
+            return json.dumps({"error_code": 500, "message": "Timed out."})
+        return pause(name)
+
+    connect.pause = failing_pause
+    assert bulk_request(connect.pause, ["influxdb-a", "influxdb-c"]) == {
+        "influxdb-c": "Timed out."
+    }
+
+    path = tmp_path / "paused.json"
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["pause", "influxdb-c", "influxdb-d", "--paused-file", str(path)]
+    )
+    assert result.exit_code == 1
+    assert "Failed to pause 1 connector(s)." in result.output
+    assert json.loads(path.read_text()) == ["influxdb-d"]
@@ -0,0 +1,235 @@
+"""Tests for the plugin configuration definitions cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect import plugin_cache
+from kafkaconnect.cli import main
+from kafkaconnect.plugin_cache import (
+    CATALOG_TTL,
+    check_locally,
+    validate_config,
+    validate_locally,
+)
+from tests.support import FakeConnect
+
+DEFINITIONS: List[Dict[str, Any]] = [
+    {"name": "topics", "type": "LIST", "required": True},
+    {"name": "tasks.max", "type": "INT", "required": True},
+    {"name": "delete.enabled", "type": "BOOLEAN", "required": False},
+    {
+        "name": "insert.mode",
+        "type": "STRING",
+        "required": False,
+        "recommended_values": ["insert", "upsert"],
+    },
+    {"name": "batch.size", "type": "INT", "required": True},
+]
+for definition in DEFINITIONS:
+    definition.setdefault("default_value", None)
+DEFINITIONS[-1]["default_value"] = "3000"
+
+
+class FakeWorker(FakeConnect):
+    """A Connect worker with plugin definitions."""
+
+    def __init__(
+        self, connect_url: str = "http://connect:8083", version: str = "3.4.0"
+    ) -> None:
+        super().__init__()
+        self.connect_url = connect_url
+        self.version = version
+        self.plugins_: List[Dict[str, str]] = [{"class": "JdbcSink"}]
+
+    def worker(self) -> str:
+        """Get the worker version."""
+        self.calls.append(("worker",))
+        return json.dumps({"version": self.version, "commit": "abcdef"})
+
+    def plugins(self) -> str:
+        """Get the plugins."""
+        self.calls.append(("plugins",))
+        return json.dumps(self.plugins_)
+
+    def validate(self, name: str, connect_config: str) -> str:
+        """Return the plugin definitions."""
+        self.calls.append(("validate", name))
+        configs = [
+            {
+                "definition": d,
+                "value": {"recommended_values": d.get("recommended_values")},
+            }
+            for d in DEFINITIONS
+        ]
+        return json.dumps({"name": name, "error_count": 0, "configs": configs})
+
+    def validate_and_create(self, name: str, connect_config: str) -> str:
+        """Create the connector."""
+        self.calls.append(("validate_and_create", name))
+        return json.dumps({"name": name})
+
+
+def errors(validation: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Return the errors of a validation by configuration name."""
+    return {
+        c["value"]["name"]: c["value"]["errors"]
+        for c in validation["configs"]
+        if c["value"]["errors"]
+    }
+
+
+def test_validate_config() -> None:
+    """Test the required keys, types and recommended values."""
+    validation = validate_config(
+        "JdbcSink",
+        DEFINITIONS,
+        {"tasks.max": "two", "delete.enabled": True, "insert.mode": "merge"},
+    )
+    assert validation["error_count"] == 2
+    assert set(errors(validation)) == {"topics", "tasks.max"}
+    # Recommended values are hints, other values are accepted
+    assert validation["warnings"] == [
+        "insert.mode: merge is not one of the recommended values insert, "
+        "upsert."
+    ]
+
+    validation = validate_config(
+        "JdbcSink", DEFINITIONS, {"topics": "a,b", "tasks.max": 2}
+    )
+    assert validation["error_count"] == 0
+
+
+def test_cache_refresh(tmp_path: Path) -> None:
+    """Test that definitions are fetched once per plugin list."""
+    worker = FakeWorker()
+    fake: Any = worker
+    config = {"connector.class": "JdbcSink", "topics": "a", "tasks.max": 1}
+    for _ in range(2):
+        validate_locally(fake, config, cache_dir=tmp_path)
+    assert worker.calls.count(("validate", "JdbcSink")) == 1
+    # The plugin list is checked once per TTL
+    assert worker.calls.count(("plugins",)) == 1
+
+    # Offline validation does not send requests
+    worker.calls.clear()
+    validation = validate_locally(fake, config, True, cache_dir=tmp_path)
+    assert validation["error_count"] == 0
+    assert worker.calls == []
+
+    # After the TTL, a new plugin invalidates the cache
+    worker.plugins_.append({"class": "S3Sink"})
+    validate_locally(fake, config, cache_dir=tmp_path)
+    assert worker.calls == []
+    (path,) = tmp_path.glob("*/plugins-*.json")
+    expired = time.time() - CATALOG_TTL
+    os.utime(path, (expired, expired))
+    validate_locally(fake, config, cache_dir=tmp_path)
+    assert ("validate", "JdbcSink") in worker.calls
+
+    with pytest.raises(ValueError):
+        validate_locally(
+            fake, {"connector.class": "S3Sink"}, True, cache_dir=tmp_path
+        )
+
+
+def test_cache_per_worker(tmp_path: Path) -> None:
+    """Test that the workers of different clusters have their own catalog."""
+    old: Any = FakeWorker("http://old:8083", "3.4.0")
+    new: Any = FakeWorker("http://new:8083/", "3.6.0")
+    new.plugins_.append({"class": "S3Sink"})
+    config = {"connector.class": "JdbcSink", "topics": "a", "tasks.max": 1}
+    validate_locally(old, config, cache_dir=tmp_path)
+    # The catalog of the old worker is within the TTL, but is not used
+    validate_locally(new, config, cache_dir=tmp_path)
+    assert new.calls == [
+        ("worker",),
+        ("plugins",),
+        ("validate", "JdbcSink"),
+    ]
+    other: Any = FakeWorker("http://other:8083")
+    with pytest.raises(ValueError):
+        validate_locally(other, config, True, cache_dir=tmp_path)
+
+    # The URLs are compared without the trailing slash
+    new.calls.clear()
+    new.connect_url = "http://new:8083"
+    validate_locally(new, config, cache_dir=tmp_path)
+    assert new.calls == []
+    catalogs = [json.loads(p.read_text()) for p in tmp_path.glob("*/*.json")]
+    assert sorted(c["version"] for c in catalogs) == ["3.4.0", "3.6.0"]
+
+
+def test_unwritable_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without a usable cache, only the server-side validation is used."""
+    worker = FakeWorker()
+    monkeypatch.setattr(plugin_cache, "Connect", lambda connect_url: worker)
+    monkeypatch.setattr("kafkaconnect.cli.Connect", lambda *args: worker)
+    (tmp_path / "file").write_text("")
+    monkeypatch.setenv("KAFKA_CONNECT_CACHE_DIR", str(tmp_path / "file" / "c"))
+    path = tmp_path / "sink.json"
+    path.write_text(json.dumps({"connector.class": "JdbcSink"}))
+    runner = CliRunner()
+    result = runner.invoke(main, ["upload", "-n", "sink", str(path)])
+    assert result.exit_code == 0, result.output
+    assert "Warning: could not use the plugin cache" in result.output
+    assert ("validate_and_create", "sink") in worker.calls
+
+    result = runner.invoke(
+        main, ["upload", "-n", "sink", str(path), "--offline"]
+    )
+    assert result.exit_code == 1
+
+
+def test_check_locally_connect(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The local validation uses its own Connect helper to parse responses."""
+    worker = FakeWorker()
+    urls = []
+
+    def connect(connect_url: str) -> FakeWorker:
+        urls.append(connect_url)
+        return worker
+
+    monkeypatch.setattr(plugin_cache, "Connect", connect)
+    monkeypatch.setenv("KAFKA_CONNECT_CACHE_DIR", str(tmp_path))
+    config = {"connector.class": "JdbcSink", "topics": "a", "tasks.max": 1}
+    validation = check_locally("http://connect:8083", config)
+    assert validation is not None
+    assert validation["error_count"] == 0
+    assert urls == ["http://connect:8083"]
+
+
+def test_upload_local_validation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Local errors fail the upload, warnings do not."""
+    worker = FakeWorker()
+    monkeypatch.setattr(plugin_cache, "Connect", lambda connect_url: worker)
+    monkeypatch.setattr("kafkaconnect.cli.Connect", lambda *args: worker)
+    monkeypatch.setenv("KAFKA_CONNECT_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "sink.json"
+    config = {"connector.class": "JdbcSink", "topics": "a", "tasks.max": 1}
+    runner = CliRunner()
+
+    path.write_text(json.dumps({**config, "insert.mode": "merge"}))
+    result = runner.invoke(main, ["upload", "-n", "sink", str(path)])
+    assert result.exit_code == 0
+    assert "Warning: insert.mode: merge" in result.output
+    assert ("validate_and_create", "sink") in worker.calls
+
+    worker.calls.clear()
+    del config["topics"]
+    path.write_text(json.dumps(config))
+    result = runner.invoke(main, ["upload", "-n", "sink", str(path)])
+    assert result.exit_code == 1
+    assert "The configuration has 1 error(s)." in result.output
+    assert ("validate_and_create", "sink") not in worker.calls
@@ -0,0 +1,47 @@
+"""Tests for the profiling options."""
+
+import pstats
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from kafkaconnect import profiling
+from kafkaconnect.cli import main
+from kafkaconnect.profiling import Profiler
+
+
+def test_profile_command(tmp_path: Path) -> None:
+    """Test profiling a command, including the lazy imports."""
+    path = tmp_path / "help.prof"
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["--profile", str(path), "--profile-top", "5", "help", "apply"]
+    )
+    assert result.exit_code == 0
+    assert "top 5 functions by internal time" in result.output
+    assert path.exists()
+
+
+def test_profile_every(tmp_path: Path) -> None:
+    """Test profiling one cycle out of every N cycles."""
+    path = tmp_path / "loop.prof"
+    profiler = Profiler(str(path), every=3)
+    profiler.start()
+    with profiling.cycle():
+        sum(range(1000))
+    # The statistics are written after each sampled cycle, in case the
+    # command is killed
+    assert getattr(pstats.Stats(str(path)), "total_calls") > 0
+    path.unlink()
+    with profiling.cycle():
+        pass
+    assert not path.exists()
+    for _ in range(5):
+        with profiling.cycle():
+            sum(range(1000))
+    summary = profiler.stop()
+    assert summary.startswith("Profiled 3 of 7 cycles.")
+    # Cycles are not profiled once the profiler stopped
+    with profiling.cycle():
+        pass
+    assert profiler.cycles == 7
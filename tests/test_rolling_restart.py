@@ -0,0 +1,92 @@
+"""Tests for the rolling-restart command."""
+
+from typing import Any, List
+
+import pytest
+from click.testing import CliRunner
+
+from kafkaconnect.cli import main
+from kafkaconnect.rolling_restart.rolling import RollingRestart, waves
+from tests.support import FakeConnect
+
+
+class FlakyConnect(FakeConnect):
+    """A Connect fake where some connectors fail after a restart."""
+
+    def __init__(self, failing: List[str]) -> None:
+        super().__init__()
+        self.failing = failing
+
+    def restart(
+        self, name: str, include_tasks: bool = False, only_failed: bool = False
+    ) -> str:
+        """Restart the connector, failing its tasks if it is flaky."""
+        result = super().restart(name, include_tasks, only_failed)
+        if name in self.failing:
+            self.task_states[name] = ["FAILED"]
+        return result
+
+
+def test_waves() -> None:
+    """Test splitting the connectors in waves."""
+    assert waves(["a", "b", "c"], 2) == [["a", "b"], ["c"]]
+    assert waves([], 2) == []
+    with pytest.raises(ValueError):
+        waves(["a"], 0)
+
+
+def test_rolling_restart_stops_at_unhealthy_wave() -> None:
+    """The restart stops after the first wave that is not RUNNING."""
+    connect: Any = FlakyConnect(failing=["c"])
+    for name in "abcde":
+        connect.add(name)
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    rolling = RollingRestart(
+        connect, wave_size=2, timeout=10, sleep=sleep, clock=lambda: now[0]
+    )
+    result = list(rolling.restart(list("abcde")))
+    assert [wave.names for wave in result] == [["a", "b"], ["c", "d"]]
+    assert result[0].healthy
+    assert result[0].elapsed == 0
+    assert not result[1].healthy
+    assert result[1].states == {"c": "MIXED", "d": "RUNNING"}
+    assert result[1].elapsed >= 10
+    restarted = [call[1] for call in connect.calls if call[0] == "restart"]
+    assert sorted(restarted) == ["a", "b", "c", "d"]
+
+
+def test_rolling_restart_cli(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test selecting the connectors and reporting the progress."""
+    connect: Any = FakeConnect()
+    for name in ("sink-a", "sink-b", "sink-c", "source-a"):
+        connect.add(name)
+    connect.add("sink-d", state="PAUSED", tasks=["PAUSED"])
+    connect.add("sink-e", state="FAILED")
+    monkeypatch.setattr(
+        "kafkaconnect.rolling_restart.cli.Connect",
+        lambda connect_url: connect,
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        main, ["rolling-restart", "--match", "sink-", "--wave-size", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "sink-d: PAUSED, skipped" in result.output
+    assert "Restarting 4 connector(s) in 2 wave(s) of up to 2" in result.output
+    assert "Wave 1/2: sink-a, sink-b RUNNING" in result.output
+    assert "Wave 2/2: sink-c, sink-e RUNNING" in result.output
+    assert "Restarted 4 connector(s) in" in result.output
+    restarted = [call[1] for call in connect.calls if call[0] == "restart"]
+    assert "source-a" not in restarted
+    assert "sink-d" not in restarted
+    assert connect.states["sink-d"] == "PAUSED"
+
+    # Named connectors are skipped too
+    result = runner.invoke(main, ["rolling-restart", "sink-d"])
+    assert result.exit_code == 1
+    assert "sink-d: PAUSED, skipped" in result.output
+    assert "No connectors selected." in result.output
@@ -0,0 +1,92 @@
+"""Startup time benchmark for the command-line interface.
+
+The kafkaconnect CLI is called from shell loops and Kubernetes probes, so
+its cold-start time matters. These tests use ``python -X importtime`` to
+measure the import of ``kafkaconnect.cli`` in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+from click.testing import CliRunner
+
+from kafkaconnect.cli import LazyGroup, create, main
+
+# Import time budget for kafkaconnect.cli on top of click, in microseconds.
+# Importing click takes about 20 ms and the CLI modules about 15 ms more.
+# Importing the create subcommands eagerly brings in confluent_kafka and
+# requests and takes about 200 ms, and the helpers of the pause, resume and
+# upload commands about 30 ms.
+IMPORT_TIME_BUDGET = 25_000
+
+# Modules that must not be imported when the CLI starts.
+LAZY_MODULES = (
+    "confluent_kafka",
+    "requests",
+    "kafkaconnect.topic_names_set",
+    "kafkaconnect.influxdb_sink.cli",
+    "kafkaconnect.s3_sink.cli",
+    "kafkaconnect.jdbc_sink.cli",
+    "kafkaconnect.mirrormaker2.cli",
+    "concurrent.futures",
+    "kafkaconnect.bulk",
+    "kafkaconnect.wait",
+    "kafkaconnect.snapshot",
+    "kafkaconnect.plugin_cache",
+    "kafkaconnect.apply.plan",
+)
+
+
+def importtime(module: str) -> Dict[str, int]:
+    """Return the cumulative import time in us of each imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_lazy_imports() -> None:
+    """Test that heavy dependencies are not imported at startup."""
+    times = importtime("kafkaconnect.cli")
+    for module in LAZY_MODULES:
+        assert module not in times, f"{module} imported at startup"
+
+
+def test_startup_time_budget() -> None:
+    """Fail if the CLI cold-start time regresses.
+
+    The time is relative to the import of click in the same run, so that it
+    does not depend on the speed of the test machine, and the best of a few
+    runs is used to reduce noise.
+    """
+    runs = [importtime("kafkaconnect.cli") for _ in range(5)]
+    best = min(t["kafkaconnect.cli"] - t["click"] for t in runs)
+    assert best < IMPORT_TIME_BUDGET, (
+        f"Importing kafkaconnect.cli took {best} us on top of click, "
+        f"budget is {IMPORT_TIME_BUDGET} us."
+    )
+
+
+def test_lazy_subcommands() -> None:
+    """Test that every lazy subcommand can be loaded and shows help."""
+    runner = CliRunner()
+    for group, path in ((main, []), (create, ["create"])):
+        assert isinstance(group, LazyGroup)
+        for name in group.lazy_subcommands:
+            result = runner.invoke(main, [*path, name, "--help"])
+            assert result.exit_code == 0, result.output
+
+    result = runner.invoke(main, ["create", "--help"])
+    assert result.exit_code == 0
+    assert "influxdb-sink" in result.output
+    assert "mirrormaker2" in result.output
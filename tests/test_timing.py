@@ -0,0 +1,78 @@
+"""Tests for the cycle timing records and summary."""
+
+import io
+import json
+
+from click.testing import CliRunner
+
+from kafkaconnect.cli import main
+from kafkaconnect.timing.summary import percentile, summarize
+from kafkaconnect.timing.timer import CycleTimer
+
+
+class Clock:
+    """A manual clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_cycle_timer() -> None:
+    """Test timing the phases of a cycle."""
+    output = io.StringIO()
+    clock = Clock()
+    timer = CycleTimer(output, clock)
+    timer.start()
+    with timer.phase("list_topics"):
+        clock.now += 0.5
+    for _ in range(2):
+        with timer.phase("put"):
+            clock.now += 0.25
+    record = timer.end(topics=3)
+    assert record is not None
+    assert record["phases"] == {"list_topics": 0.5, "put": 0.5}
+    assert record["total"] == 1.0
+    assert json.loads(output.getvalue())["topics"] == 3
+
+    # Timing is disabled without output
+    assert CycleTimer(None).end() is None
+
+
+def test_summarize() -> None:
+    """Test the percentiles of the phases."""
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
+    lines = [
+        json.dumps({"total": i / 100, "phases": {"filter": i / 1000}})
+        for i in range(1, 101)
+    ]
+    lines.append(json.dumps({"total": 2.0, "phases": {"put": 1.5}}))
+    malformed = [
+        "not json",
+        "[]",
+        json.dumps({"phases": {"put": 1.0}}),
+        json.dumps({"total": 1.0}),
+        json.dumps({"total": 1.0, "phases": {"put": "slow"}}),
+    ]
+    summary = summarize(lines + malformed + ["\n"])
+    assert summary["cycles"] == 101
+    assert summary["skipped"] == 5
+    assert summary["phases"]["filter"]["p95"] == 0.095
+    assert summary["phases"]["put"]["count"] == 1
+    assert summary["phases"]["total"]["max"] == 2.0
+
+
+def test_timing_summary_command() -> None:
+    """Test the timing-summary command."""
+    runner = CliRunner()
+    record = json.dumps({"total": 1.0, "phases": {"put": 0.5}})
+    result = runner.invoke(main, ["timing-summary", "-"], input=record)
+    assert result.exit_code == 0
+    assert json.loads(result.output)["phases"]["put"]["p50"] == 0.5
+
+    result = runner.invoke(main, ["timing-summary", "-"], input="")
+    assert result.exit_code != 0
@@ -0,0 +1,39 @@
+"""Tests for the compact topic name store."""
+
+from kafkaconnect.topic_store import TopicStore
+
+
+def test_sorted_unique_names() -> None:
+    """Names are sorted and deduplicated, and the store is a set."""
+    store = TopicStore(["b", "a", "c", "a"])
+    assert list(store) == ["a", "b", "c"]
+    assert len(store) == 3
+    assert "b" in store
+    assert "d" not in store
+    assert store == {"a", "b", "c"}
+    assert store == TopicStore(["c", "b", "a"])
+    assert store - {"a"} == TopicStore(["b", "c"])
+    assert store & {"a", "d"} == {"a"}
+    assert TopicStore() == set()
+
+
+def test_difference() -> None:
+    """The difference is a merge of the sorted names."""
+    current = TopicStore(["a", "b", "d", "e"])
+    previous = TopicStore(["b", "c", "e"])
+    assert current.difference(previous) == ["a", "d"]
+    assert previous.difference(current) == ["c"]
+    assert current.difference(TopicStore()) == ["a", "b", "d", "e"]
+    assert current - previous == TopicStore(["a", "d"])
+
+
+def test_shared_strings() -> None:
+    """Names stored with the previous store reuse its strings."""
+    previous = TopicStore(["".join(["topic", str(i)]) for i in range(3)])
+    listing = ["".join(["topic", str(i)]) for i in range(4)]
+    store = TopicStore(listing, previous=previous)
+    for old, new in zip(previous, store):
+        assert new is old
+    assert store.filter(lambda name: name.endswith("3")) == {"topic3"}
+    (name,) = store.filter(lambda name: name.endswith("0"))
+    assert name is next(iter(previous))
@@ -0,0 +1,148 @@
+"""Tests for the throughput-based connector tuning."""
+
+from typing import Any
+
+import pytest
+
+from kafkaconnect.jdbc_sink.tuning import SinkSample, sample_sink, tune_batch
+from kafkaconnect.metadata_cache import TopicMetadataCache
+from kafkaconnect.s3_sink.tuning import tune_flush
+from kafkaconnect.throughput import (
+    connector_topics,
+    partition_rates,
+    topic_rates,
+)
+from tests.support import FakeAdminClient
+
+
+def test_partition_rates() -> None:
+    """The rates are the end offset deltas over the sampling window."""
+    client: Any = FakeAdminClient({("a", 0): 100, ("a", 1): 0, ("b", 0): 50})
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+        client.offsets[("a", 0)] += 200
+        client.offsets[("a", 1)] += 100
+
+    rates = partition_rates(
+        client, ["a", "b", "gone"], 10, sleep=sleep, clock=lambda: now[0]
+    )
+    assert rates == {("a", 0): 20.0, ("a", 1): 10.0, ("b", 0): 0.0}
+    assert topic_rates(rates) == {"a": 30.0, "b": 0.0}
+    assert client.calls.count("describe_topics") == 1
+
+
+def test_connector_topics() -> None:
+    """Test the topics from the topics and topics.regex settings."""
+    cache = TopicMetadataCache(lambda: ["lsst.ab", "lsst.a"], ttl=60)
+    assert connector_topics({"topics": "t1, t2"}, cache) == ["t1", "t2"]
+    assert connector_topics({"topics.regex": "lsst.a"}, cache) == ["lsst.a"]
+    assert connector_topics({}, cache) == []
+
+
+def test_tune_flush() -> None:
+    """Busy partitions flush by size, quiet ones by the scheduled rotation."""
+    rates = {("busy", 0): 100.0, ("busy", 1): 100.0, ("quiet", 0): 0.1}
+    tuning = tune_flush(
+        rates, target_object_size=1024000, record_size=1024, max_latency=600
+    )
+    assert tuning.settings == {
+        "flush.size": "1000",
+        "rotate.schedule.interval.ms": "600000",
+    }
+    assert tuning.topics["busy"]["latency"] == 10.0
+    assert tuning.topics["busy"]["object_size"] == 1024000
+    assert tuning.topics["quiet"]["object_size"] == 61440
+    assert "quiet" in tuning.reasons[-1]
+
+    # The busiest partition cannot fill an object within the latency, the
+    # scheduled rotation writes it
+    tuning = tune_flush(
+        {("t", 0): 1.0},
+        target_object_size=10240,
+        record_size=1,
+        max_latency=60,
+    )
+    assert tuning.settings == {
+        "flush.size": "10240",
+        "rotate.schedule.interval.ms": "60000",
+    }
+    assert tuning.topics["t"]["object_size"] == 60
+
+    # Idle topics give no basis for a recommendation
+    with pytest.raises(ValueError):
+        tune_flush(
+            {("t", 0): 0.0, ("t", 1): 0.0},
+            target_object_size=10240,
+            record_size=1,
+            max_latency=60,
+        )
+
+
+def test_sample_sink() -> None:
+    """The lag and the rates come from the end and committed offsets."""
+    client: Any = FakeAdminClient({("t", 0): 1000, ("t", 1): 500})
+    client.committed["connect-sink"] = {("t", 0): 900}
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+        client.offsets[("t", 0)] += 300
+        client.committed["connect-sink"][("t", 0)] += 100
+
+    sample = sample_sink(
+        client, "sink", ["t"], 10, sleep=sleep, clock=lambda: now[0]
+    )
+    assert sample == SinkSample(
+        partitions=2, rate=30.0, consumed=10.0, lag=800, lag_rate=20.0
+    )
+
+
+def test_sample_sink_truncated() -> None:
+    """Partitions without committed offsets start at their start offset."""
+    client: Any = FakeAdminClient({("t", 0): 1000, ("t", 1): 500})
+    client.committed["connect-sink"] = {("t", 0): 900}
+    client.start[("t", 1)] = 400
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+        client.offsets[("t", 0)] += 300
+        client.committed["connect-sink"][("t", 0)] += 100
+        client.start[("t", 1)] += 50
+
+    sample = sample_sink(
+        client, "sink", ["t"], 10, sleep=sleep, clock=lambda: now[0]
+    )
+    assert sample == SinkSample(
+        partitions=2, rate=30.0, consumed=10.0, lag=350, lag_rate=15.0
+    )
+
+
+def test_tune_batch() -> None:
+    """Tasks are scaled to drain the lag, batches to the per-task rate."""
+    sample = SinkSample(
+        partitions=8, rate=30.0, consumed=10.0, lag=6000, lag_rate=20.0
+    )
+    tuning = tune_batch(sample, tasks=1, catch_up=600, batch_interval=10)
+    # 30 msg/s plus 6000 messages in 600 s at 10 msg/s per task
+    assert tuning.settings == {
+        "tasks.max": "4",
+        "batch.size": "100",
+        "consumer.override.max.poll.records": "100",
+    }
+    assert tuning.reasons[2].startswith("tasks.max=4")
+
+    # At most one task per partition
+    sample.partitions = 2
+    tuning = tune_batch(sample, tasks=1, catch_up=600, batch_interval=100)
+    assert tuning.settings["tasks.max"] == "2"
+    assert tuning.settings["batch.size"] == "2000"
+    assert "More partitions" in tuning.reasons[3]
+
+    caught_up = SinkSample(
+        partitions=2, rate=30.0, consumed=30.0, lag=0, lag_rate=0.0
+    )
+    tuning = tune_batch(caught_up, tasks=3, catch_up=600, batch_interval=1)
+    assert tuning.settings["tasks.max"] == "3"
@@ -0,0 +1,52 @@
+"""Tests for the wait module."""
+
+from typing import Any, List
+
+from kafkaconnect.wait import connector_state, fetch_statuses, wait_for_state
+from tests.support import FakeConnect
+
+
+def test_connector_state() -> None:
+    """Test summarizing the connector and tasks states."""
+    status = {
+        "connector": {"state": "RUNNING"},
+        "tasks": [{"state": "RUNNING"}, {"state": "FAILED"}],
+    }
+    assert connector_state(status) == "MIXED"
+    status["tasks"] = [{"state": "RUNNING"}]
+    assert connector_state(status) == "RUNNING"
+    assert connector_state(None) == "UNKNOWN"
+
+
+def test_fetch_statuses() -> None:
+    """Test fetching the status of connectors concurrently."""
+    connect = FakeConnect()
+    connect.add("foo")
+    fake: Any = connect
+    statuses = fetch_statuses(fake, ["foo", "bar"])
+    assert statuses["foo"] is not None
+    assert statuses["bar"] is None
+
+
+def test_wait_for_state() -> None:
+    """Test waiting until the connectors are running."""
+    connect = FakeConnect()
+    connect.add("foo")
+    connect.add("bar", state="UNASSIGNED", tasks=["UNASSIGNED"])
+    fake: Any = connect
+    sleeps: List[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        connect.states["bar"] = "RUNNING"
+        connect.task_states["bar"] = ["RUNNING"]
+
+    states = wait_for_state(fake, ["foo", "bar"], "RUNNING", 10, sleep=sleep)
+    assert states == {"foo": "RUNNING", "bar": "RUNNING"}
+    assert len(sleeps) == 1
+    # Connectors that reached the state are not polled again
+    assert connect.calls.count(("status", "foo")) == 1
+
+    connect.states["bar"] = "FAILED"
+    states = wait_for_state(fake, ["bar"], "RUNNING", 0, sleep=sleep)
+    assert states == {"bar": "MIXED"}
@@ -0,0 +1,69 @@
+"""Tests for the watch command."""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from kafkaconnect.watch.events import StatusTracker
+
+
+def status(connector: str, *tasks: str, trace: str = "") -> Dict[str, Any]:
+    """Return a connector status like the Connect API."""
+    return {
+        "connector": {"state": connector, "worker_id": "w1"},
+        "tasks": [
+            {"id": i, "state": s, "worker_id": "w1", "trace": trace}
+            for i, s in enumerate(tasks)
+        ],
+    }
+
+
+def test_transitions() -> None:
+    """Test that only the state transitions are reported."""
+    tracker = StatusTracker()
+    events = tracker.update({"foo": status("RUNNING", "RUNNING")})
+    assert [(e.task, e.previous, e.state) for e in events] == [
+        (None, None, "RUNNING"),
+        (0, None, "RUNNING"),
+    ]
+
+    assert tracker.update({"foo": status("RUNNING", "RUNNING")}) == []
+
+    timestamp = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    events = tracker.update(
+        {"foo": status("RUNNING", "FAILED", trace="Error\nat line")},
+        timestamp,
+    )
+    assert len(events) == 1
+    assert json.loads(events[0].asjson()) == {
+        "timestamp": "2023-01-01T00:00:00+00:00",
+        "connector": "foo",
+        "task": 0,
+        "previous": "RUNNING",
+        "state": "FAILED",
+        "worker_id": "w1",
+        "trace": "Error",
+    }
+
+
+def test_no_initial() -> None:
+    """Test skipping the states observed for the first time."""
+    tracker = StatusTracker(initial=False)
+    assert tracker.update({"foo": status("RUNNING")}) == []
+    events = tracker.update({"foo": status("PAUSED")})
+    assert [(e.previous, e.state) for e in events] == [("RUNNING", "PAUSED")]
+
+
+def test_deleted() -> None:
+    """Test that deleted connectors and tasks are reported and forgotten."""
+    tracker = StatusTracker()
+    tracker.update({"foo": status("RUNNING", "RUNNING", "RUNNING")})
+    events = tracker.update({"foo": status("RUNNING", "RUNNING")})
+    assert [(e.task, e.state) for e in events] == [(1, "DELETED")]
+
+    events = tracker.update({})
+    assert [(e.task, e.state) for e in events] == [
+        (None, "DELETED"),
+        (0, "DELETED"),
+    ]
+    assert tracker._states == {}
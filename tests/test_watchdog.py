@@ -0,0 +1,101 @@
+"""Tests for the watchdog command."""
+
+import json
+from typing import Any
+
+from kafkaconnect.watchdog.policy import Decision, RestartPolicy
+from kafkaconnect.watchdog.watchdog import Watchdog
+from tests.support import FakeConnect
+
+
+class Clock:
+    """A manual clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_policy(clock: Clock, budget: int = 10) -> RestartPolicy:
+    """Return a restart policy for the tests."""
+    return RestartPolicy(
+        backoff_initial=10,
+        backoff_max=40,
+        max_attempts=3,
+        budget=budget,
+        budget_window=100,
+        clock=clock,
+    )
+
+
+def test_backoff_and_give_up() -> None:
+    """Test the exponential backoff and giving up on a task."""
+    clock = Clock()
+    policy = make_policy(clock)
+    assert policy.failed("t") == Decision.RESTART
+    clock.now = 5
+    assert policy.failed("t") == Decision.BACKOFF
+    clock.now = 10
+    assert policy.failed("t") == Decision.RESTART
+    # The second delay is 20 s
+    clock.now = 25
+    assert policy.failed("t") == Decision.BACKOFF
+    clock.now = 30
+    assert policy.failed("t") == Decision.RESTART
+    clock.now = 1000
+    assert policy.failed("t") == Decision.GIVE_UP
+
+
+def test_stable_task_is_reset() -> None:
+    """Test that a task running long enough is forgiven."""
+    clock = Clock()
+    policy = make_policy(clock)
+    policy.failed("t")
+    policy.running("t")
+    clock.now = 39
+    policy.running("t")
+    assert list(policy.tracked) == ["t"]
+    clock.now = 40
+    policy.running("t")
+    assert list(policy.tracked) == []
+
+
+def test_budget() -> None:
+    """Test the cluster-wide restart budget."""
+    clock = Clock()
+    policy = make_policy(clock, budget=2)
+    assert policy.failed("t1") == Decision.RESTART
+    assert policy.failed("t2") == Decision.RESTART
+    assert policy.failed("t3") == Decision.BUDGET
+    clock.now = 100
+    assert policy.failed("t3") == Decision.RESTART
+
+
+def test_watchdog_restarts_failed_tasks() -> None:
+    """Test that only the failed tasks are restarted."""
+    clock = Clock()
+    connect = FakeConnect()
+    connect.add("foo", tasks=["RUNNING", "FAILED"])
+    connect.add("bar", state="FAILED", tasks=[])
+    fake: Any = connect
+    dog = Watchdog(fake, make_policy(clock))
+
+    statuses = {
+        name: json.loads(connect.status(name)) for name in connect.configs
+    }
+    events = dog.check(statuses)
+    assert [(e["connector"], e["task"], e["decision"]) for e in events] == [
+        ("foo", 1, "restart"),
+        ("bar", None, "restart"),
+    ]
+    assert ("restart_task", "foo", 1) in connect.calls
+    assert ("restart", "bar") in connect.calls
+    assert connect.task_states["foo"] == ["RUNNING", "RUNNING"]
+
+    # The backoff decision is reported once
+    clock.now = 1
+    assert [e["decision"] for e in dog.check(statuses)] == ["backoff"] * 2
+    assert dog.check(statuses) == []